@@ -0,0 +1,359 @@
+import re
+import sqlite3
+from collections import defaultdict
+from job_tracker.database import get_db, read_transaction, transaction
+
+# Aggregation engine behind the `stats` dashboard.
+# Every job is reduced to a few ROW_VALUES, from which it contributes a vector of METRICS to one group per
+# DIMENSION. All dashboard numbers are derived from the per-group sums, so the whole dashboard is one query.
+# ROW_VALUES are templates over a jobs row: {r} is the row prefix ("" in queries, "NEW." / "OLD." in triggers).
+# METRICS and DIMENSIONS are plain expressions over the ROW_VALUES columns.
+# The unfiltered dashboard reads the same per-group sums from ROLLUP_TABLE, kept current by triggers on jobs.
+
+INTERVIEW_STATUSES = ("interviewing", "offered", "accepted", "refused")
+OFFER_STATUSES = ("offered", "accepted", "refused")
+TERMINAL_STATUSES = ("ghosted", "rejected", "offered", "accepted", "refused")
+
+FIT_LABELS = {5: "Excellent (5)", 4: "Good (4)", 3: "Average (3)", 2: "Low (2)", 1: "Poor (1)"}
+
+
+def _one_of(expr: str, values) -> str:
+    """`expr IN (values)` spelled as equality tests. A literal IN list builds an ephemeral table per trigger firing."""
+    return "(" + " OR ".join(f"{expr} = {v!r}" for v in values) + ")"
+
+
+def _julianday(col: str) -> str:
+    """
+    julianday() of a YYYY-MM-DD[ HH:MM] column, NULL for anything else (like _parse_dt returning None).
+    SQLite accepts impossible days like 2024-02-30 and rolls them over, so the date must survive a round trip.
+    """
+    return f"(CASE WHEN date(julianday({col})) = substr({col}, 1, 10) THEN julianday({col}) END)"
+
+
+def _truthy(col: str) -> str:
+    return f"COALESCE({col}, '') != ''"
+
+
+def _days_between(start: str, end: str) -> str:
+    """Whole days from start to end, NULL when either side is missing or the delta is negative."""
+    return f"(CASE WHEN {end} - {start} >= 0 THEN CAST({end} - {start} AS INTEGER) END)"
+
+
+# Never NULL, so the status tests below are plain booleans
+_STATUS = "COALESCE({r}status, '')"
+
+ROW_VALUES = {
+    "status": _STATUS,
+    "company": "NULLIF({r}company_name, '')",
+    "source": "NULLIF({r}source, '')",
+    "level": "NULLIF({r}level, '')",
+    "arrangement": "NULLIF({r}arrangement, '')",
+    "type": "NULLIF({r}type, '')",
+    "location": "NULLIF({r}location, '')",
+    "fit": "{r}fit",
+    "rating": "{r}rating",
+    # Improved interview detection: includes anyone who reached interview stage even if later rejected/refused
+    "interviewed": f"({_one_of(_STATUS, INTERVIEW_STATUSES)} OR {_truthy('{r}interview_time')} OR {_truthy('{r}interview_response_date')})",
+    "responded": f"({_truthy('{r}application_response_date')} OR {_truthy('{r}interview_response_date')})",
+    "applied_day": _julianday("{r}date_applied"),
+    "app_response_days": _days_between(_julianday("{r}date_applied"), _julianday("{r}application_response_date")),
+    "interview_response_days": _days_between(_julianday("{r}interview_time"), _julianday("{r}interview_response_date")),
+}
+
+# Response-time metrics are only defined for some rows: (days column, condition)
+_RESPONSE_TIMES = {
+    # App -> Rejection (Only if not interviewed and rejected)
+    "app_rej": ("app_response_days", "NOT interviewed AND status = 'rejected'"),
+    # App -> Interview (If interviewed). Identify "response" as the invite date.
+    "app_int": ("app_response_days", "interviewed"),
+    # Interview -> Rejection
+    "int_rej": ("interview_response_days", "status = 'rejected'"),
+    # Interview -> Offer (Offered/Accepted/Refused)
+    "int_offer": ("interview_response_days", _one_of("status", OFFER_STATUSES)),
+}
+
+METRICS = {
+    "n": "1",
+    "interviewed": "interviewed",
+    "awaiting": "(status = 'applied' AND NOT responded)",
+    "rejected_after_interview": "(interviewed AND status = 'rejected')",
+    # In the interview stage but hasn't reached an offer or rejection
+    "interviewing_now": f"(interviewed AND {_one_of('status', ('applied', 'interviewing'))})",
+    "fit_sum": "COALESCE(fit, 0)",
+    "fit_count": "(fit IS NOT NULL)",
+    "fit_high": "COALESCE(fit >= 4, 0)",
+    "rating_sum": "COALESCE(rating, 0)",
+    "rating_count": "(rating IS NOT NULL)",
+    "rating_high": "COALESCE(rating >= 4, 0)",
+}
+for _name, (_days, _condition) in _RESPONSE_TIMES.items():
+    METRICS[f"{_name}_days"] = f"COALESCE(CASE WHEN {_condition} THEN {_days} END, 0)"
+    METRICS[f"{_name}_count"] = f"(CASE WHEN {_condition} THEN {_days} END IS NOT NULL)"
+
+# Group key per dimension. NULL keys are left out of the dimension (like the `if j[field]` checks they replace).
+DIMENSIONS = {
+    "all": "''",
+    "status": "status",
+    "company": "company",
+    "source": "source",
+    "level": "level",
+    "arrangement": "arrangement",
+    "type": "type",
+    "location": "location",
+    "interviewed": "(CASE WHEN interviewed THEN '1' ELSE '0' END)",
+    "fit": f"(CASE WHEN {_one_of('fit', FIT_LABELS)} THEN CAST(fit AS TEXT) END)",
+    # Week start (Monday) as YEAR-WEEK
+    "week": "strftime('%Y-%W', date(applied_day, '-6 days', 'weekday 1'))",
+    "month": "strftime('%Y-%m', applied_day)",
+}
+
+# Metrics each dimension's breakdown actually reads; the rest are reported as 0.
+DIMENSION_METRICS = {
+    "all": tuple(METRICS),
+    "interviewed": ("n", "fit_sum", "fit_count", "fit_high", "rating_sum", "rating_count", "rating_high"),
+    "fit": ("n", "interviewed"),
+}
+
+
+def row_values_query(prefix: str = "") -> str:
+    """SELECT list of the ROW_VALUES for a jobs row under `prefix`."""
+    return ", ".join(f"{expr.format(r=prefix)} AS {name}" for name, expr in ROW_VALUES.items())
+
+
+def source_columns() -> list:
+    """The jobs columns the ROW_VALUES read, i.e. the updates that can move a job between groups."""
+    return list(dict.fromkeys(re.findall(r"\{r\}(\w+)", " ".join(ROW_VALUES.values()))))
+
+
+# AS MATERIALIZED needs SQLite 3.35+. Older builds decide on their own, which may re-run the row expressions per dimension.
+MATERIALIZED_CTE = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+def aggregate_query(where_clause: str = None) -> str:
+    """One statement returning a (dim, key, *METRICS) row per non-empty group of every dimension."""
+    # Materialized so the row expressions run once, not once per dimension
+    query = f"WITH j AS {'MATERIALIZED ' if MATERIALIZED_CTE else ''}(SELECT {row_values_query()} FROM jobs"
+    if where_clause:
+        query += f" WHERE {where_clause}"
+    query += ")\n"
+
+    selects = []
+    for dim, key in DIMENSIONS.items():
+        needed = DIMENSION_METRICS.get(dim, ("n",))
+        sums = ", ".join(f"SUM({expr})" if name in needed else "0" for name, expr in METRICS.items())
+        selects.append(f"SELECT '{dim}', {key} AS k, {sums} FROM j GROUP BY k HAVING k IS NOT NULL")
+    return query + "\nUNION ALL\n".join(selects)
+
+
+def _to_groups(rows) -> dict:
+    groups = defaultdict(dict)
+    for row in rows:
+        dim, key, *values = tuple(row)
+        groups[dim][key] = dict(zip(METRICS, values))
+    return groups
+
+
+def aggregate(where_clause: str = None, params: list = None) -> dict:
+    """Runs the aggregation over the jobs table and returns {dim: {key: {metric: value}}}."""
+    with get_db() as conn:
+        return _to_groups(conn.execute(aggregate_query(where_clause), params or []))
+
+
+# Rollup of the unfiltered aggregation: one row per (dim, key) group holding the METRICS sums.
+ROLLUP_TABLE = "stats_rollup"
+ROLLUP_TRIGGERS = ("stats_rollup_insert", "stats_rollup_update", "stats_rollup_delete")
+
+
+def _inline_row_values(expr: str, prefix: str) -> str:
+    """
+    Substitutes the ROW_VALUES columns in a METRICS/DIMENSIONS expression with their definitions under `prefix`.
+    Triggers can't use WITH, and a FROM subquery would be materialized on every firing.
+    """
+    pattern = r"\b(" + "|".join(ROW_VALUES) + r")\b"
+    return re.sub(pattern, lambda m: f"({ROW_VALUES[m.group(1)].format(r=prefix)})", expr)
+
+
+def _rollup_delta(prefix: str, sign: str) -> str:
+    """Upserts adding (sign "+") or removing (sign "-") the row under `prefix` to/from its groups."""
+    statements = []
+    for dim, key in DIMENSIONS.items():
+        needed = DIMENSION_METRICS.get(dim, ("n",))
+        values = ", ".join(_inline_row_values(METRICS[name], prefix) for name in needed)
+        updates = ", ".join(f"{name} = {name} {sign} excluded.{name}" for name in needed)
+        statements.append(
+            f"""
+            INSERT INTO {ROLLUP_TABLE} (dim, key, {", ".join(needed)})
+            SELECT '{dim}', {_inline_row_values(key, prefix)} AS k, {values} WHERE k IS NOT NULL
+            ON CONFLICT (dim, key) DO UPDATE SET {updates};
+            """
+        )
+    return "".join(statements)
+
+
+def create_rollup(conn: sqlite3.Connection):
+    """(Re)creates the rollup table and its triggers from the current definitions and fills it from jobs."""
+    for trigger in ROLLUP_TRIGGERS:
+        conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    conn.execute(f"DROP TABLE IF EXISTS {ROLLUP_TABLE}")
+
+    metric_columns = ", ".join(f"{name} INTEGER NOT NULL DEFAULT 0" for name in METRICS)
+    conn.execute(f"CREATE TABLE {ROLLUP_TABLE} (dim TEXT NOT NULL, key TEXT NOT NULL, {metric_columns}, PRIMARY KEY (dim, key)) WITHOUT ROWID")
+    conn.execute(f"INSERT INTO {ROLLUP_TABLE} (dim, key, {', '.join(METRICS)}) {aggregate_query()}")
+    # Lets the prune below find emptied groups without scanning the rollup
+    conn.execute(f"CREATE INDEX {ROLLUP_TABLE}_empty ON {ROLLUP_TABLE} (dim) WHERE n = 0")
+
+    # Removal runs before addition, so a job that stays in its group never leaves it empty
+    add, remove = _rollup_delta("NEW.", "+"), _rollup_delta("OLD.", "-")
+    prune = f"DELETE FROM {ROLLUP_TABLE} WHERE n = 0;"
+    insert, update, delete = ROLLUP_TRIGGERS
+    conn.execute(f"CREATE TRIGGER {insert} AFTER INSERT ON jobs BEGIN {add} END")
+    conn.execute(f"CREATE TRIGGER {update} AFTER UPDATE OF {', '.join(source_columns())} ON jobs BEGIN {remove} {add} {prune} END")
+    conn.execute(f"CREATE TRIGGER {delete} AFTER DELETE ON jobs BEGIN {remove} {prune} END")
+
+
+def add_to_rollup(conn: sqlite3.Connection, after_id: int):
+    """Adds every job with id > after_id to the rollup in one aggregation (the set-based insert trigger)."""
+    updates = ", ".join(f"{name} = {name} + excluded.{name}" for name in METRICS)
+    conn.execute(
+        f"INSERT INTO {ROLLUP_TABLE} (dim, key, {', '.join(METRICS)}) SELECT * FROM ({aggregate_query('id > ?')}) WHERE true"
+        f" ON CONFLICT (dim, key) DO UPDATE SET {updates}",
+        (after_id,),
+    )
+
+
+def read_rollup() -> dict:
+    """The unfiltered aggregation as maintained in the rollup table, in the shape aggregate() returns."""
+    with get_db() as conn:
+        return _to_groups(conn.execute(f"SELECT dim, key, {', '.join(METRICS)} FROM {ROLLUP_TABLE}"))
+
+
+def rebuild_rollup():
+    """Recomputes the rollup table from scratch."""
+    with transaction() as conn:
+        create_rollup(conn)
+
+
+def check_rollup() -> list:
+    """Compares the rollup against a full aggregation. Returns (dim, key, metric, rollup, actual) for every mismatch."""
+    with read_transaction():
+        # One snapshot for both reads
+        stored, actual = read_rollup(), aggregate()
+
+    mismatches = []
+    for dim in DIMENSIONS:
+        for key in sorted(stored.get(dim, {}).keys() | actual.get(dim, {}).keys()):
+            stored_metrics = stored.get(dim, {}).get(key, {})
+            actual_metrics = actual.get(dim, {}).get(key, {})
+            for metric in METRICS:
+                if stored_metrics.get(metric, 0) != actual_metrics.get(metric, 0):
+                    mismatches.append((dim, key, metric, stored_metrics.get(metric, 0), actual_metrics.get(metric, 0)))
+    return mismatches
+
+
+def _ranked(groups: dict) -> list:
+    """(key, count) pairs, most common first, ties by key."""
+    return sorted(((key, m["n"]) for key, m in groups.items()), key=lambda kv: (-kv[1], kv[0]))
+
+
+def _quality(m: dict) -> dict:
+    if not m:
+        return {"count": 0, "avg_fit": 0, "avg_rating": 0, "top_fit": 0, "top_rating": 0}
+    fit_count = m["fit_count"]
+    rating_count = m["rating_count"]
+    return {
+        "count": m["n"],
+        "avg_fit": m["fit_sum"] / fit_count if fit_count else 0,
+        "avg_rating": m["rating_sum"] / rating_count if rating_count else 0,
+        "top_fit": m["fit_high"] / fit_count * 100 if fit_count else 0,
+        "top_rating": m["rating_high"] / rating_count * 100 if rating_count else 0,
+    }
+
+
+def summarize(groups: dict) -> dict:
+    """Derives every number the dashboard prints from the per-group sums."""
+    totals = groups.get("all", {}).get("")
+    if not totals:
+        return {"total_count": 0}
+
+    total_count = totals["n"]
+    status = {key: m["n"] for key, m in groups.get("status", {}).items()}
+
+    interviews = totals["interviewed"]
+    offers = sum(status.get(s, 0) for s in OFFER_STATUSES)
+    rejections = status.get("rejected", 0)
+    rejections_post_interview = totals["rejected_after_interview"]
+    accepted = status.get("accepted", 0)
+    refused = status.get("refused", 0)
+    ghosted = status.get("ghosted", 0)
+    awaiting = totals["awaiting"]
+    currently_interviewing = totals["interviewing_now"]
+    pending_offers = status.get("offered", 0)
+    terminal_settled_count = sum(status.get(s, 0) for s in TERMINAL_STATUSES)
+
+    # Conversion Rates (Calculated using "settled" applications only)
+    # A job is settled for a specific stage if it has a definitive outcome for that stage.
+    # 1. App -> Interview: Settled if they responded (Total minus those still waiting for first word).
+    settled_apps_count = total_count - awaiting
+    # 2. Int -> Offer: Settled if interview process finished (Interviewed minus those still interviewing).
+    settled_interviews_count = interviews - currently_interviewing
+    # 3. Offer -> Accepted: Settled if offer decision made (Offered minus those still pending).
+    settled_offers_count = offers - pending_offers
+
+    def rate(part, whole):
+        return (part / whole * 100) if whole > 0 else 0
+
+    def avg_days(name):
+        count = totals[f"{name}_count"]
+        return totals[f"{name}_days"] / count if count else None
+
+    fit_groups = groups.get("fit", {})
+
+    return {
+        "total_count": total_count,
+        "awaiting": awaiting,
+        "ghosted": ghosted,
+        "rejections": rejections,
+        "rejections_pre_interview": rejections - rejections_post_interview,
+        "rejections_post_interview": rejections_post_interview,
+        "interviews": interviews,
+        "offers": offers,
+        "accepted": accepted,
+        "refused": refused,
+        "awaiting_rate": rate(awaiting, total_count),
+        "ghosted_rate": rate(ghosted, total_count),
+        "rejection_rate": rate(rejections, total_count),
+        "total_interview_rate": rate(interviews, total_count),
+        "total_offer_rate": rate(offers, total_count),
+        "app_to_interview_rate": rate(interviews, settled_apps_count),
+        "interview_to_offer_rate": rate(offers, settled_interviews_count),
+        "offer_to_acceptance_rate": rate(accepted, settled_offers_count),
+        # 4. Overall: Settled if the whole process reached a terminal or decisive status.
+        "overall_success_rate": rate(accepted, terminal_settled_count),
+        "avg_app_rej": avg_days("app_rej"),
+        "avg_app_int": avg_days("app_int"),
+        "avg_int_rej": avg_days("int_rej"),
+        "avg_int_offer": avg_days("int_offer"),
+        "status_counts": _ranked(groups.get("status", {})),
+        "company_counts": _ranked(groups.get("company", {})),
+        "source_counts": _ranked(groups.get("source", {})),
+        "level_counts": _ranked(groups.get("level", {})),
+        "arrangement_counts": _ranked(groups.get("arrangement", {})),
+        "type_counts": _ranked(groups.get("type", {})),
+        "location_counts": _ranked(groups.get("location", {})),
+        "monthly_apps": sorted(((key, m["n"]) for key, m in groups.get("month", {}).items()), reverse=True),
+        "weekly_apps": sorted(((key, m["n"]) for key, m in groups.get("week", {}).items()), reverse=True),
+        "quality": {
+            "all": _quality(totals),
+            "interviewed": _quality(groups.get("interviewed", {}).get("1")),
+            "others": _quality(groups.get("interviewed", {}).get("0")),
+        },
+        # (label, total apps, interviewed apps), best fit first
+        "fit_groups": [(label, fit_groups[str(fit)]["n"], fit_groups[str(fit)]["interviewed"]) for fit, label in FIT_LABELS.items() if str(fit) in fit_groups],
+    }
+
+
+def compute_stats(where_clause: str = None, params: list = None) -> dict:
+    """Computes the dashboard numbers for the jobs matching the filter. Unfiltered requests read the rollup."""
+    if not where_clause:
+        return summarize(read_rollup())
+    return summarize(aggregate(where_clause, params))
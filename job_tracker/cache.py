@@ -0,0 +1,101 @@
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+from job_tracker.database import DB_PATH, get_data_version
+
+# On-disk cache of `stats` results, next to the database.
+# Entries are keyed on the request plus the database's data version, so any write (from any process)
+# makes older entries unreachable instead of requiring explicit invalidation.
+CACHE_DIR = DB_PATH.parent / ".cache" / "results"
+COUNTERS_FILE = "counters.json"
+MAX_ENTRIES = 256
+
+# Set JOB_TRACKER_RESULT_CACHE=0 to always recompute
+ENABLED = os.getenv("JOB_TRACKER_RESULT_CACHE", "1") != "0"
+
+
+def _entry_path(command: str, request: tuple) -> Path:
+    key = repr((str(DB_PATH), command, request, get_data_version()))
+    return CACHE_DIR / f"{command}-{hashlib.sha256(key.encode()).hexdigest()[:32]}.pickle"
+
+
+def _count(event: str):
+    counters = read_counters()
+    counters[event] = counters.get(event, 0) + 1
+    try:
+        (CACHE_DIR / COUNTERS_FILE).write_text(json.dumps(counters))
+    except OSError:
+        pass
+
+
+def _prune():
+    """Drops the least recently written entries beyond MAX_ENTRIES. Superseded versions age out this way."""
+    entries = sorted(CACHE_DIR.glob("*.pickle"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for path in entries[MAX_ENTRIES:]:
+        path.unlink(missing_ok=True)
+
+
+def cached(command: str, request: tuple, compute):
+    """
+    Returns compute() for this request, reusing a stored result while the database is unchanged.
+    `request` must hold everything the result depends on (filter, params, sort, columns, ...).
+    """
+    if not ENABLED:
+        return compute()
+
+    path = _entry_path(command, request)
+    try:
+        with open(path, "rb") as f:
+            result = pickle.load(f)
+        _count("hits")
+        return result
+    except FileNotFoundError:
+        pass
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        # Unreadable or written by an incompatible version, recompute and overwrite it
+        path.unlink(missing_ok=True)
+
+    result = compute()
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        _prune()
+    except OSError:
+        # The cache is best effort, a read-only or full disk must not break the command
+        pass
+    _count("misses")
+    return result
+
+
+def read_counters() -> dict:
+    """Hit/miss counters since the cache was last cleared."""
+    try:
+        return json.loads((CACHE_DIR / COUNTERS_FILE).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def cache_info() -> dict:
+    """Entry count, total size in bytes and hit/miss counters."""
+    entries = list(CACHE_DIR.glob("*.pickle")) if CACHE_DIR.exists() else []
+    counters = read_counters()
+    return {
+        "entries": len(entries),
+        "bytes": sum(p.stat().st_size for p in entries),
+        "hits": counters.get("hits", 0),
+        "misses": counters.get("misses", 0),
+    }
+
+
+def clear_cache():
+    """Deletes every cached result and resets the counters."""
+    if not CACHE_DIR.exists():
+        return
+    for path in CACHE_DIR.iterdir():
+        if path.suffix in (".pickle", ".tmp", ".json"):
+            path.unlink(missing_ok=True)
@@ -1 +1 @@
-from . import add, edit, view, delete, stats, config, transcript
+from . import add, edit, view, delete, stats, config, transcript, import_jobs
@@ -1,3 +1,4 @@
+import time
 import typer
 from datetime import date, datetime, timedelta
 from rich.console import Console
@@ -9,14 +10,129 @@ from pathlib import Path
 console = Console()
 
 
-def add(url: str = typer.Option(None, "--url", help="LinkedIn job post URL")):
-    """Add a new job application by answering a series of prompts."""
+def _add_batch(urls_file: Path, workers: int, llm_workers: int, refresh: bool):
+    """Adds every URL in `urls_file` without prompting, then prints a per-URL summary."""
+    from rich.table import Table
+    from job_tracker import ingest
+
+    if not urls_file.exists():
+        console.print(f"[bold red]Error:[/bold red] File {urls_file} not found.")
+        raise typer.Exit(1)
+    urls = ingest.read_url_file(urls_file)
+    if not urls:
+        console.print("[yellow]No URLs found in the file.[/yellow]")
+        return
+
+    user_profile = ingest.load_user_profile()
+    if not user_profile:
+        console.print("[yellow]Warning: user_profile.md not found. Fit and Rating might be inaccurate.[/yellow]")
+
+    console.print(f"[bold blue]Adding {len(urls)} job applications[/bold blue] ({workers} fetch workers, {llm_workers} LLM workers)")
+    settled = 0
+    colors = {ingest.ADDED: "green", ingest.SKIPPED: "yellow", ingest.FAILED: "red"}
+
+    def report(result):
+        nonlocal settled
+        settled += 1
+        console.print(f"[{settled}/{len(urls)}] [{colors[result.outcome]}]{result.outcome}[/{colors[result.outcome]}] {result.url}")
+
+    started = time.perf_counter()
+    results = ingest.ingest_urls(urls, user_profile, fetch_workers=workers, llm_workers=llm_workers, on_result=report, refresh=refresh)
+    elapsed = time.perf_counter() - started
+
+    table = Table(title="Batch Add")
+    table.add_column("URL", overflow="fold")
+    table.add_column("Result")
+    table.add_column("ID", justify="right")
+    table.add_column("Details")
+    table.add_column("Page", justify="right")
+    table.add_column("Fetch", justify="right")
+    table.add_column("Parse", justify="right")
+    table.add_column("LLM", justify="right")
+    table.add_column("Tokens", justify="right")
+    table.add_column("Known", justify="right")
+    table.add_column("Done at", justify="right")
+    for result in results:
+        color = colors[result.outcome]
+        table.add_row(
+            result.url,
+            f"[{color}]{result.outcome}[/{color}]",
+            str(result.job_id or ""),
+            result.detail,
+            f"{result.page_source} {result.page_bytes / 1024:.0f} KB" if result.page_source else "",
+            f"{result.fetch_seconds:.2f}s" if result.fetch_seconds else "",
+            f"{result.parse_seconds * 1000:.0f}ms" if result.parse_seconds else "",
+            f"{result.enrich_seconds:.2f}s" if result.enrich_seconds else "",
+            str(result.llm_tokens or ""),
+            str(result.fields_skipped or ""),
+            f"{result.total_seconds:.2f}s" if result.total_seconds else "",
+        )
+    console.print(table)
+
+    from job_tracker.fetcher import active_fetcher
+
+    fetcher = active_fetcher()
+    if fetcher:
+        for host, latency in fetcher.latency_summary().items():
+            console.print(
+                f"[dim]{host}: {latency['count']} requests, mean {latency['mean'] * 1000:.0f}ms, p50 <= {latency['p50'] * 1000:.0f}ms,"
+                f" p95 <= {latency['p95'] * 1000:.0f}ms, max {latency['max'] * 1000:.0f}ms ({fetcher.retries} retries in total)[/dim]"
+            )
+
+    fetched = [r for r in results if r.page_source]
+    if fetched:
+        from job_tracker.scraper import GUEST
+
+        guest = sum(1 for r in fetched if r.page_source == GUEST)
+        console.print(
+            f"[dim]Pages: {guest} guest job postings, {len(fetched) - guest} full pages, {sum(r.page_bytes for r in fetched) / 1024:.0f} KB transferred,"
+            f" parsed in {sum(r.parse_seconds for r in fetched) / len(fetched) * 1000:.0f}ms on average.[/dim]"
+        )
+
+    from job_tracker import llm
+
+    usage = llm.usage()
+    if usage["fields_requested"] or usage["fields_skipped"]:
+        console.print(
+            f"[dim]LLM: {usage['calls']} calls, {usage['input_tokens']} input + {usage['output_tokens']} output tokens."
+            f" {usage['fields_skipped']} fields came from the pages instead (~{usage['schema_chars_saved'] // 4} prompt tokens saved).[/dim]"
+        )
+
+    counts = {outcome: sum(1 for r in results if r.outcome == outcome) for outcome in colors}
+    console.print(
+        f"[bold green]Done[/bold green] in {elapsed:.2f}s: {counts[ingest.ADDED]} added,"
+        f" {counts[ingest.SKIPPED]} already tracked, {counts[ingest.FAILED]} failed."
+    )
+    if counts[ingest.FAILED]:
+        raise typer.Exit(1)
+
+
+def add(
+    url: str = typer.Option(None, "--url", help="LinkedIn job post URL"),
+    batch: Path = typer.Option(None, "--batch", help="File of job post URLs (one per line) to add without prompting"),
+    # ingest.FETCH_WORKERS and LLM_WORKERS, spelled out so that startup doesn't import ingest
+    workers: int = typer.Option(8, "--workers", min=1, help="Pages fetched at once with --batch"),
+    llm_workers: int = typer.Option(4, "--llm-workers", min=1, help="LLM enrichment calls at once with --batch"),
+    refresh: bool = typer.Option(False, "--refresh", help="Fetch pages again instead of using the page cache"),
+):
+    """Add a new job application by answering a series of prompts, or many at once with --batch."""
+
+    if batch:
+        if url:
+            console.print("[bold red]Error:[/bold red] Use either --url or --batch, not both.")
+            raise typer.Exit(1)
+        _add_batch(batch, workers, llm_workers, refresh)
+        return
 
     console.print("[bold blue]Add New Job Application[/bold blue]")
 
+    # Lazy import to improve startup time
+    from job_tracker.ingest import job_url
+
     if url:
         # Check if job already exists
-        existing_job = get_job_by_url(url)
+        # Also under its canonical form, which `add --batch` saves LinkedIn links in
+        existing_job = get_job_by_url(url) or get_job_by_url(job_url(url))
         if existing_job:
             console.print(f"[bold yellow]Warning:[/bold yellow] A job with this URL already exists in the database.")
             console.print(f"ID: [cyan]{existing_job['id']}[/cyan] | Company: [bold]{existing_job['company_name']}[/bold] | Role: [bold]{existing_job['role_name']}[/bold]")
@@ -29,8 +145,11 @@ def add(url: str = typer.Option(None, "--url", help="LinkedIn job post URL")):
     if url:
         try:
             with console.status("[bold green]Fetching job details from LinkedIn...[/bold green]"):
-                html = scraper.fetch_job_page(url)
+                page = {}
+                html = scraper.fetch_job_page(url, refresh=refresh, stats=page)
+                parse_started = time.perf_counter()
                 html_data = scraper.extract_html_data(html)
+                parse_seconds = time.perf_counter() - parse_started
 
                 # Load user profile
                 profile_path = Path("user_profile.md")
@@ -40,14 +159,20 @@ def add(url: str = typer.Option(None, "--url", help="LinkedIn job post URL")):
                     console.print("[yellow]Warning: user_profile.md not found. Fit and Rating might be inaccurate.[/yellow]")
                     user_profile = ""
 
-                llm_data = llm.enrich_job_data(html_data, user_profile)
+                page_usage = {}
+                llm_data = llm.enrich_job_data(html_data, user_profile, page_usage)
 
                 # Merge data (LLM overrides HTML if needed, but usually fills gaps)
                 scraped_data = {**html_data, **llm_data}
-                scraped_data["role_url"] = url
+                scraped_data["role_url"] = job_url(url)
                 scraped_data["source"] = Source.LINKEDIN.value
 
                 console.print("[green]Successfully extracted data![/green]")
+                source = "guest job posting" if page["source"] == scraper.GUEST else "full page"
+                cached = " from the page cache" if page.get("cache") == "hit" else f" ({page.get('bytes', 0) / 1024:.0f} KB transferred)"
+                console.print(f"[dim]Read the {source}{cached}, parsed in {parse_seconds * 1000:.0f}ms.[/dim]")
+                if page_usage.get("fields_skipped"):
+                    console.print(f"[dim]{page_usage['fields_skipped']} fields came from the page's structured data; asked the LLM for {page_usage['fields_requested']} ({page_usage['input_tokens'] + page_usage['output_tokens']} tokens).[/dim]")
 
         except Exception as e:
             console.print(f"[bold red]Error scraping URL:[/bold red] {e}")
@@ -203,8 +328,8 @@ def add(url: str = typer.Option(None, "--url", help="LinkedIn job post URL")):
     final_data = {k: (v if not is_null_string(v) else None) for k, v in job_data.items()}
 
     try:
+        # The insert commits on its own: calendar calls (and a first-run OAuth consent) must not hold the write lock
         job_id = add_job(final_data)
-        console.print(f"\n[bold green]Success![/bold green] Job application added with ID: [cyan]{job_id}[/cyan]")
 
         # Sync with Google Calendar
         from job_tracker.calendar_utils import sync_event
@@ -242,7 +367,10 @@ def add(url: str = typer.Option(None, "--url", help="LinkedIn job post URL")):
                 calendar_updates["followup_event_id"] = f_id
 
         if calendar_updates:
+            # A second short write, once the calendar calls are done
             update_job(job_id, calendar_updates)
 
+        console.print(f"\n[bold green]Success![/bold green] Job application added with ID: [cyan]{job_id}[/cyan]")
+
     except Exception as e:
         console.print(f"\n[bold red]Error:[/bold red] Could not add job. {e}")
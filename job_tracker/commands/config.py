@@ -1,5 +1,6 @@
 import typer
 from rich.console import Console
+from job_tracker.cache import CACHE_DIR, cache_info, clear_cache
 from job_tracker.database import add_new_column
 
 console = Console()
@@ -22,3 +23,35 @@ def add_column(
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] Could not add column. {e}")
         raise typer.Exit(1)
+
+
+@app.command(name="cache")
+def cache(
+    clear: bool = typer.Option(False, "--clear", help="Delete all cached results and pages, and reset the counters."),
+):
+    """
+    Show result cache usage for 'stats', and page cache usage for 'add --url/--batch'.
+    """
+    from job_tracker import page_cache
+
+    if clear:
+        clear_cache()
+        page_cache.clear_cache()
+        console.print("[bold green]Success![/bold green] Result and page caches cleared.")
+        return
+
+    info = cache_info()
+    lookups = info["hits"] + info["misses"]
+    hit_rate = info["hits"] / lookups * 100 if lookups else 0
+    console.print(f"Location: [cyan]{CACHE_DIR}[/cyan]")
+    console.print(f"Entries:  [bold]{info['entries']}[/bold] ({info['bytes'] / 1024:.1f} KiB)")
+    console.print(f"Hits:     [bold green]{info['hits']}[/bold green]")
+    console.print(f"Misses:   [bold yellow]{info['misses']}[/bold yellow] ({hit_rate:.1f}% hit rate)")
+
+    pages = page_cache.cache_info()
+    fetches = pages["hits"] + pages["revalidated"] + pages["misses"]
+    served = (pages["hits"] + pages["revalidated"]) / fetches * 100 if fetches else 0
+    console.print(f"\nPage cache: [cyan]{page_cache.PAGES_DIR}[/cyan]")
+    console.print(f"Entries:  [bold]{pages['entries']}[/bold] ({pages['bytes'] / 1024:.1f} KiB of {page_cache.MAX_BYTES / 1024 / 1024:.0f} MiB)")
+    console.print(f"Hits:     [bold green]{pages['hits']}[/bold green] (+{pages['revalidated']} revalidated with a 304)")
+    console.print(f"Misses:   [bold yellow]{pages['misses']}[/bold yellow] ({served:.1f}% served from cache)")
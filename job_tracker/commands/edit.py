@@ -3,7 +3,7 @@ from datetime import date, datetime, timedelta
 from rich.console import Console
 from rich.table import Table
 from job_tracker.database import get_job_by_id, update_job
-from job_tracker.models import Arrangement, JobType, ExperienceLevel, Source, Status
+from job_tracker.models import DATE_COLUMNS, DATETIME_COLUMNS, ENUM_COLUMNS, Status
 from job_tracker.utils import (
     validate_date,
     validate_datetime,
@@ -38,10 +38,10 @@ def edit(job_id: int = typer.Argument(..., help="The ID of the job to edit.")):
     fields += [f for f in all_db_fields if f not in fields]
 
     # Map fields to their respective Enum classes for validation
-    enum_fields = {"arrangement": Arrangement, "type": JobType, "level": ExperienceLevel, "source": Source, "status": Status}
+    enum_fields = ENUM_COLUMNS
 
-    date_fields = ["date_posted", "date_applied", "application_response_date", "interview_response_date", "followup_date"]
-    datetime_fields = ["interview_time"]
+    date_fields = DATE_COLUMNS
+    datetime_fields = DATETIME_COLUMNS
 
     while True:
         # Display current state of the job (including pending updates)
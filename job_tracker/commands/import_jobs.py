@@ -0,0 +1,85 @@
+import time
+import typer
+from pathlib import Path
+from rich.console import Console
+from job_tracker.database import insert_jobs, job_columns
+from job_tracker.importers import READERS, reader_for, resolve_column, validate_job
+
+console = Console()
+
+# Invalid rows listed individually before the rest are only counted
+MAX_REPORTED_ERRORS = 10
+
+
+def import_jobs(
+    file: Path = typer.Argument(..., help="File to import: .csv or .jsonl (optionally .gz), or .parquet"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Validate the file without importing anything"),
+):
+    """
+    Import job applications from a file in one transaction.
+    Columns may use database names or the short names from 'view' (company, role, date, ...).
+    Invalid rows are reported and skipped, and jobs whose role URL is already tracked are skipped.
+    """
+    if not file.exists():
+        console.print(f"[bold red]Error:[/bold red] File {file} not found.")
+        raise typer.Exit(1)
+    reader = reader_for(file.name)
+    if reader is None:
+        console.print(f"[bold red]Error:[/bold red] Unsupported file type '{file.name}'. Supported: {', '.join(READERS)}")
+        raise typer.Exit(1)
+
+    # Imported jobs get new ids
+    writable = [c for c in job_columns() if c != "id"]
+    columns_by_key = {}
+    ignored = set()
+    stats = {"read": 0, "invalid": 0}
+
+    def valid_jobs(rows):
+        for line, row in rows:
+            stats["read"] += 1
+            try:
+                if isinstance(row, ValueError):
+                    raise row
+                for key in row.keys() - columns_by_key.keys():
+                    column = resolve_column(key)
+                    columns_by_key[key] = column if column in writable else None
+                    # Exported files carry ids, which are dropped on purpose
+                    if columns_by_key[key] is None and column != "id":
+                        ignored.add(key)
+                yield validate_job(row, columns_by_key)
+            except ValueError as e:
+                stats["invalid"] += 1
+                if stats["invalid"] <= MAX_REPORTED_ERRORS:
+                    console.print(f"[yellow]Line {line}:[/yellow] {e}")
+
+    started = time.perf_counter()
+    try:
+        _names, rows = reader(str(file))
+        if dry_run:
+            valid = sum(1 for _ in valid_jobs(rows))
+            inserted = 0
+        else:
+            # Each job inserts only the columns the file gave it, so the others get their defaults
+            inserted = insert_jobs(valid_jobs(rows))
+    except ImportError as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        raise typer.Exit(1)
+    except Exception as e:
+        console.print(f"[bold red]Error importing {file.name}:[/bold red] {e}")
+        raise typer.Exit(1)
+    elapsed = time.perf_counter() - started
+
+    if stats["invalid"] > MAX_REPORTED_ERRORS:
+        console.print(f"[yellow]... and {stats['invalid'] - MAX_REPORTED_ERRORS} more invalid rows.[/yellow]")
+    if ignored:
+        console.print(f"[yellow]Ignored unknown columns:[/yellow] {', '.join(sorted(ignored))}")
+    rate = f"{stats['read'] / max(elapsed, 1e-9):,.0f} rows/s"
+    if dry_run:
+        console.print(f"[bold green]Checked {stats['read']} rows[/bold green] in {elapsed:.2f}s ({rate}): {valid} valid, {stats['invalid']} invalid. Nothing was imported.")
+        return
+
+    duplicates = stats["read"] - stats["invalid"] - inserted
+    console.print(
+        f"[bold green]Success![/bold green] Imported {inserted} jobs from [cyan]{file.name}[/cyan] in {elapsed:.2f}s ({rate})."
+        f" Skipped {duplicates} already tracked (same role URL) and {stats['invalid']} invalid."
+    )
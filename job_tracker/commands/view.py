@@ -1,77 +1,62 @@
 import typer
-import csv
+import os
+import sys
+import time
+from itertools import chain
 from typing import List, Optional
 from rich.console import Console
+from rich.markup import escape
 from rich.table import Table
-from job_tracker.database import get_jobs
-from job_tracker.utils import parse_filter_string, parse_sort_string, get_visible_columns, COLUMN_MAPPING
+from job_tracker.database import SNIPPET_END, SNIPPET_START, full_text_available, get_jobs, iter_jobs
+from job_tracker.exporters import WRITERS, OutputFormat, open_output, write_csv, write_parquet
+from job_tracker.filters import FilterError
+from job_tracker.fuzzy import FUZZY_COLUMNS, fuzzy_clauses, near_names
+from job_tracker.pager import KeysetPager
+from job_tracker.utils import parse_filter_string, parse_sort_keys, parse_sort_string, get_visible_columns, COLUMN_MAPPING
 
 console = Console()
 
+DEFAULT_EXPORT = "output.csv"
 
-def view(
-    query: Optional[str] = typer.Argument(None, help="Optional query string for filtering (e.g., 'company~google')"),
-    filter: Optional[List[str]] = typer.Option(None, "--filter", "-f", help="Filter strings (e.g., 'rating>=4')"),
-    sort: Optional[List[str]] = typer.Option(None, "--sort", "-s", help="Sort instructions (e.g., 'date:desc'). Default is 'date:desc, id:desc'."),
-    show: Optional[str] = typer.Option(None, "--show", help="Comma-separated list of columns to show"),
-    hide: Optional[str] = typer.Option(None, "--hide", help="Comma-separated list of columns to hide"),
-    all: bool = typer.Option(False, "--all", help="Show all columns"),
-    limit: Optional[int] = typer.Option(None, "--limit", "-l", help="Maximum number of results to display"),
-    export: bool = typer.Option(False, "--export", "-e", help="Export results to a CSV file"),
-    output: str = typer.Option("output.csv", "--output", "-o", help="Filename for the exported CSV"),
-):
-    """
-    View and filter job applications.
-    """
-    # 1. Combine filters
-    all_filters = []
-    if query:
-        all_filters.append(query)
-    if filter:
-        all_filters.extend(filter)
-
-    combined_filter_str = " AND ".join(all_filters)
-    where_clause, params = parse_filter_string(combined_filter_str)
+# Columns needed to render clickable links, fetched alongside the visible ones
+LINK_COLUMNS = ["company_url", "company_linkedin", "role_url", "recruiter_linkedin", "interview_link", "recruiter_phone_number"]
 
-    # 2. Parse sorting
-    sort_clause = parse_sort_string(sort) if sort else None
 
-    # 3. Fetch data
-    try:
-        jobs = get_jobs(where_clause=where_clause, params=params, sort_clause=sort_clause, limit=limit)
-    except Exception as e:
-        console.print(f"[bold red]Error fetching jobs:[/bold red] {e}")
-        raise typer.Exit(code=1)
+def _apply_fuzzy(fuzzy: str, where_clause: str, params: list, sort_clause: str):
+    """
+    Narrows the query to jobs whose company/role resembles `fuzzy` ("text" or "column:text" with a COLUMN_MAPPING alias),
+    ranked by similarity unless a sort was given. Returns a None where clause when nothing is close enough.
+    """
+    columns = FUZZY_COLUMNS
+    alias, sep, text = fuzzy.partition(":")
+    if sep and alias.strip().lower() in COLUMN_MAPPING:
+        column = COLUMN_MAPPING[alias.strip().lower()]
+        if column not in FUZZY_COLUMNS:
+            raise ValueError(f"Fuzzy search only covers company and role names, not '{alias.strip()}'.")
+        columns = (column,)
+    else:
+        text = fuzzy
 
-    if not jobs:
-        console.print("[yellow]No jobs found matching your criteria.[/yellow]")
-        return
+    matches = near_names(text, columns)
+    if not matches:
+        return None, params, sort_clause
 
-    # 4. Determine visible columns
-    visible_col_keys = get_visible_columns(show=show, hide=hide, all_cols=all)
+    fuzzy_where, fuzzy_params, rank_clause, rank_params = fuzzy_clauses(matches)
+    where_clause = f"({where_clause}) AND {fuzzy_where}" if where_clause else fuzzy_where
+    params = list(params) + fuzzy_params
+    if sort_clause:
+        return where_clause, params, sort_clause
+    return where_clause, params + rank_params, rank_clause
 
-    # 5. Handle CSV Export
-    if export:
-        try:
-            with open(output, mode="w", newline="", encoding="utf-8") as f:
-                # Use all columns for CSV export if not specified otherwise
-                fieldnames = [COLUMN_MAPPING[k] for k in visible_col_keys]
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                for job in jobs:
-                    # Filter job dict to only include visible columns
-                    row = {COLUMN_MAPPING[k]: job[COLUMN_MAPPING[k]] for k in visible_col_keys}
-                    writer.writerow(row)
-            console.print(f"[bold green]Success![/bold green] Exported {len(jobs)} jobs to [cyan]{output}[/cyan]")
-        except Exception as e:
-            console.print(f"[bold red]Error exporting to CSV:[/bold red] {e}")
-            raise typer.Exit(code=1)
 
-    # 6. Display Table
+def _render_table(jobs, visible_col_keys: List[str], search: Optional[str]) -> Table:
+    """Builds the rich table for `jobs`, with clickable links and (when searching) the highlighted match."""
     table = Table(title="Job Applications", row_styles=["", "on grey7"], padding=(1, 1))
 
     for key in visible_col_keys:
         table.add_column(key.replace("_", " ").title(), style="cyan")
+    if search:
+        table.add_column("Match")
 
     for job in jobs:
         row_data = []
@@ -100,7 +85,238 @@ def view(
                 display_val = f"[link=tel:{job['recruiter_phone_number']}]{display_val}[/link]"
 
             row_data.append(display_val)
+
+        if search:
+            # Escape the text itself, then turn the highlight markers into markup
+            snippet = escape(job["search_snippet"] or "").replace(SNIPPET_START, "[bold yellow]").replace(SNIPPET_END, "[/bold yellow]")
+            row_data.append(snippet)
         table.add_row(*row_data)
 
-    console.print(table)
+    return table
+
+
+def _page_through(pager: KeysetPager, visible_col_keys: List[str], search: Optional[str], started: float):
+    """Shows one page at a time and reads navigation commands until the user quits."""
+    rows = pager.first()
+    if not rows:
+        console.print("[yellow]No jobs found matching your criteria.[/yellow]")
+        return
+
+    console.print(_render_table(rows, visible_col_keys, search))
+    first_rows_ms = (time.perf_counter() - started) * 1000
+    if pager.page == 1 and len(rows) < pager.page_size:
+        console.print(f"\n[dim]Showing {len(rows)} applications.[/dim]")
+        return
+
+    while True:
+        first = (pager.page - 1) * pager.page_size + 1
+        status = f"Page {pager.page} · rows {first}-{first + len(pager.rows) - 1}"
+        if first_rows_ms is not None:
+            status += f" · first rows in {first_rows_ms:.0f} ms"
+            first_rows_ms = None
+        console.print(f"\n[dim]{status}[/dim]")
+        try:
+            choice = console.input("[dim]\\[n]ext, \\[p]revious, \\[f]irst, \\[l]ast, page number or \\[q]uit: [/dim]").strip().lower()
+        except (EOFError, KeyboardInterrupt):
+            break
+
+        if choice in ("q", "quit"):
+            break
+        if choice in ("", "n", "next"):
+            rows = pager.next()
+        elif choice in ("p", "prev", "previous"):
+            rows = pager.previous()
+        elif choice in ("f", "first"):
+            rows = pager.first()
+        elif choice in ("l", "last"):
+            rows = pager.last()
+        elif choice.isdigit():
+            rows = pager.jump(int(choice))
+        else:
+            console.print("[yellow]Unknown command.[/yellow]")
+            continue
+
+        if rows:
+            console.print(_render_table(rows, visible_col_keys, search))
+        else:
+            console.print("[yellow]No more pages in that direction.[/yellow]")
+
+
+def _export_csv(output: str, where_clause: str, params: list, sort_clause: str, limit: Optional[int], visible_col_keys: List[str], search: Optional[str]):
+    """Writes the visible columns of every match to `output` (a path, *.csv.gz to compress, or - for stdout)."""
+    # Messages go to stderr when the CSV itself goes to stdout
+    status = Console(stderr=True) if output == "-" else console
+    header = [COLUMN_MAPPING[k] for k in visible_col_keys]
+    export_columns = list(dict.fromkeys(header))
+    # Aliases of one column (e.g. with --all) repeat it in the header but fetch it once
+    indexes = [export_columns.index(column) for column in header]
+    if indexes == list(range(len(export_columns))) and not search:
+        indexes = None
+
+    started = time.perf_counter()
+    try:
+        rows = iter_jobs(where_clause=where_clause, params=params, sort_clause=sort_clause, limit=limit, columns=export_columns, search=search, records=False)
+        first_row = next(rows, None)
+        if first_row is None:
+            status.print("[yellow]No jobs found matching your criteria.[/yellow]")
+            return
+        with open_output(output) as f:
+            exported = write_csv(chain([first_row], rows), header, f, indexes)
+    except BrokenPipeError:
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return
+    except Exception as e:
+        status.print(f"[bold red]Error exporting to CSV:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
+    elapsed = time.perf_counter() - started
+    target = "stdout" if output == "-" else output
+    status.print(f"[bold green]Success![/bold green] Exported {exported} jobs to [cyan]{target}[/cyan] in {elapsed:.2f}s ({exported / max(elapsed, 1e-9):,.0f} rows/s)")
+
+
+def _export_parquet(output: str, where_clause: str, params: list, sort_clause: str, limit: Optional[int], visible_col_keys: List[str], search: Optional[str]):
+    """Writes the visible columns of every match to a typed Parquet file (needs pyarrow)."""
+    if output == "-":
+        console.print("[bold red]Error:[/bold red] Parquet can't be written to stdout, pass a filename.")
+        raise typer.Exit(code=1)
+    # Parquet columns must be unique, aliases of one column are exported once
+    export_columns = list(dict.fromkeys(COLUMN_MAPPING[k] for k in visible_col_keys))
+
+    started = time.perf_counter()
+    try:
+        rows = iter_jobs(where_clause=where_clause, params=params, sort_clause=sort_clause, limit=limit, columns=export_columns, search=search, records=False)
+        if search:
+            # Drop the trailing search columns
+            rows = (row[: len(export_columns)] for row in rows)
+        exported, invalid = write_parquet(rows, export_columns, output)
+    except ImportError as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        raise typer.Exit(code=1)
+    except Exception as e:
+        console.print(f"[bold red]Error exporting to Parquet:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
+    elapsed = time.perf_counter() - started
+    for column, count in invalid.items():
+        console.print(f"[yellow]Warning:[/yellow] {count} values in {column} didn't fit its type and were exported as null.")
+    console.print(f"[bold green]Success![/bold green] Exported {exported} jobs to [cyan]{output}[/cyan] in {elapsed:.2f}s ({exported / max(elapsed, 1e-9):,.0f} rows/s)")
+
+
+def _stream(output_format: OutputFormat, rows, visible_col_keys: List[str]):
+    """Writes `rows` to stdout in a streaming format, with the visible columns."""
+    columns = [(key.replace("_", " ").title(), COLUMN_MAPPING[key]) for key in visible_col_keys]
+    WRITERS[output_format](rows, columns, sys.stdout)
+    sys.stdout.flush()
+
+
+def view(
+    query: Optional[str] = typer.Argument(None, help="Optional query string for filtering (e.g., 'company~google')"),
+    filter: Optional[List[str]] = typer.Option(None, "--filter", "-f", help="Filter strings (e.g., 'rating>=4')"),
+    sort: Optional[List[str]] = typer.Option(None, "--sort", "-s", help="Sort instructions (e.g., 'date:desc'). Default is 'date:desc, id:desc'."),
+    show: Optional[str] = typer.Option(None, "--show", help="Comma-separated list of columns to show"),
+    hide: Optional[str] = typer.Option(None, "--hide", help="Comma-separated list of columns to hide"),
+    all: bool = typer.Option(False, "--all", help="Show all columns"),
+    limit: Optional[int] = typer.Option(None, "--limit", "-l", help="Maximum number of results to display"),
+    search: Optional[str] = typer.Option(None, "--search", help="Full-text search over company, role, location, notes, feedback and transcripts, best matches first"),
+    fuzzy: Optional[str] = typer.Option(None, "--fuzzy", help="Typo-tolerant company/role name search, closest first (e.g., 'gogle' or 'company:microsft')"),
+    export: bool = typer.Option(False, "--export", "-e", help="Export results to a CSV file"),
+    output: str = typer.Option(DEFAULT_EXPORT, "--output", "-o", help="Filename for the export ('.csv.gz' to compress, '-' for stdout)"),
+    output_format: Optional[OutputFormat] = typer.Option(None, "--format", help="Output format. Defaults to 'table' in a terminal and 'tsv' when piped. With --export: csv (default) or 'parquet'."),
+    pager: Optional[bool] = typer.Option(None, "--pager/--no-pager", help="Page through results interactively (default: on in a terminal unless --limit is given)"),
+    page_size: int = typer.Option(20, "--page-size", min=1, help="Rows per page in the pager"),
+):
+    """
+    View and filter job applications.
+    """
+    started = time.perf_counter()
+    # 1. Combine filters
+    all_filters = []
+    if query:
+        all_filters.append(query)
+    if filter:
+        all_filters.extend(filter)
+
+    combined_filter_str = " AND ".join(all_filters)
+    try:
+        where_clause, params = parse_filter_string(combined_filter_str)
+    except FilterError as e:
+        console.print(f"[bold red]Invalid filter:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
+    # 2. Parse sorting
+    sort_clause = parse_sort_string(sort) if sort else None
+
+    if fuzzy:
+        try:
+            where_clause, params, sort_clause = _apply_fuzzy(fuzzy, where_clause, params, sort_clause)
+        except ValueError as e:
+            console.print(f"[bold red]Error:[/bold red] {e}")
+            raise typer.Exit(code=1)
+        if where_clause is None:
+            console.print("[yellow]No jobs found matching your criteria.[/yellow]")
+            return
+
+    if search and not full_text_available():
+        console.print("[bold red]Error:[/bold red] Full-text search needs an SQLite build with FTS5. Use 'col~text' filters instead.")
+        raise typer.Exit(code=1)
+
+    # 3. Determine visible columns
+    visible_col_keys = get_visible_columns(show=show, hide=hide, all_cols=all)
+    columns = list(dict.fromkeys([COLUMN_MAPPING[k] for k in visible_col_keys] + LINK_COLUMNS))
+
+    # 4. Handle CSV/Parquet Export (streams plain tuples of just the exported columns straight from the cursor)
+    if export:
+        if output_format == OutputFormat.PARQUET:
+            _export_parquet("output.parquet" if output == DEFAULT_EXPORT else output, where_clause, params, sort_clause, limit, visible_col_keys, search)
+        elif output_format in (None, OutputFormat.TABLE):
+            _export_csv(output, where_clause, params, sort_clause, limit, visible_col_keys, search)
+        else:
+            console.print("[bold red]Error:[/bold red] --export writes CSV, or Parquet with '--format parquet'.")
+            raise typer.Exit(code=1)
+        return
+    if output_format == OutputFormat.PARQUET:
+        console.print("[bold red]Error:[/bold red] Parquet is an export format, add --export.")
+        raise typer.Exit(code=1)
+
+    # 5. Stream plain/TSV/JSONL straight from the cursor, skipping rich layout (the default when piped)
+    if output_format is None:
+        output_format = OutputFormat.TABLE if console.is_terminal else OutputFormat.TSV
+    if output_format != OutputFormat.TABLE:
+        try:
+            rows = iter_jobs(where_clause=where_clause, params=params, sort_clause=sort_clause, limit=limit, columns=columns, search=search)
+            _stream(output_format, rows, visible_col_keys)
+        except BrokenPipeError:
+            # The reader (e.g. `head`) stopped early: point stdout at devnull so the exit-time flush stays quiet
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        except Exception as e:
+            console.print(f"[bold red]Error fetching jobs:[/bold red] {e}")
+            raise typer.Exit(code=1)
+        return
+
+    # 6. Page through large results interactively, fetching and rendering one page at a time
+    if pager is None:
+        pager = console.is_terminal and sys.stdin.isatty()
+    # A fuzzy ranking sorts on a computed expression the pager can't seek on
+    if pager and limit is None and not (fuzzy and not sort):
+        keys = parse_sort_keys(sort) or ([("search_rank", False)] if search else None)
+        try:
+            _page_through(KeysetPager(where_clause, params, keys, columns, page_size, search=search), visible_col_keys, search, started)
+        except Exception as e:
+            console.print(f"[bold red]Error fetching jobs:[/bold red] {e}")
+            raise typer.Exit(code=1)
+        return
+
+    # 7. Fetch data
+    try:
+        jobs = get_jobs(where_clause=where_clause, params=params, sort_clause=sort_clause, limit=limit, columns=columns, search=search)
+    except Exception as e:
+        console.print(f"[bold red]Error fetching jobs:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
+    if not jobs:
+        console.print("[yellow]No jobs found matching your criteria.[/yellow]")
+        return
+
+    # 8. Display Table
+    console.print(_render_table(jobs, visible_col_keys, search))
     console.print(f"\n[dim]Showing {len(jobs)} applications.[/dim]")
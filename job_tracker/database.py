@@ -1,30 +1,166 @@
+import atexit
+import os
+import random
 import sqlite3
+import time
+from datetime import date, timedelta
+from itertools import groupby, islice
 from pathlib import Path
 from contextlib import contextmanager
+from job_tracker.models import record_type
 
 DB_NAME = "jobs.db"
-# Database lives in the project root
-DB_PATH = Path(__file__).parent.parent / DB_NAME
+# Database lives in the project root unless JOB_TRACKER_DB points elsewhere
+DB_PATH = Path(os.getenv("JOB_TRACKER_DB") or Path(__file__).parent.parent / DB_NAME)
 
+# Applications with no response after this many days are marked as ghosted
+GHOSTED_AFTER_DAYS = 30
+GHOSTING_LAST_RUN_KEY = "ghosting_last_run"
 
-@contextmanager
-def get_db():
-    """Context manager for database connection. Ensures connection is closed."""
+# Bumped by triggers on every change to jobs, so caches can tell whether the data moved
+DATA_GENERATION_KEY = "data_generation"
+
+# Full-text index (FTS5, trigram tokenizer) over the free-text columns
+FULL_TEXT_TABLE = "jobs_fts"
+FULL_TEXT_COLUMNS = ("company_name", "role_name", "location", "notes", "feedback", "interview_transcript")
+# bm25() weight per column: a hit in the company or role name outranks one buried in a transcript
+FULL_TEXT_WEIGHTS = (10.0, 10.0, 4.0, 2.0, 1.0, 1.0)
+# Highlight markers around matches in search snippets, swapped for markup by the caller
+SNIPPET_START = "\x02"
+SNIPPET_END = "\x03"
+
+# Connection tuning. The busy timeout is how long SQLite itself waits for a lock.
+BUSY_TIMEOUT_MS = int(os.getenv("JOB_TRACKER_BUSY_TIMEOUT_MS", "5000"))
+CACHED_STATEMENTS = 256
+
+# Rows pulled per fetchmany() call when streaming results
+FETCH_BATCH_SIZE = 500
+# Rows per executemany() call in bulk inserts
+INSERT_BATCH_SIZE = 5000
+
+# Once the busy timeout is exhausted, writers back off exponentially and try again
+WRITE_RETRIES = 6
+WRITE_RETRY_BASE_DELAY = 0.05
+
+# The process-wide connection, opened lazily by get_db()
+_connection = None
+
+
+def _connect() -> sqlite3.Connection:
+    """Opens and configures a new connection to the database."""
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
+    # isolation_level=None leaves transaction control to transaction()
+    conn = sqlite3.connect(DB_PATH, isolation_level=None, cached_statements=CACHED_STATEMENTS)
     conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    return conn
+
+
+@contextmanager
+def get_db():
+    """Context manager yielding the process-wide connection, opened and configured on first use."""
+    global _connection
+    if _connection is None:
+        _connection = _connect()
+        atexit.register(close_db)
+    yield _connection
+
+
+def close_db():
+    """Closes the process-wide connection. The next get_db() call reopens it."""
+    global _connection
+    if _connection is not None:
+        _connection.close()
+        _connection = None
+        atexit.unregister(close_db)
+
+
+def _is_busy_error(error: sqlite3.OperationalError) -> bool:
+    message = str(error).lower()
+    return "database is locked" in message or "database is busy" in message
+
+
+def _begin_write(conn: sqlite3.Connection):
+    """Starts a write transaction, retrying with jittered exponential backoff while the database is busy."""
+    for attempt in range(WRITE_RETRIES + 1):
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            return
+        except sqlite3.OperationalError as e:
+            if not _is_busy_error(e) or attempt == WRITE_RETRIES:
+                raise
+            time.sleep(WRITE_RETRY_BASE_DELAY * (2**attempt) * random.uniform(0.5, 1.5))
+
+
+@contextmanager
+def transaction():
+    """
+    Context manager for a write transaction. Commits on success and rolls back on error.
+    Nested scopes join the outermost transaction, so multi-step writes commit once.
+    The write lock is taken up front, so concurrent writers queue on BEGIN instead of failing mid-way.
+    """
+    with get_db() as conn:
+        if conn.in_transaction:
+            yield conn
+            return
+
+        _begin_write(conn)
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+
+@contextmanager
+def savepoint(conn: sqlite3.Connection, name: str = "step"):
+    """
+    Context manager for one step of a larger write transaction: on error only the step's writes are undone
+    (and the error re-raised), leaving the enclosing transaction open for the next step.
+    """
+    conn.execute(f"SAVEPOINT {name}")
     try:
         yield conn
-    finally:
-        conn.close()
+    except BaseException:
+        conn.execute(f"ROLLBACK TO {name}")
+        conn.execute(f"RELEASE {name}")
+        raise
+    conn.execute(f"RELEASE {name}")
+
+
+@contextmanager
+def read_transaction():
+    """
+    Context manager for reads that must see one snapshot. The transaction is deferred, so it takes no write lock
+    and never waits on writers (in WAL mode). Inside a write transaction it simply joins it.
+    """
+    with get_db() as conn:
+        if conn.in_transaction:
+            yield conn
+            return
+
+        conn.execute("BEGIN")
+        try:
+            yield conn
+        finally:
+            conn.execute("COMMIT")
 
 
 def initialize_db():
+    """Brings the database schema up to date by applying any pending migrations."""
+    run_migrations()
+
+
+def _create_jobs_table(conn: sqlite3.Connection):
     """Creates the jobs table if it doesn't exist."""
     # CRITICAL: When adding/removing columns here, remember to update:
     # 1. COLUMN_MAPPING in job_tracker/utils.py
     # 2. EDIT_COLUMN_ORDER in job_tracker/utils.py
-    query = """
+    conn.execute(
+        """
     CREATE TABLE IF NOT EXISTS jobs (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         company_name TEXT,
@@ -64,132 +200,170 @@ def initialize_db():
         interview_round INTEGER
     );
     """
-    with get_db() as conn:
-        conn.execute(query)
-        conn.commit()
+    )
+
+
+def _upgrade_legacy_columns(conn: sqlite3.Connection):
+    """Brings databases created before versioned migrations up to the baseline column set."""
+    columns = [row["name"] for row in conn.execute("PRAGMA table_info(jobs)").fetchall()]
+
+    renames = [("interview_date", "interview_time"), ("transcript", "interview_transcript")]
+    for old, new in renames:
+        if old in columns and new not in columns:
+            conn.execute(f"ALTER TABLE jobs RENAME COLUMN {old} TO {new}")
+            columns[columns.index(old)] = new
+
+    added = [
+        ("interview_link", "TEXT"),
+        ("interview_event_id", "TEXT"),
+        ("recruiter_linkedin", "TEXT"),
+        ("expected_salary", "TEXT"),
+        ("notes", "TEXT"),
+        ("rating", "INTEGER"),
+        ("fit", "INTEGER"),
+        ("interview_transcript", "TEXT"),
+        ("recruiter_phone_number", "TEXT"),
+        ("resources", "TEXT"),
+        ("interview_round", "INTEGER"),
+    ]
+    for name, col_type in added:
+        if name not in columns:
+            conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {col_type}")
+
+    if "calendar_event_id" in columns:
+        try:
+            conn.execute("ALTER TABLE jobs DROP COLUMN calendar_event_id")
+        except sqlite3.OperationalError:
+            # DROP COLUMN needs SQLite 3.35+; older builds keep the unused column
+            pass
 
-    # Run migrations for existing databases
-    run_migrations()
+
+# Rows that enter the 'applied' state already past the threshold (backfilled applications, status reverted by an
+# edit, a response date cleared) fall outside the incremental window, so they reset the watermark and force the
+# next ghosting run to do a full pass.
+_GHOSTING_RESET = f"""
+    WHEN NEW.status = 'applied' AND NEW.date_applied <= date('now', 'localtime', '-{GHOSTED_AFTER_DAYS} days')
+    BEGIN
+        DELETE FROM meta WHERE key = '{GHOSTING_LAST_RUN_KEY}';
+    END
+"""
+
+
+def _add_meta_and_ghosting_index(conn: sqlite3.Connection):
+    """Adds the key/value meta table and the structures backing incremental ghosting."""
+    conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_applied_date ON jobs (date_applied) WHERE status = 'applied'")
+
+    conn.execute(f"CREATE TRIGGER IF NOT EXISTS jobs_ghosting_reset_insert AFTER INSERT ON jobs {_GHOSTING_RESET}")
+    conn.execute(f"CREATE TRIGGER IF NOT EXISTS jobs_ghosting_reset_update AFTER UPDATE OF status, date_applied ON jobs {_GHOSTING_RESET}")
+
+
+def _add_query_indexes(conn: sqlite3.Connection):
+    """Adds indexes for the columns the CLI filters, sorts and deduplicates on."""
+    try:
+        conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_role_url ON jobs (role_url)")
+    except sqlite3.IntegrityError:
+        # Existing duplicates can't be resolved automatically, keep lookups fast regardless
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_role_url ON jobs (role_url)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_date_applied ON jobs (date_applied, id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status_date ON jobs (status, date_applied)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company_name)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_followup ON jobs (followup_date)")
+
+
+def _add_stats_rollup(conn: sqlite3.Connection):
+    """Adds the trigger-maintained rollup behind the unfiltered stats dashboard."""
+    from job_tracker.analytics import create_rollup
+
+    # Built from the current metric definitions. If those change, append a migration calling create_rollup again.
+    create_rollup(conn)
+
+
+def _add_change_counter(conn: sqlite3.Connection):
+    """Adds the trigger-maintained data generation counter that result caches are keyed on."""
+    conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES (?, 0)", (DATA_GENERATION_KEY,))
+    bump = f"BEGIN UPDATE meta SET value = value + 1 WHERE key = '{DATA_GENERATION_KEY}'; END"
+    for event in ("INSERT", "UPDATE", "DELETE"):
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS jobs_data_generation_{event.lower()} AFTER {event} ON jobs {bump}")
+
+
+def _add_full_text_index(conn: sqlite3.Connection):
+    """Adds the trigram full-text index over the free-text columns, if this SQLite build has FTS5."""
+    columns = ", ".join(FULL_TEXT_COLUMNS)
+    try:
+        conn.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS {FULL_TEXT_TABLE} USING fts5({columns}, content='jobs', content_rowid='id', tokenize='trigram')")
+    except sqlite3.OperationalError:
+        # No FTS5 or no trigram tokenizer (SQLite < 3.34): text filters keep using LIKE and --search is unavailable
+        return
+
+    # External content table: the index stores no copy of the text, triggers keep it in step with jobs
+    new_values = ", ".join(f"NEW.{c}" for c in FULL_TEXT_COLUMNS)
+    old_values = ", ".join(f"OLD.{c}" for c in FULL_TEXT_COLUMNS)
+    insert = f"INSERT INTO {FULL_TEXT_TABLE} (rowid, {columns}) VALUES (NEW.id, {new_values});"
+    delete = f"INSERT INTO {FULL_TEXT_TABLE} ({FULL_TEXT_TABLE}, rowid, {columns}) VALUES ('delete', OLD.id, {old_values});"
+    conn.execute(f"CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN {insert} END")
+    conn.execute(f"CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN {delete} END")
+    conn.execute(f"CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF {columns} ON jobs BEGIN {delete} {insert} END")
+    conn.execute(f"INSERT INTO {FULL_TEXT_TABLE} ({FULL_TEXT_TABLE}) VALUES ('rebuild')")
+
+
+def _add_fuzzy_name_index(conn: sqlite3.Connection):
+    """Adds the company/role name vocabulary behind `view --fuzzy`, and an index to fetch jobs by role name."""
+    from job_tracker.fuzzy import create_name_index
+
+    create_name_index(conn)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_role ON jobs (role_name)")
+
+
+def _rebuild_stats_rollup(conn: sqlite3.Connection):
+    """Rebuilds the stats rollup and its triggers: impossible dates (2024-02-30) no longer count as valid."""
+    from job_tracker.analytics import create_rollup
+
+    create_rollup(conn)
+
+
+def _widen_ghosting_reset(conn: sqlite3.Connection):
+    """Also resets the ghosting watermark when a response date is cleared: the row may be ghostable again."""
+    conn.execute("DROP TRIGGER IF EXISTS jobs_ghosting_reset_update")
+    conn.execute(
+        "CREATE TRIGGER jobs_ghosting_reset_update AFTER UPDATE OF status, date_applied, application_response_date, "
+        f"interview_response_date ON jobs {_GHOSTING_RESET}"
+    )
+
+
+# Ordered schema migrations. The position in this list (1-based) is the schema version
+# recorded in PRAGMA user_version once the migration has been applied.
+# CRITICAL: Never edit or reorder existing entries; append a new function instead.
+# When adding new columns via migration, update COLUMN_MAPPING and EDIT_COLUMN_ORDER in utils.py
+MIGRATIONS = [
+    _create_jobs_table,
+    _upgrade_legacy_columns,
+    _add_meta_and_ghosting_index,
+    _add_query_indexes,
+    _add_stats_rollup,
+    _add_change_counter,
+    _add_full_text_index,
+    _add_fuzzy_name_index,
+    _rebuild_stats_rollup,
+    _widen_ghosting_reset,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
 
 
 def run_migrations():
-    """Handles schema updates for existing databases."""
-    # CRITICAL: When adding new columns via migration, update EDIT_COLUMN_ORDER in utils.py
+    """Applies pending migrations, keyed on PRAGMA user_version. A no-op read when up to date."""
     with get_db() as conn:
-        # Check if interview_date exists and rename it to interview_time
-        cursor = conn.execute("PRAGMA table_info(jobs)")
-        columns = [row["name"] for row in cursor.fetchall()]
-
-        if "interview_date" in columns and "interview_time" not in columns:
-            try:
-                conn.execute("ALTER TABLE jobs RENAME COLUMN interview_date TO interview_time")
-                conn.commit()
-            except sqlite3.OperationalError:
-                pass
-
-        # Add interview_link if it doesn't exist
-        if "interview_link" not in columns:
-            try:
-                conn.execute("ALTER TABLE jobs ADD COLUMN interview_link TEXT")
-                conn.commit()
-            except sqlite3.OperationalError:
-                pass
-
-        # Add interview_event_id if it doesn't exist
-        if "interview_event_id" not in columns:
-            try:
-                conn.execute("ALTER TABLE jobs ADD COLUMN interview_event_id TEXT")
-                conn.commit()
-            except sqlite3.OperationalError:
-                pass
-
-        # Add recruiter_linkedin if it doesn't exist
-        if "recruiter_linkedin" not in columns:
-            try:
-                conn.execute("ALTER TABLE jobs ADD COLUMN recruiter_linkedin TEXT")
-                conn.commit()
-            except sqlite3.OperationalError:
-                pass
-
-        # Add expected_salary if it doesn't exist
-        if "expected_salary" not in columns:
-            try:
-                conn.execute("ALTER TABLE jobs ADD COLUMN expected_salary TEXT")
-                conn.commit()
-            except sqlite3.OperationalError:
-                pass
-
-        # Add notes if it doesn't exist
-        if "notes" not in columns:
-            try:
-                conn.execute("ALTER TABLE jobs ADD COLUMN notes TEXT")
-                conn.commit()
-            except sqlite3.OperationalError:
-                pass
-
-        # Add rating if it doesn't exist
-        if "rating" not in columns:
-            try:
-                conn.execute("ALTER TABLE jobs ADD COLUMN rating INTEGER")
-                conn.commit()
-            except sqlite3.OperationalError:
-                pass
-
-        # Add fit if it doesn't exist
-        if "fit" not in columns:
-            try:
-                conn.execute("ALTER TABLE jobs ADD COLUMN fit INTEGER")
-                conn.commit()
-            except sqlite3.OperationalError:
-                pass
-
-        # Check if transcript exists and rename it to interview_transcript
-        if "transcript" in columns and "interview_transcript" not in columns:
-            try:
-                conn.execute("ALTER TABLE jobs RENAME COLUMN transcript TO interview_transcript")
-                conn.commit()
-            except sqlite3.OperationalError:
-                pass
-
-        # Add interview_transcript if it doesn't exist
-        if "interview_transcript" not in columns:
-            try:
-                conn.execute("ALTER TABLE jobs ADD COLUMN interview_transcript TEXT")
-                conn.commit()
-            except sqlite3.OperationalError:
-                pass
-
-        # Add recruiter_phone_number if it doesn't exist
-        if "recruiter_phone_number" not in columns:
-            try:
-                conn.execute("ALTER TABLE jobs ADD COLUMN recruiter_phone_number TEXT")
-                conn.commit()
-            except sqlite3.OperationalError:
-                pass
-
-        # Add resources if it doesn't exist
-        if "resources" not in columns:
-            try:
-                conn.execute("ALTER TABLE jobs ADD COLUMN resources TEXT")
-                conn.commit()
-            except sqlite3.OperationalError:
-                pass
-
-        # Add interview_round if it doesn't exist
-        if "interview_round" not in columns:
-            try:
-                conn.execute("ALTER TABLE jobs ADD COLUMN interview_round INTEGER")
-                conn.commit()
-            except sqlite3.OperationalError:
-                pass
-
-        # Remove calendar_event_id if it exists
-        if "calendar_event_id" in columns:
-            try:
-                conn.execute("ALTER TABLE jobs DROP COLUMN calendar_event_id")
-                conn.commit()
-            except sqlite3.OperationalError:
-                pass
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version >= SCHEMA_VERSION:
+        return
+
+    # Take the write lock up front and re-check, another process may have migrated meanwhile
+    with transaction() as conn:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        for number, migration in enumerate(MIGRATIONS[version:], start=version + 1):
+            migration(conn)
+            conn.execute(f"PRAGMA user_version = {number}")
 
 
 def add_new_column(column_name: str, column_type: str, default_value: str = None):
@@ -202,10 +376,9 @@ def add_new_column(column_name: str, column_type: str, default_value: str = None
     if default_value is not None:
         query += f" DEFAULT '{default_value}'"
 
-    with get_db() as conn:
+    with transaction() as conn:
         try:
             conn.execute(query)
-            conn.commit()
         except sqlite3.OperationalError as e:
             if "duplicate column name" in str(e):
                 print(f"Column '{column_name}' already exists.")
@@ -219,12 +392,87 @@ def add_job(job_data: dict) -> int:
     placeholders = ", ".join(["?" for _ in job_data])
     query = f"INSERT INTO jobs ({columns}) VALUES ({placeholders})"
 
-    with get_db() as conn:
+    with transaction() as conn:
         cursor = conn.execute(query, list(job_data.values()))
-        conn.commit()
         return cursor.lastrowid
 
 
+def job_columns() -> list:
+    """Column names of the jobs table, in table order."""
+    with get_db() as conn:
+        return [row["name"] for row in conn.execute("PRAGMA table_info(jobs)").fetchall()]
+
+
+def _insert_replays() -> dict:
+    """
+    Set-based stand-ins for the per-row AFTER INSERT triggers on jobs, by trigger name.
+    Each takes (conn, after_id) and applies its trigger's effect for every job with id > after_id in one statement.
+    """
+    from job_tracker.analytics import ROLLUP_TRIGGERS, add_to_rollup
+    from job_tracker.fuzzy import NAMES_TABLE, add_names
+
+    def bump_generation(conn, after_id):
+        conn.execute("UPDATE meta SET value = value + 1 WHERE key = ?", (DATA_GENERATION_KEY,))
+
+    def reset_ghosting(conn, after_id):
+        conn.execute(
+            f"DELETE FROM meta WHERE key = ? AND EXISTS (SELECT 1 FROM jobs WHERE id > ? AND status = 'applied'"
+            f" AND date_applied <= date('now', 'localtime', '-{GHOSTED_AFTER_DAYS} days'))",
+            (GHOSTING_LAST_RUN_KEY, after_id),
+        )
+
+    def index_full_text(conn, after_id):
+        columns = ", ".join(FULL_TEXT_COLUMNS)
+        conn.execute(f"INSERT INTO {FULL_TEXT_TABLE} (rowid, {columns}) SELECT id, {columns} FROM jobs WHERE id > ?", (after_id,))
+
+    return {
+        "jobs_data_generation_insert": bump_generation,
+        "jobs_ghosting_reset_insert": reset_ghosting,
+        "jobs_fts_insert": index_full_text,
+        ROLLUP_TRIGGERS[0]: add_to_rollup,
+        f"{NAMES_TABLE}_insert": add_names,
+    }
+
+
+def insert_jobs(jobs, columns: list = None, batch_size: int = INSERT_BATCH_SIZE) -> int:
+    """
+    Inserts `jobs` (dicts, keyed by `columns`) with batched executemany calls inside one transaction.
+    Without `columns`, each job inserts only its own keys, so the columns it leaves out get their defaults
+    (consecutive jobs with the same keys share the executemany batches).
+    Jobs whose role_url already exists, in the database or earlier in `jobs`, are skipped. Returns the number inserted.
+
+    The per-row insert triggers (stats rollup, full-text index, ...) would dominate a bulk load, so within the
+    transaction they are dropped, replayed once over the new rows by _insert_replays(), and recreated.
+    """
+    inserted = 0
+    with transaction() as conn:
+        replays = _insert_replays()
+        triggers = conn.execute(
+            f"SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'jobs' AND name IN ({', '.join('?' for _ in replays)})",
+            list(replays),
+        ).fetchall()
+        for name, _sql in triggers:
+            conn.execute(f"DROP TRIGGER {name}")
+        # AUTOINCREMENT ids only grow, so the new rows are exactly those past the current maximum
+        after_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM jobs").fetchone()[0]
+
+        for keys, group in groupby(jobs, key=lambda job: tuple(columns or job)):
+            values = ", ".join("?" for _ in keys)
+            # One statement both inserts and dedupes; rows inserted earlier in the transaction are visible to the check
+            query = f"INSERT INTO jobs ({', '.join(keys)}) SELECT {values} WHERE NOT EXISTS (SELECT 1 FROM jobs WHERE role_url = ?)"
+            while True:
+                batch = [[job.get(c) for c in keys] + [job.get("role_url")] for job in islice(group, batch_size)]
+                if not batch:
+                    break
+                inserted += conn.executemany(query, batch).rowcount
+
+        for name, sql in triggers:
+            if inserted:
+                replays[name](conn, after_id)
+            conn.execute(sql)
+    return inserted
+
+
 def update_job(job_id: int, updates: dict):
     """Updates specific fields of a job record."""
     if not updates:
@@ -234,35 +482,114 @@ def update_job(job_id: int, updates: dict):
     query = f"UPDATE jobs SET {set_clause} WHERE id = ?"
     params = list(updates.values()) + [job_id]
 
-    with get_db() as conn:
+    with transaction() as conn:
         conn.execute(query, params)
-        conn.commit()
+
+
+def get_meta(key: str, default: str = None) -> str:
+    """Reads a value from the meta key/value table."""
+    with get_db() as conn:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else default
+
+
+def set_meta(key: str, value: str):
+    """Writes a value to the meta key/value table."""
+    with transaction() as conn:
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+
+def get_data_version() -> tuple:
+    """(schema version, data generation). Changes whenever the schema or any job changes, in any process."""
+    with get_db() as conn:
+        schema_version = conn.execute("PRAGMA schema_version").fetchone()[0]
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (DATA_GENERATION_KEY,)).fetchone()
+        return schema_version, int(row["value"]) if row else 0
 
 
 def update_ghosted_jobs():
-    """Updates status to 'ghosted' for jobs applied > 30 days ago with status 'applied' and no responses."""
+    """
+    Updates status to 'ghosted' for jobs applied > 30 days ago with status 'applied' and no responses.
+    Runs at most once per day and only re-evaluates rows that crossed the threshold since the last run.
+    """
+    today = date.today()
+    last_run = get_meta(GHOSTING_LAST_RUN_KEY)
+    if last_run == today.isoformat():
+        return
+
     query = """
-    UPDATE jobs 
-    SET status = 'ghosted' 
-    WHERE status = 'applied' 
-    AND date_applied <= date('now', '-30 days')
+    UPDATE jobs
+    SET status = 'ghosted'
+    WHERE status = 'applied'
+    AND date_applied <= ?
     AND application_response_date IS NULL
     AND interview_response_date IS NULL
     """
+    params = [(today - timedelta(days=GHOSTED_AFTER_DAYS)).isoformat()]
+
+    if last_run:
+        # Everything at or below the previous cutoff was already handled by the previous run
+        query += " AND date_applied > ?"
+        params.append((date.fromisoformat(last_run) - timedelta(days=GHOSTED_AFTER_DAYS)).isoformat())
+
+    with transaction() as conn:
+        conn.execute(query, params)
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (GHOSTING_LAST_RUN_KEY, today.isoformat()))
+
+
+def full_text_available() -> bool:
+    """True if the full-text index exists (SQLite was built with FTS5 when the database was migrated)."""
     with get_db() as conn:
-        conn.execute(query)
-        conn.commit()
+        return conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (FULL_TEXT_TABLE,)).fetchone() is not None
 
 
-def get_jobs(where_clause: str = None, params: list = None, sort_clause: str = None, limit: int = None):
-    """Retrieves jobs with dynamic filtering and sorting."""
-    query = "SELECT * FROM jobs"
+def search_expression(text: str) -> str:
+    """
+    Turns free text into an FTS5 query matching rows that contain every word as a substring.
+    Trigrams can't match words shorter than 3 characters, so those are left out.
+    """
+    words = [w for w in text.split() if len(w) >= 3]
+    if not words:
+        raise ValueError("Search needs at least one word of 3 or more characters.")
+    return " ".join('"' + w.replace('"', '""') + '"' for w in words)
+
+
+def _use_job_records(cursor: sqlite3.Cursor) -> sqlite3.Cursor:
+    """Switches an executed cursor to build slotted JobRecord rows (plain dicts if the columns can't be slots)."""
+    fields = tuple(d[0] for d in cursor.description)
+    cls = record_type(fields)
+    if cls is not None:
+        cursor.row_factory = lambda _cursor, row: cls(*row)
+    else:
+        cursor.row_factory = lambda _cursor, row: dict(zip(fields, row))
+    return cursor
+
+
+def _jobs_query(where_clause: str = None, sort_clause: str = None, limit: int = None, columns: list = None, search: bool = False) -> str:
+    """
+    Builds the SELECT statement shared by get_jobs() and iter_jobs().
+    With `search`, only full-text hits are returned (the FTS5 query is the first parameter), each with a
+    highlighted `search_snippet` and its `search_rank` (lower is better), best matches first unless a sort is given.
+    """
+    select = ", ".join(columns) if columns else "jobs.*"
+    if search:
+        weights = ", ".join(str(w) for w in FULL_TEXT_WEIGHTS)
+        snippet = f"snippet({FULL_TEXT_TABLE}, -1, '{SNIPPET_START}', '{SNIPPET_END}', '…', 12)"
+        query = (
+            f"WITH hits AS (SELECT rowid AS id, bm25({FULL_TEXT_TABLE}, {weights}) AS search_rank, {snippet} AS search_snippet"
+            f" FROM {FULL_TEXT_TABLE} WHERE {FULL_TEXT_TABLE} MATCH ?)"
+            f" SELECT {select}, search_rank, search_snippet FROM jobs JOIN hits USING (id)"
+        )
+    else:
+        query = f"SELECT {select} FROM jobs"
 
     if where_clause:
         query += f" WHERE {where_clause}"
 
     if sort_clause:
         query += f" ORDER BY {sort_clause}, id DESC"
+    elif search:
+        query += " ORDER BY search_rank, id DESC"
     else:
         # Default sort by date applied descending, then id descending
         query += " ORDER BY date_applied DESC, id DESC"
@@ -270,32 +597,59 @@ def get_jobs(where_clause: str = None, params: list = None, sort_clause: str = N
     if limit is not None:
         query += f" LIMIT {limit}"
 
+    return query
+
+
+def iter_jobs(where_clause: str = None, params: list = None, sort_clause: str = None, limit: int = None, columns: list = None, batch_size: int = FETCH_BATCH_SIZE, search: str = None, records: bool = True):
+    """
+    Streams jobs with dynamic filtering and sorting, fetching `batch_size` rows at a time.
+    Pass `search` (free text) to restrict to full-text matches, see _jobs_query().
+    With records=False rows are plain tuples in select order, for bulk consumers like exports.
+    """
+    query = _jobs_query(where_clause, sort_clause, limit, columns, search=bool(search))
+    params = list(params or [])
+    if search:
+        params.insert(0, search_expression(search))
     with get_db() as conn:
-        return [dict(row) for row in conn.execute(query, params or []).fetchall()]
+        cursor = conn.execute(query, params)
+        if records:
+            _use_job_records(cursor)
+        else:
+            cursor.row_factory = None
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+
+
+def get_jobs(where_clause: str = None, params: list = None, sort_clause: str = None, limit: int = None, columns: list = None, search: str = None):
+    """Retrieves jobs with dynamic filtering and sorting. Pass `columns` to fetch only those fields."""
+    return list(iter_jobs(where_clause, params, sort_clause, limit, columns, search=search))
 
 
 def get_job_by_id(job_id: int):
     """Retrieves a single job by its ID."""
     query = "SELECT * FROM jobs WHERE id = ?"
     with get_db() as conn:
-        row = conn.execute(query, (job_id,)).fetchone()
-        return dict(row) if row else None
+        return _use_job_records(conn.execute(query, (job_id,))).fetchone()
 
 
 def get_job_by_url(url: str):
     """Retrieves a single job by its role URL."""
     query = "SELECT * FROM jobs WHERE role_url = ?"
     with get_db() as conn:
-        row = conn.execute(query, (url,)).fetchone()
-        return dict(row) if row else None
+        return _use_job_records(conn.execute(query, (url,))).fetchone()
 
 
 def delete_job_by_id(job_id: int):
     """Deletes a single job by its ID."""
     query = "DELETE FROM jobs WHERE id = ?"
-    with get_db() as conn:
+    with transaction() as conn:
         conn.execute(query, (job_id,))
-        conn.commit()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,229 @@
+import csv
+import gzip
+import json
+import sys
+from contextlib import contextmanager
+from datetime import date, datetime
+from enum import Enum
+from itertools import chain, islice
+from operator import itemgetter
+from job_tracker.models import DATE_COLUMNS, DATETIME_COLUMNS, ENUM_COLUMNS, INTEGER_COLUMNS
+
+# Writers for `view` output and exports that bypass rich: rows go straight from the iter_jobs() stream to a text file object.
+# Each format writer takes (rows, columns, out), where columns are (header, SQL column) pairs, and returns the row count.
+
+
+class OutputFormat(str, Enum):
+    TABLE = "table"
+    PLAIN = "plain"
+    TSV = "tsv"
+    JSONL = "jsonl"
+    # Export only (--export --format parquet)
+    PARQUET = "parquet"
+
+
+# Rows sampled to size the columns of plain output, and the widest a plain column grows (like the table's truncation)
+PLAIN_SAMPLE_ROWS = 200
+PLAIN_MAX_WIDTH = 100
+
+
+def _tsv_field(value) -> str:
+    """NULL as an empty field; backslash, tab and newlines escaped so every row stays one line."""
+    if value is None:
+        return ""
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def write_tsv(rows, columns: list, out) -> int:
+    names = [column for _, column in columns]
+    out.write("\t".join(names) + "\n")
+    count = 0
+    for row in rows:
+        out.write("\t".join([_tsv_field(row[name]) for name in names]) + "\n")
+        count += 1
+    return count
+
+
+def write_jsonl(rows, columns: list, out) -> int:
+    names = [column for _, column in columns]
+    encode = json.JSONEncoder(ensure_ascii=False, default=str).encode
+    count = 0
+    for row in rows:
+        out.write(encode({name: row[name] for name in names}) + "\n")
+        count += 1
+    return count
+
+
+def _plain_field(value) -> str:
+    text = "" if value is None else " ".join(str(value).split())
+    return text if len(text) <= PLAIN_MAX_WIDTH else text[:PLAIN_MAX_WIDTH - 3] + "..."
+
+
+def write_plain(rows, columns: list, out) -> int:
+    """Space-aligned columns, sized from the first PLAIN_SAMPLE_ROWS rows so output starts without reading everything."""
+    names = [column for _, column in columns]
+    sample = [[_plain_field(row[name]) for name in names] for row in islice(rows, PLAIN_SAMPLE_ROWS)]
+    widths = [max([len(header)] + [len(values[i]) for values in sample]) for i, (header, _) in enumerate(columns)]
+
+    def line(values) -> str:
+        return "  ".join(value.ljust(width) for value, width in zip(values, widths)).rstrip() + "\n"
+
+    out.write(line([header for header, _ in columns]))
+    count = 0
+    rest = ([_plain_field(row[name]) for name in names] for row in rows)
+    for values in chain(sample, rest):
+        out.write(line(values))
+        count += 1
+    return count
+
+
+WRITERS = {
+    OutputFormat.PLAIN: write_plain,
+    OutputFormat.TSV: write_tsv,
+    OutputFormat.JSONL: write_jsonl,
+}
+
+
+# Rows handed to csv.writer.writerows() at a time
+CSV_CHUNK_ROWS = 1000
+# gzip level for .csv.gz exports: close to the best ratio on CSV text at a fraction of level 9's cost
+GZIP_LEVEL = 6
+
+
+@contextmanager
+def open_output(path: str):
+    """Text file for an export: stdout for "-", gzip-compressed for *.gz, plain otherwise."""
+    if path == "-":
+        yield sys.stdout
+        sys.stdout.flush()
+    elif path.endswith(".gz"):
+        with gzip.open(path, "wt", newline="", encoding="utf-8", compresslevel=GZIP_LEVEL) as f:
+            yield f
+    else:
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            yield f
+
+
+def write_csv(rows, header: list, out, indexes: list = None) -> int:
+    """
+    Writes the header, then `rows` (plain tuples) in chunks of CSV_CHUNK_ROWS with one csv.writer.
+    `indexes` are the tuple positions of the header columns, when they differ from the tuple order.
+    """
+    writer = csv.writer(out)
+    writer.writerow(header)
+    if indexes is not None:
+        pick = itemgetter(*indexes)
+        rows = (pick(row) for row in rows) if len(indexes) > 1 else ((row[indexes[0]],) for row in rows)
+    rows = iter(rows)
+    count = 0
+    while True:
+        chunk = list(islice(rows, CSV_CHUNK_ROWS))
+        if not chunk:
+            return count
+        writer.writerows(chunk)
+        count += len(chunk)
+
+
+# Parquet export/import needs pyarrow, an optional dependency imported only when the format is used.
+# Columns are typed from models: dates as date32, interview_time as a timestamp, integers as int64 and
+# enum columns dictionary-encoded, so analytics tools load them without re-parsing.
+PARQUET_BATCH_ROWS = 50000
+PARQUET_INSTALL_HINT = "Parquet support needs pyarrow. Please install it using 'pip install pyarrow'."
+DATETIME_FORMAT = "%Y-%m-%d %H:%M"
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(PARQUET_INSTALL_HINT) from None
+    return pyarrow
+
+
+def _parquet_type(pa, column: str):
+    if column in DATE_COLUMNS:
+        return pa.date32()
+    if column in DATETIME_COLUMNS:
+        return pa.timestamp("s")
+    if column in INTEGER_COLUMNS:
+        return pa.int64()
+    if column in ENUM_COLUMNS:
+        return pa.dictionary(pa.int32(), pa.string())
+    return pa.string()
+
+
+def _as_int(value):
+    if value is None or isinstance(value, int):
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parquet_array(pa, column: str, values: tuple):
+    """Typed array for one column of a batch, plus how many non-empty values didn't fit the type (written as null)."""
+    if column in INTEGER_COLUMNS:
+        ints = [_as_int(v) for v in values]
+        return pa.array(ints, pa.int64()), sum(1 for v, i in zip(values, ints) if i is None and v not in (None, ""))
+
+    text = pa.array([None if v is None or v == "" else str(v) for v in values], pa.string())
+    if column in DATE_COLUMNS or column in DATETIME_COLUMNS:
+        fmt = DATETIME_FORMAT if column in DATETIME_COLUMNS else "%Y-%m-%d"
+        parsed = pa.compute.strptime(text, format=fmt, unit="s", error_is_null=True)
+        # strptime rolls impossible dates over (2024-02-30 becomes 2024-03-01): keep only values that format back as read
+        parsed = pa.compute.if_else(pa.compute.equal(pa.compute.strftime(parsed, format=fmt), text), parsed, pa.scalar(None, parsed.type))
+        if column in DATE_COLUMNS:
+            parsed = parsed.cast(pa.date32())
+        return parsed, parsed.null_count - text.null_count
+    if column in ENUM_COLUMNS:
+        return text.dictionary_encode(), 0
+    return text, 0
+
+
+def write_parquet(rows, columns: list, path: str, batch_rows: int = PARQUET_BATCH_ROWS):
+    """
+    Writes `rows` (plain tuples in `columns` order) to a Parquet file, one row group per `batch_rows` rows.
+    Returns (row count, {column: values that didn't fit the column type and were written as null}).
+    """
+    pa = _import_pyarrow()
+    schema = pa.schema([(column, _parquet_type(pa, column)) for column in columns])
+    rows = iter(rows)
+    count, invalid = 0, {}
+    with pa.parquet.ParquetWriter(path, schema) as writer:
+        while True:
+            batch = list(islice(rows, batch_rows))
+            if not batch:
+                return count, invalid
+            arrays = []
+            for column, values in zip(columns, zip(*batch)):
+                array, bad = _parquet_array(pa, column, values)
+                arrays.append(array)
+                if bad:
+                    invalid[column] = invalid.get(column, 0) + bad
+            writer.write_batch(pa.record_batch(arrays, schema=schema))
+            count += len(batch)
+
+
+def _from_parquet(value):
+    """Turns a value read from Parquet back into what the jobs table stores."""
+    if isinstance(value, datetime):
+        return value.strftime(DATETIME_FORMAT)
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def read_parquet(path: str, batch_rows: int = PARQUET_BATCH_ROWS):
+    """Returns (column names, iterator of job dicts) for a Parquet file, read one batch at a time."""
+    pa = _import_pyarrow()
+    parquet_file = pa.parquet.ParquetFile(path)
+
+    def rows():
+        for batch in parquet_file.iter_batches(batch_size=batch_rows):
+            for row in batch.to_pylist():
+                yield {column: _from_parquet(value) for column, value in row.items()}
+
+    return parquet_file.schema_arrow.names, rows()
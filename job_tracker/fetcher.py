@@ -0,0 +1,240 @@
+import bisect
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+from urllib.parse import urlsplit
+
+# HTTP fetching for the scraper: one pooled requests.Session per process, so repeated fetches (add --batch)
+# reuse keep-alive connections instead of paying a TCP/TLS handshake per URL.
+# Every request has connect/read timeouts. 429 and 5xx responses and connection errors are retried with
+# jittered exponential backoff, waiting as long as the server's Retry-After asks (up to RETRY_AFTER_MAX).
+# Requests to the same host are spaced at least MIN_HOST_INTERVAL apart across threads, and every attempt's
+# latency lands in a per-host LatencyHistogram.
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+CONNECT_TIMEOUT = 5.0
+READ_TIMEOUT = 20.0
+# Attempts after the first one
+MAX_RETRIES = 3
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Full jitter: a retry waits a random time up to BACKOFF_BASE * 2**attempt, capped at BACKOFF_MAX
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 10.0
+# Longest Retry-After honoured; a server asking for more gets this instead
+RETRY_AFTER_MAX = 60.0
+# Seconds between the starts of two requests to one host
+MIN_HOST_INTERVAL = 0.5
+# Connections kept open per host, enough for the add --batch fetch pool
+POOL_SIZE = 16
+
+# Upper bounds (seconds) of the latency buckets; the last bucket is open-ended
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class LatencyHistogram:
+    """Counts of request latencies in fixed buckets. Percentiles are reported as the upper bound of their bucket."""
+
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of requests, never above the slowest one seen."""
+        with self._lock:
+            count = sum(self.counts)
+            if not count:
+                return 0.0
+            rank, seen = fraction * count, 0
+            for i, bucket_count in enumerate(self.counts):
+                seen += bucket_count
+                if seen >= rank and bucket_count:
+                    return min(self.buckets[i], self.max) if i < len(self.buckets) else self.max
+        return self.max
+
+    def summary(self) -> dict:
+        count = self.count
+        return {
+            "count": count,
+            "mean": self.total / count if count else 0.0,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "max": self.max,
+        }
+
+
+class HostRateLimiter:
+    """Spaces requests to each host at least `interval` seconds apart, across threads."""
+
+    def __init__(self, interval: float = MIN_HOST_INTERVAL, clock=time.monotonic, sleep=time.sleep):
+        self.interval = interval
+        self.clock = clock
+        self.sleep = sleep
+        self._next = {}
+        self._lock = threading.Lock()
+
+    def wait(self, host: str):
+        """Blocks until this thread may send a request to `host`."""
+        with self._lock:
+            now = self.clock()
+            start = max(now, self._next.get(host, now))
+            # Reserve the slot before sleeping, so concurrent callers queue up behind it
+            self._next[host] = start + self.interval
+        if start > now:
+            self.sleep(start - now)
+
+    def hold(self, host: str, seconds: float):
+        """Keeps every thread off `host` for `seconds` (a Retry-After)."""
+        with self._lock:
+            until = self.clock() + seconds
+            self._next[host] = max(self._next.get(host, 0.0), until)
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Seconds asked for by a Retry-After header (delta-seconds or an HTTP date), or None if absent or unreadable."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def response_bytes(response) -> int:
+    """Body bytes a response took on the wire: its Content-Length (compressed size when gzipped), else the body read."""
+    length = response.headers.get("Content-Length")
+    if length and length.isdigit():
+        return int(length)
+    return len(response.content)
+
+
+class Fetcher:
+    """
+    GETs pages over a pooled session with timeouts, retries and per-host rate limiting.
+    `sleep` and `clock` can be swapped out to test the retry and rate-limit timing without waiting.
+    """
+
+    def __init__(
+        self,
+        connect_timeout: float = CONNECT_TIMEOUT,
+        read_timeout: float = READ_TIMEOUT,
+        max_retries: int = MAX_RETRIES,
+        backoff_base: float = BACKOFF_BASE,
+        host_interval: float = MIN_HOST_INTERVAL,
+        pool_size: int = POOL_SIZE,
+        sleep=time.sleep,
+        clock=time.monotonic,
+    ):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.sleep = sleep
+        self.limiter = HostRateLimiter(host_interval, clock=clock, sleep=sleep)
+        self.histograms = {}
+        self.retries = 0
+        self._lock = threading.Lock()
+
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+        # Retries are done here, where Retry-After and the rate limiter are honoured
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def histogram(self, host: str) -> LatencyHistogram:
+        with self._lock:
+            if host not in self.histograms:
+                self.histograms[host] = LatencyHistogram()
+            return self.histograms[host]
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(BACKOFF_MAX, self.backoff_base * 2**attempt))
+
+    def get(self, url: str, headers: dict = None):
+        """
+        The response for `url`. Raises requests.HTTPError for an error status that is not retried (or still
+        failing after MAX_RETRIES), and the last requests.ConnectionError/Timeout if every attempt failed to connect.
+        """
+        import requests
+
+        host = urlsplit(url).netloc.lower()
+        histogram = self.histogram(host)
+        attempt = 0
+        while True:
+            self.limiter.wait(host)
+            started = time.perf_counter()
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                histogram.record(time.perf_counter() - started)
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+            else:
+                histogram.record(time.perf_counter() - started)
+                if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                    response.raise_for_status()
+                    return response
+                retry_after = retry_after_seconds(response.headers.get("Retry-After"))
+                if retry_after is not None:
+                    # The whole host is saturated, not just this request: the limiter makes every thread wait
+                    self.limiter.hold(host, min(retry_after, RETRY_AFTER_MAX))
+                    delay = 0.0
+                else:
+                    delay = self._backoff(attempt)
+                response.close()
+
+            with self._lock:
+                self.retries += 1
+            attempt += 1
+            if delay:
+                self.sleep(delay)
+
+    def latency_summary(self) -> dict:
+        """Per-host latency summary (count, mean, p50, p95, max in seconds) of every attempt so far."""
+        with self._lock:
+            hosts = dict(self.histograms)
+        return {host: histogram.summary() for host, histogram in hosts.items()}
+
+
+_fetcher = None
+_fetcher_lock = threading.Lock()
+
+
+def get_fetcher() -> Fetcher:
+    """The process-wide Fetcher, created on first use."""
+    global _fetcher
+    with _fetcher_lock:
+        if _fetcher is None:
+            _fetcher = Fetcher()
+        return _fetcher
+
+
+def active_fetcher() -> Optional[Fetcher]:
+    """The process-wide Fetcher if anything has fetched yet, else None."""
+    return _fetcher
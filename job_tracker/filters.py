@@ -0,0 +1,334 @@
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Any, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from job_tracker.database import FULL_TEXT_COLUMNS, FULL_TEXT_TABLE, full_text_available, job_columns
+from job_tracker.models import DATE_COLUMNS, DATETIME_COLUMNS
+from job_tracker.utils import COLUMN_MAPPING, resolve_date, resolve_datetime, validate_date, validate_datetime
+
+# Filter language shared by `view` and `stats`.
+#
+#   expr       := or
+#   or         := and (OR and)*
+#   and        := not (AND not)*
+#   not        := NOT not | primary
+#   primary    := "(" expr ")" | condition
+#   condition  := column (==|!=|>=|<=|>|<) value
+#               | column (~|:) value                  substring match (LIKE %value%)
+#               | column : [min-max]                  inclusive range
+#               | column [NOT] IN (value, ...)
+#               | column IS [NOT] NULL
+#
+# Keywords are case-insensitive. Values run up to the next AND/OR (or the closing parenthesis of a group)
+# and may be quoted to include those. Columns accept the CLI aliases from COLUMN_MAPPING, and must exist in jobs.
+# Substring matches on columns covered by the full-text index are answered by its trigrams instead of a LIKE scan.
+
+COMPARISON_OPS = {"==": "=", "!=": "!=", ">=": ">=", "<=": "<=", ">": ">", "<": "<"}
+LIKE_OPS = ("~", ":")
+
+_COLUMN_RE = re.compile(r"(\w+)\s*")
+_OP_RE = re.compile(r"(==|!=|>=|<=|>|<|~|:)\s*")
+_IS_NULL_RE = re.compile(r"IS\s+(NOT\s+)?NULL\b", re.IGNORECASE)
+_IN_RE = re.compile(r"(NOT\s+)?IN\s*\(", re.IGNORECASE)
+_VALUE_END_RE = re.compile(r"\s+(?:AND|OR)(?=[\s(]|$)", re.IGNORECASE)
+_KEYWORD_RES = {word: re.compile(rf"\s*{word}(?=[\s(]|$)", re.IGNORECASE) for word in ("AND", "OR", "NOT")}
+
+
+class FilterError(ValueError):
+    """A filter string that can't be parsed. The message points at the offending position."""
+
+
+# AST nodes. Values are kept as typed; relative dates are resolved when compiling.
+class Comparison(NamedTuple):
+    column: str
+    op: str
+    value: str
+
+
+class Range(NamedTuple):
+    column: str
+    low: str
+    high: str
+
+
+class InList(NamedTuple):
+    column: str
+    values: Tuple[str, ...]
+    negated: bool
+
+
+class IsNull(NamedTuple):
+    column: str
+    negated: bool
+
+
+class Not(NamedTuple):
+    operand: Any
+
+
+class And(NamedTuple):
+    operands: Tuple[Any, ...]
+
+
+class Or(NamedTuple):
+    operands: Tuple[Any, ...]
+
+
+class _Parser:
+    def __init__(self, text: str, columns: FrozenSet[str]):
+        self.text = text
+        self.columns = columns
+        self.pos = 0
+        self.depth = 0
+
+    def error(self, message: str):
+        raise FilterError(f"{message} at position {self.pos + 1}: {self.text[:self.pos]}»{self.text[self.pos:]}")
+
+    def skip_whitespace(self):
+        while self.pos < len(self.text) and self.text[self.pos].isspace():
+            self.pos += 1
+
+    def keyword(self, word: str) -> bool:
+        match = _KEYWORD_RES[word].match(self.text, self.pos)
+        if match:
+            self.pos = match.end()
+        return bool(match)
+
+    def parse(self):
+        node = self.parse_or()
+        self.skip_whitespace()
+        if self.pos < len(self.text):
+            self.error("Unexpected input")
+        return node
+
+    def parse_or(self):
+        operands = [self.parse_and()]
+        while self.keyword("OR"):
+            operands.append(self.parse_and())
+        return Or(tuple(operands)) if len(operands) > 1 else operands[0]
+
+    def parse_and(self):
+        operands = [self.parse_not()]
+        while self.keyword("AND"):
+            operands.append(self.parse_not())
+        return And(tuple(operands)) if len(operands) > 1 else operands[0]
+
+    def parse_not(self):
+        if self.keyword("NOT"):
+            return Not(self.parse_not())
+        return self.parse_primary()
+
+    def parse_primary(self):
+        self.skip_whitespace()
+        if self.text.startswith("(", self.pos):
+            self.pos += 1
+            self.depth += 1
+            node = self.parse_or()
+            self.skip_whitespace()
+            if not self.text.startswith(")", self.pos):
+                self.error("Expected ')'")
+            self.pos += 1
+            self.depth -= 1
+            return node
+        return self.parse_condition()
+
+    def parse_condition(self):
+        match = _COLUMN_RE.match(self.text, self.pos)
+        if not match:
+            self.error("Expected a condition like 'column==value'")
+        name = match.group(1)
+        column = COLUMN_MAPPING.get(name.lower(), name)
+        if column not in self.columns:
+            self.error(f"Unknown column '{name}'")
+        self.pos = match.end()
+
+        match = _IS_NULL_RE.match(self.text, self.pos)
+        if match:
+            self.pos = match.end()
+            return IsNull(column, bool(match.group(1)))
+
+        match = _IN_RE.match(self.text, self.pos)
+        if match:
+            self.pos = match.end()
+            return InList(column, self.parse_list(), bool(match.group(1)))
+
+        match = _OP_RE.match(self.text, self.pos)
+        if not match:
+            self.error(f"Expected an operator (==, !=, >=, <=, >, <, ~, :, IN, IS NULL) after '{name}'")
+        op = match.group(1)
+        self.pos = match.end()
+
+        if op == ":" and self.text.startswith("[", self.pos):
+            return self.parse_range(column)
+        return Comparison(column, op, self.parse_value())
+
+    def parse_quoted(self) -> Optional[str]:
+        quote = self.text[self.pos] if self.pos < len(self.text) else ""
+        if quote not in ("'", '"'):
+            return None
+        end = self.text.find(quote, self.pos + 1)
+        if end == -1:
+            self.error("Unterminated quote")
+        value = self.text[self.pos + 1 : end]
+        self.pos = end + 1
+        return value
+
+    def parse_value(self) -> str:
+        quoted = self.parse_quoted()
+        if quoted is not None:
+            return quoted
+
+        match = _VALUE_END_RE.search(self.text, self.pos)
+        end = match.start() if match else len(self.text)
+        if self.depth:
+            # Inside a group the closing parenthesis ends the value too
+            paren = self.text.find(")", self.pos, end)
+            end = paren if paren != -1 else end
+        value = self.text[self.pos : end].strip()
+        if not value:
+            self.error("Missing value")
+        self.pos = end
+        return value
+
+    def parse_list(self) -> Tuple[str, ...]:
+        values = []
+        while True:
+            self.skip_whitespace()
+            value = self.parse_quoted()
+            if value is None:
+                end = min((i for i in (self.text.find(",", self.pos), self.text.find(")", self.pos)) if i != -1), default=-1)
+                if end == -1:
+                    self.error("Expected ')' to close the IN list")
+                value = self.text[self.pos : end].strip()
+                if not value:
+                    self.error("Missing value in IN list")
+                self.pos = end
+            values.append(value)
+            self.skip_whitespace()
+            if self.text.startswith(",", self.pos):
+                self.pos += 1
+            elif self.text.startswith(")", self.pos):
+                self.pos += 1
+                return tuple(values)
+            else:
+                self.error("Expected ',' or ')' in IN list")
+
+    def parse_range(self, column: str):
+        end = self.text.find("]", self.pos)
+        if end == -1:
+            self.error("Expected ']' to close the range")
+        body = self.text[self.pos + 1 : end]
+        if "-" not in body:
+            # Not a range, just a substring that happens to start with '['
+            return Comparison(column, ":", self.parse_value())
+        bounds = _split_range(column, body)
+        if not bounds:
+            self.error(f"Expected a range like [min-max], got [{body}]")
+        self.pos = end + 1
+        return Range(column, *bounds)
+
+
+def _split_range(column: str, body: str) -> Optional[Tuple[str, str]]:
+    """
+    Splits 'min-max' at the dash that separates the bounds. Dates contain dashes themselves, so for date
+    columns the first split leaving two valid dates wins ('2024-01-01-2024-02-01').
+    """
+    if column in DATETIME_COLUMNS:
+        valid = lambda v: validate_datetime(v) or validate_date(v)  # noqa: E731
+    elif column in DATE_COLUMNS:
+        valid = validate_date
+    else:
+        valid = bool
+
+    for index in (i for i, char in enumerate(body) if char == "-"):
+        low, high = body[:index].strip(), body[index + 1 :].strip()
+        if low and high and valid(low) and valid(high):
+            return low, high
+    return None
+
+
+@lru_cache(maxsize=256)
+def parse_filter(filter_str: str, columns: FrozenSet[str]):
+    """Parses a filter string over the given jobs `columns` into its AST. Raises FilterError on invalid input."""
+    return _Parser(filter_str, columns).parse()
+
+
+def _resolve(column: str, value: str) -> Optional[str]:
+    """Resolves relative dates ('today', 'yesterday', weekdays) for date/datetime columns."""
+    if column in DATETIME_COLUMNS:
+        return resolve_datetime(value)
+    if column in DATE_COLUMNS:
+        return resolve_date(value)
+    return value
+
+
+def resolve(node):
+    """Returns the AST with relative dates resolved against today's date."""
+    if isinstance(node, Comparison):
+        return node._replace(value=_resolve(node.column, node.value))
+    if isinstance(node, Range):
+        return node._replace(low=_resolve(node.column, node.low), high=_resolve(node.column, node.high))
+    if isinstance(node, InList):
+        return node._replace(values=tuple(_resolve(node.column, v) for v in node.values))
+    if isinstance(node, Not):
+        return Not(resolve(node.operand))
+    if isinstance(node, (And, Or)):
+        return type(node)(tuple(resolve(operand) for operand in node.operands))
+    return node
+
+
+def _uses_full_text(node: Comparison) -> bool:
+    # Trigrams need 3 literal characters, and LIKE wildcards in the value would change the meaning
+    return node.column in FULL_TEXT_COLUMNS and len(node.value) >= 3 and "%" not in node.value and "_" not in node.value
+
+
+def to_sql(node, params: List[Any], full_text: bool = False, negated: bool = False) -> str:
+    """
+    Compiles a resolved AST to a parameterized SQL expression, appending its parameters to `params`.
+    With `full_text`, eligible substring matches query the full-text index instead of scanning with LIKE.
+    """
+    if isinstance(node, Comparison):
+        if node.op in LIKE_OPS:
+            params.append(f"%{node.value}%")
+            # The index answers FALSE where LIKE on a NULL column is NULL. Only NOT can tell them apart.
+            if full_text and not negated and _uses_full_text(node):
+                return f"id IN (SELECT rowid FROM {FULL_TEXT_TABLE} WHERE {node.column} LIKE ?)"
+            return f"{node.column} LIKE ?"
+        if node.value is None and node.op in ("==", "!="):
+            # A null-like value ('-', 'none', ...) on a date column
+            return f"{node.column} IS {'NOT ' if node.op == '!=' else ''}NULL"
+        params.append(node.value)
+        return f"{node.column} {COMPARISON_OPS[node.op]} ?"
+    if isinstance(node, Range):
+        params.extend([node.low, node.high])
+        return f"({node.column} >= ? AND {node.column} <= ?)"
+    if isinstance(node, InList):
+        params.extend(node.values)
+        return f"{node.column} {'NOT ' if node.negated else ''}IN ({', '.join('?' for _ in node.values)})"
+    if isinstance(node, IsNull):
+        return f"{node.column} IS {'NOT ' if node.negated else ''}NULL"
+    if isinstance(node, Not):
+        return f"NOT ({to_sql(node.operand, params, full_text, not negated)})"
+    if isinstance(node, And):
+        # AND binds tighter than OR, so only OR groups need parentheses here
+        return " AND ".join(f"({to_sql(o, params, full_text, negated)})" if isinstance(o, Or) else to_sql(o, params, full_text, negated) for o in node.operands)
+    return " OR ".join(to_sql(o, params, full_text, negated) for o in node.operands)
+
+
+@lru_cache(maxsize=256)
+def _compiled(filter_str: str, today: date, full_text: bool, columns: FrozenSet[str]) -> Tuple[str, Tuple[Any, ...]]:
+    params = []
+    sql = to_sql(resolve(parse_filter(filter_str, columns)), params, full_text)
+    return sql, tuple(params)
+
+
+def compile_filter(filter_str: str) -> Tuple[str, List[Any]]:
+    """
+    Compiles a filter string to (where_clause, params). Memoized per day, as relative dates depend on it.
+    Raises FilterError for invalid input, including columns the jobs table doesn't have.
+    """
+    if not filter_str or not filter_str.strip():
+        return "", []
+    sql, params = _compiled(filter_str, date.today(), full_text_available(), frozenset(job_columns()))
+    return sql, list(params)
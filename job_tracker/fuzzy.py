@@ -0,0 +1,154 @@
+import sqlite3
+from job_tracker.database import get_db
+
+# Typo-tolerant lookup of company and role names (`view --fuzzy`).
+# NAMES_TABLE holds each distinct name once with a use count, kept current by triggers on jobs, so lookups
+# scan the (small) vocabulary instead of the jobs table. NAMES_INDEX is an FTS5 trigram index over it that
+# narrows the vocabulary down to names sharing trigrams with the query; those are then scored in Python.
+
+FUZZY_COLUMNS = ("company_name", "role_name")
+NAMES_TABLE = "job_names"
+NAMES_INDEX = "job_names_fts"
+
+# Share of the query's trigrams a name must contain to count as a near match
+MIN_SIMILARITY = 0.5
+# Candidates pulled from the trigram index per lookup, and near matches kept
+MAX_CANDIDATES = 200
+MAX_MATCHES = 20
+
+
+def _name_delta(column: str, prefix: str, sign: str) -> str:
+    """Statements adding (+) or removing (-) one use of the row's name in `column`."""
+    name = f"{prefix}{column}"
+    if sign == "+":
+        return (
+            f"INSERT INTO {NAMES_TABLE} (field, name, uses) SELECT '{column}', {name}, 1 WHERE COALESCE({name}, '') != ''"
+            f" ON CONFLICT (field, name) DO UPDATE SET uses = uses + 1;"
+        )
+    return (
+        f"UPDATE {NAMES_TABLE} SET uses = uses - 1 WHERE field = '{column}' AND name = {name};"
+        f" DELETE FROM {NAMES_TABLE} WHERE field = '{column}' AND name = {name} AND uses <= 0;"
+    )
+
+
+def create_name_index(conn: sqlite3.Connection):
+    """Creates the name vocabulary, its trigram index (if SQLite has FTS5) and the triggers on jobs, then fills them."""
+    conn.execute(
+        f"CREATE TABLE IF NOT EXISTS {NAMES_TABLE} (id INTEGER PRIMARY KEY, field TEXT NOT NULL, name TEXT NOT NULL,"
+        f" uses INTEGER NOT NULL, UNIQUE (field, name))"
+    )
+    try:
+        conn.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS {NAMES_INDEX} USING fts5(name, content='{NAMES_TABLE}', content_rowid='id', tokenize='trigram')")
+    except sqlite3.OperationalError:
+        # No FTS5/trigram: lookups score the whole vocabulary instead
+        pass
+    else:
+        # Names are never renamed in place (only their use count changes), so inserts and deletes are enough
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS {NAMES_TABLE}_fts_insert AFTER INSERT ON {NAMES_TABLE} BEGIN INSERT INTO {NAMES_INDEX} (rowid, name) VALUES (NEW.id, NEW.name); END")
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS {NAMES_TABLE}_fts_delete AFTER DELETE ON {NAMES_TABLE} BEGIN INSERT INTO {NAMES_INDEX} ({NAMES_INDEX}, rowid, name) VALUES ('delete', OLD.id, OLD.name); END")
+
+    added = " ".join(_name_delta(c, "NEW.", "+") for c in FUZZY_COLUMNS)
+    removed = " ".join(_name_delta(c, "OLD.", "-") for c in FUZZY_COLUMNS)
+    conn.execute(f"CREATE TRIGGER IF NOT EXISTS {NAMES_TABLE}_insert AFTER INSERT ON jobs BEGIN {added} END")
+    conn.execute(f"CREATE TRIGGER IF NOT EXISTS {NAMES_TABLE}_delete AFTER DELETE ON jobs BEGIN {removed} END")
+    for column in FUZZY_COLUMNS:
+        # One trigger per column, so editing other fields (or one name) leaves the rest of the vocabulary alone
+        changed = f"{_name_delta(column, 'OLD.', '-')} {_name_delta(column, 'NEW.', '+')}"
+        conn.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {NAMES_TABLE}_update_{column} AFTER UPDATE OF {column} ON jobs"
+            f" WHEN OLD.{column} IS NOT NEW.{column} BEGIN {changed} END"
+        )
+
+    # Refill from scratch, so calling this again rebuilds the vocabulary
+    conn.execute(f"DELETE FROM {NAMES_TABLE}")
+    add_names(conn, 0)
+
+
+def add_names(conn: sqlite3.Connection, after_id: int):
+    """Counts the names of every job with id > after_id into the vocabulary at once (the set-based insert trigger)."""
+    for column in FUZZY_COLUMNS:
+        conn.execute(
+            f"INSERT INTO {NAMES_TABLE} (field, name, uses) SELECT '{column}', {column}, COUNT(*) FROM jobs"
+            f" WHERE id > ? AND COALESCE({column}, '') != '' GROUP BY {column} ON CONFLICT (field, name) DO UPDATE SET uses = uses + excluded.uses",
+            (after_id,),
+        )
+
+
+def trigrams(text: str) -> set:
+    """Lowercased trigrams of each word, padded like pg_trgm so word starts and ends weigh in ("  g", " go", ..., "le ")."""
+    grams = set()
+    for word in text.lower().split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def similarity(query: set, name: str) -> tuple:
+    """(share of the query's trigrams found in name, Jaccard similarity). The second breaks ties in favour of shorter names."""
+    grams = trigrams(name)
+    shared = len(query & grams)
+    return shared / len(query), shared / len(query | grams)
+
+
+def _candidates(conn: sqlite3.Connection, text: str, columns: tuple) -> list:
+    """(field, name) pairs worth scoring: names sharing at least one trigram with the query, or the whole vocabulary without FTS5."""
+    fields = ", ".join("?" for _ in columns)
+    has_index = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (NAMES_INDEX,)).fetchone()
+    if not has_index:
+        return conn.execute(f"SELECT field, name FROM {NAMES_TABLE} WHERE field IN ({fields})", columns).fetchall()
+
+    # The trigram tokenizer sees no padding, so only trigrams inside words are searchable
+    inner = {g for g in trigrams(text) if " " not in g}
+    if not inner:
+        return []
+    expression = " OR ".join('"' + g.replace('"', '""') + '"' for g in sorted(inner))
+    # The field restriction sits inside the ranked query, so the candidate limit counts only names of those fields
+    return conn.execute(
+        f"SELECT n.field, n.name FROM {NAMES_INDEX} JOIN {NAMES_TABLE} n ON n.id = {NAMES_INDEX}.rowid"
+        f" WHERE {NAMES_INDEX} MATCH ? AND n.field IN ({fields}) ORDER BY {NAMES_INDEX}.rank LIMIT {MAX_CANDIDATES}",
+        (expression, *columns),
+    ).fetchall()
+
+
+def near_names(text: str, columns: tuple = FUZZY_COLUMNS) -> list:
+    """
+    Names in `columns` that resemble `text`, as (column, name, score) with the closest first.
+    Raises ValueError if the text is too short to compare.
+    """
+    query = trigrams(text)
+    if not any(len(word) >= 3 for word in text.split()):
+        raise ValueError("Fuzzy search needs at least one word of 3 or more characters.")
+
+    with get_db() as conn:
+        candidates = _candidates(conn, text, tuple(columns))
+
+    scored = []
+    for column, name in candidates:
+        score, tie_break = similarity(query, name)
+        if score >= MIN_SIMILARITY:
+            scored.append((score, tie_break, column, name))
+    scored.sort(key=lambda s: (-s[0], -s[1], s[3]))
+    return [(column, name, round(score, 2)) for score, _tie_break, column, name in scored[:MAX_MATCHES]]
+
+
+def fuzzy_clauses(matches: list):
+    """
+    WHERE and ORDER BY clauses selecting the jobs that carry any of `matches` (from near_names()), best score first.
+    Returns (where_clause, where_params, sort_clause, sort_params).
+    """
+    by_column = {}
+    for column, name, score in matches:
+        by_column.setdefault(column, []).append((name, score))
+
+    where_parts, where_params, ranks, sort_params = [], [], [], []
+    for column, names in by_column.items():
+        where_parts.append(f"{column} IN ({', '.join('?' for _ in names)})")
+        where_params.extend(name for name, _score in names)
+        ranks.append(f"COALESCE(CASE {column} {' '.join('WHEN ? THEN ?' for _ in names)} END, 0)")
+        for name, score in names:
+            sort_params.extend((name, score))
+
+    where_clause = "(" + " OR ".join(where_parts) + ")"
+    # Scalar MAX() needs two arguments, a single column is ranked directly
+    rank = f"MAX({', '.join(ranks)})" if len(ranks) > 1 else ranks[0]
+    return where_clause, where_params, f"{rank} DESC, date_applied DESC", sort_params
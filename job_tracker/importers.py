@@ -0,0 +1,202 @@
+import csv
+import gzip
+import json
+from datetime import date, datetime
+from functools import lru_cache
+from job_tracker.models import DATE_COLUMNS, DATETIME_COLUMNS, ENUM_COLUMNS, INTEGER_COLUMNS
+from job_tracker.utils import COLUMN_MAPPING, NULL_STRINGS, resolve_date, resolve_datetime, validate_date, validate_datetime
+
+# Reading and validating job files for `import`.
+# Every reader returns (column names, iterator of (line number, raw row dict)). Rows are then checked like the
+# interactive `add` prompts: NULL_STRINGS clear a field, enums must be one of the models values, dates are ISO or
+# relative (validate_date()/resolve_date()), and rating/fit are 1-5 with 0 meaning unset. Each column's check is
+# built once, since a bulk file runs it for every field.
+
+SCORE_COLUMNS = ("rating", "fit")
+DEFAULT_STATUS = "applied"
+DATETIME_FORMAT = "%Y-%m-%d %H:%M"
+
+
+def _open_text(path: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", newline="", encoding="utf-8")
+    return open(path, newline="", encoding="utf-8")
+
+
+def read_csv(path: str):
+    """CSV with a header row (column names or COLUMN_MAPPING aliases). Plain or .csv.gz."""
+    f = _open_text(path)
+    reader = csv.DictReader(f)
+
+    def rows():
+        with f:
+            # Line 1 is the header
+            for line, row in enumerate(reader, start=2):
+                if None in row:
+                    # DictReader keeps fields beyond the header under the key None
+                    row = ValueError(f"{len(row[None])} more fields than the header's {len(reader.fieldnames)}")
+                yield line, row
+
+    return reader.fieldnames or [], rows()
+
+
+def read_jsonl(path: str):
+    """One JSON object per line. Keys are column names or COLUMN_MAPPING aliases."""
+
+    def rows():
+        with _open_text(path) as f:
+            for line, text in enumerate(f, start=1):
+                if not text.strip():
+                    continue
+                try:
+                    row = json.loads(text)
+                except ValueError as e:
+                    row = ValueError(f"invalid JSON ({e})")
+                if not isinstance(row, (dict, ValueError)):
+                    row = ValueError("expected a JSON object")
+                yield line, row
+
+    # Keys can differ per line, so the columns are only known row by row
+    return None, rows()
+
+
+def read_parquet(path: str):
+    """A Parquet file, as written by `view --export --format parquet` (needs pyarrow)."""
+    from job_tracker.exporters import read_parquet as read_parquet_rows
+
+    names, rows = read_parquet_rows(path)
+    return names, enumerate(rows, start=1)
+
+
+READERS = {
+    ".csv": read_csv,
+    ".jsonl": read_jsonl,
+    ".ndjson": read_jsonl,
+    ".parquet": read_parquet,
+}
+
+
+def reader_for(path: str):
+    """The reader for a file name (a trailing .gz is allowed for CSV and JSONL), or None."""
+    name = path.lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+        if name.endswith(".parquet"):
+            return None
+    for suffix, reader in READERS.items():
+        if name.endswith(suffix):
+            return reader
+    return None
+
+
+def resolve_column(name: str):
+    """The jobs column for a file column (its own name or a COLUMN_MAPPING alias), or None if unknown."""
+    key = name.strip().lower()
+    if key in COLUMN_MAPPING:
+        return COLUMN_MAPPING[key]
+    if key in COLUMN_MAPPING.values():
+        return key
+    return None
+
+
+# utils.is_null_string() as a set lookup, blank included
+_NULL_VALUES = frozenset(NULL_STRINGS) | {""}
+
+
+def _is_null(value) -> bool:
+    return value is None or (isinstance(value, str) and value.strip().lower() in _NULL_VALUES)
+
+
+def _check_enum(column: str):
+    allowed = [e.value for e in ENUM_COLUMNS[column]]
+    allowed_set = frozenset(allowed)
+
+    def check(value):
+        text = str(value).strip().lower()
+        if text not in allowed_set:
+            raise ValueError(f"{column} must be one of {', '.join(allowed)}, got '{value}'")
+        return text
+
+    return check
+
+
+def _check_date(column: str):
+    def check(value):
+        text = str(value).strip()
+        try:
+            # Stored canonically, fromisoformat also accepts forms like 20240131
+            return date.fromisoformat(text).isoformat()
+        except ValueError:
+            pass
+        # Relative dates ('today', weekdays) as in the prompts
+        if not validate_date(text):
+            raise ValueError(f"{column} must be a YYYY-MM-DD date, got '{value}'")
+        return resolve_date(text)
+
+    return check
+
+
+def _check_datetime(column: str):
+    def check(value):
+        text = str(value).strip()
+        if len(text) == 16 and text[10] == " ":
+            try:
+                datetime.strptime(text, DATETIME_FORMAT)
+                return text
+            except ValueError:
+                pass
+        if not validate_datetime(text):
+            raise ValueError(f"{column} must be YYYY-MM-DD HH:MM, got '{value}'")
+        return resolve_datetime(text)
+
+    return check
+
+
+def _check_integer(column: str):
+    def check(value):
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{column} must be a whole number, got '{value}'") from None
+        if column in SCORE_COLUMNS:
+            if number == 0:
+                return None
+            if not 1 <= number <= 5:
+                raise ValueError(f"{column} must be between 1 and 5 (or 0 to skip), got {number}")
+        return number
+
+    return check
+
+
+def _check_text(value):
+    return value if isinstance(value, str) else str(value)
+
+
+@lru_cache(maxsize=None)
+def _validator(column: str):
+    """The check for one column's non-null values: returns the value to store or raises ValueError naming the problem."""
+    if column in ENUM_COLUMNS:
+        return _check_enum(column)
+    if column in DATE_COLUMNS:
+        return _check_date(column)
+    if column in DATETIME_COLUMNS:
+        return _check_datetime(column)
+    if column in INTEGER_COLUMNS:
+        return _check_integer(column)
+    return _check_text
+
+
+def validate_job(row: dict, columns: dict) -> dict:
+    """
+    Validates one raw row. `columns` maps the row's keys to jobs columns (None for keys to ignore).
+    Returns the job to insert, or raises ValueError describing the first bad field.
+    """
+    job = {}
+    for key, value in row.items():
+        column = columns.get(key)
+        if column is not None:
+            job[column] = None if _is_null(value) else _validator(column)(value)
+    # Like the column default, which an explicit NULL (a blank status) would bypass; a missing status gets the real one
+    if "status" in job and job["status"] is None:
+        job["status"] = DEFAULT_STATUS
+    return job
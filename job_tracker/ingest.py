@@ -0,0 +1,266 @@
+import sqlite3
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import date
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
+from job_tracker.database import add_job, get_db, savepoint, transaction
+from job_tracker.models import Arrangement, ExperienceLevel, JobType, Source, Status
+from job_tracker.page_cache import LINKEDIN_JOB_URL, linkedin_job_id
+from job_tracker.utils import is_null_string, resolve_date, validate_date
+
+# Non-interactive bulk ingestion behind `add --batch`.
+# Pages are fetched and parsed by a pool of FETCH_WORKERS threads; each parsed page is handed to a smaller pool
+# of LLM_WORKERS threads for enrichment, so slow LLM calls overlap with fetching but never exceed that bound.
+# Finished jobs get the values `add` proposes at every prompt (as if Enter was pressed throughout) and are
+# inserted from the calling thread, COMMIT_EVERY jobs per transaction (each in its own savepoint, so one failing insert
+# doesn't take the rest of the batch with it).
+
+FETCH_WORKERS = 8
+LLM_WORKERS = 4
+COMMIT_EVERY = 20
+# URLs per "already tracked" lookup: well under SQLITE_MAX_VARIABLE_NUMBER (999 before SQLite 3.32)
+LOOKUP_CHUNK = 500
+USER_PROFILE_PATH = Path("user_profile.md")
+
+# What `add` offers when the scraped value is missing or not one of the choices
+ENUM_DEFAULTS = {
+    "arrangement": (Arrangement, Arrangement.REMOTE.value),
+    "type": (JobType, JobType.FULLTIME.value),
+    "level": (ExperienceLevel, ExperienceLevel.MID_LEVEL.value),
+    "source": (Source, Source.LINKEDIN.value),
+}
+TEXT_FIELDS = (
+    "company_name",
+    "role_name",
+    "company_url",
+    "company_linkedin",
+    "location",
+    "recruiter_name",
+    "recruiter_email",
+    "recruiter_linkedin",
+    "recruiter_phone_number",
+    "expected_salary",
+    "notes",
+)
+DEFAULT_APPLICATION_METHOD = "easy apply"
+
+ADDED = "added"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+
+class IngestResult(NamedTuple):
+    url: str
+    outcome: str  # ADDED, SKIPPED or FAILED
+    job_id: Optional[int] = None
+    detail: str = ""
+    fetch_seconds: float = 0.0
+    enrich_seconds: float = 0.0
+    total_seconds: float = 0.0
+    # LLM tokens used, and LLM fields skipped because the page already had them (see llm.missing_fields())
+    llm_tokens: int = 0
+    fields_skipped: int = 0
+    # Where the page came from (scraper.GUEST or FULL_PAGE), bytes transferred for it (0 from the page cache),
+    # and the time extract_html_data() took (not part of fetch_seconds)
+    page_source: str = ""
+    page_bytes: int = 0
+    parse_seconds: float = 0.0
+
+
+def read_url_file(path: Path) -> list:
+    """URLs from a file, one per line. Blank lines and # comments are ignored, repeats are dropped."""
+    lines = (line.strip() for line in path.read_text(encoding="utf-8").splitlines())
+    return list(dict.fromkeys(line for line in lines if line and not line.startswith("#")))
+
+
+def job_url(url: str) -> str:
+    """The role URL a job is saved under: LinkedIn links in their canonical /jobs/view/<id>/ form, others as given."""
+    job_id = linkedin_job_id(url)
+    return LINKEDIN_JOB_URL.format(job_id) if job_id else url.strip()
+
+
+def tracked_job(conn, url: str):
+    """The id of the job already saved for `url` (as given or in its job_url() form), or None."""
+    row = conn.execute("SELECT id FROM jobs WHERE role_url IN (?, ?)", (url, job_url(url))).fetchone()
+    return row[0] if row else None
+
+
+def load_user_profile() -> str:
+    """The user's profile for fit/rating, or "" when user_profile.md is missing."""
+    if USER_PROFILE_PATH.exists():
+        return USER_PROFILE_PATH.read_text(encoding="utf-8")
+    return ""
+
+
+def _score(value) -> Optional[int]:
+    try:
+        score = int(value)
+    except (TypeError, ValueError):
+        return None
+    return score if 1 <= score <= 5 else None
+
+
+def default_job(url: str, scraped: dict) -> dict:
+    """The job `add --url` would save if every prompt was answered with its default."""
+    job = {field: scraped.get(field) or None for field in TEXT_FIELDS}
+    job["role_url"] = job_url(url)
+    for field, (enum_cls, default) in ENUM_DEFAULTS.items():
+        value = str(scraped.get(field) or "").lower()
+        job[field] = value if value in [e.value for e in enum_cls] else default
+    job["status"] = Status.APPLIED.value
+
+    date_posted = scraped.get("date_posted") or ""
+    job["date_posted"] = resolve_date(date_posted) if date_posted and not is_null_string(date_posted) and validate_date(date_posted) else None
+    job["date_applied"] = date.today().isoformat()
+    job["rating"] = _score(scraped.get("rating"))
+    job["fit"] = _score(scraped.get("fit"))
+    job["application_method"] = DEFAULT_APPLICATION_METHOD
+    return {k: (None if is_null_string(v) else v) for k, v in job.items()}
+
+
+def _scrape(url: str, refresh: bool):
+    from job_tracker import scraper
+
+    page = {}
+    started = time.perf_counter()
+    html = scraper.fetch_job_page(url, refresh=refresh, stats=page)
+    fetched = time.perf_counter()
+    html_data = scraper.extract_html_data(html)
+    page["fetch_seconds"], page["parse_seconds"] = fetched - started, time.perf_counter() - fetched
+    return html_data, page
+
+
+def _page_stats(page: dict) -> dict:
+    """IngestResult fields for a fetched page (from _scrape())."""
+    return {"fetch_seconds": page["fetch_seconds"], "page_source": page.get("source", ""), "page_bytes": page.get("bytes", 0), "parse_seconds": page["parse_seconds"]}
+
+
+def _enrich(html_data: dict, user_profile: str):
+    from job_tracker import llm
+
+    started = time.perf_counter()
+    page_usage = {}
+    llm_data = llm.enrich_job_data(html_data, user_profile, page_usage)
+    return llm_data, time.perf_counter() - started, page_usage
+
+
+def _commit(batch: list) -> list:
+    """
+    Inserts a batch of (url, job, stats) in one transaction. URLs tracked meanwhile (by another process) are skipped.
+    A job whose insert fails is reported FAILED and the others still commit; if the transaction itself can't be
+    started or committed (the database stayed busy), every job in the batch is.
+    """
+    settled = []
+    for url, job, (page, enrich_seconds, page_usage, started) in batch:
+        stats = dict(
+            _page_stats(page),
+            enrich_seconds=enrich_seconds,
+            total_seconds=time.perf_counter() - started,
+            llm_tokens=page_usage.get("input_tokens", 0) + page_usage.get("output_tokens", 0),
+            fields_skipped=page_usage.get("fields_skipped", 0),
+        )
+        settled.append((url, job, stats))
+
+    results = []
+    try:
+        with transaction() as conn:
+            for url, job, stats in settled:
+                try:
+                    with savepoint(conn, "ingest_job"):
+                        if tracked_job(conn, url) is not None:
+                            results.append(IngestResult(url, SKIPPED, None, "already tracked", **stats))
+                        else:
+                            job_id = add_job(job)
+                            results.append(IngestResult(url, ADDED, job_id, job.get("company_name") or "", **stats))
+                except sqlite3.Error as e:
+                    results.append(IngestResult(url, FAILED, None, f"save: {e}", **stats))
+    except sqlite3.Error as e:
+        return [IngestResult(url, FAILED, None, f"save: {e}", **stats) for url, job, stats in settled]
+    return results
+
+
+def ingest_urls(
+    urls: list,
+    user_profile: str = "",
+    fetch_workers: int = FETCH_WORKERS,
+    llm_workers: int = LLM_WORKERS,
+    commit_every: int = COMMIT_EVERY,
+    on_result: Callable = None,
+    refresh: bool = False,
+) -> list:
+    """
+    Scrapes, enriches and saves every URL, returning an IngestResult per URL in input order.
+    URLs already tracked, or naming the same posting as an earlier URL (see job_url()), are skipped without fetching.
+    `on_result` is called with each result as it is settled.
+    Pages come from the page cache unless `refresh` is set.
+    Timings are per stage (fetch, parse, LLM), and total_seconds is when the URL was settled, counted from the start of the run.
+    """
+    on_result = on_result or (lambda result: None)
+    # Links to one posting (tracking parameters, /jobs/view/<slug>-<id> vs <id>) are fetched and saved once
+    firsts = {}
+    for url in urls:
+        firsts.setdefault(job_url(url), url)
+    candidates = list(set(urls) | firsts.keys())
+    tracked = set()
+    with get_db() as conn:
+        for start in range(0, len(candidates), LOOKUP_CHUNK):
+            chunk = candidates[start : start + LOOKUP_CHUNK]
+            tracked.update(row[0] for row in conn.execute(f"SELECT role_url FROM jobs WHERE role_url IN ({', '.join('?' for _ in chunk)})", chunk))
+
+    results = {}
+
+    def settle(result: IngestResult):
+        results[result.url] = result
+        on_result(result)
+
+    pending_urls = []
+    for url in urls:
+        if url in results:
+            continue
+        if url in tracked or job_url(url) in tracked:
+            settle(IngestResult(url, SKIPPED, None, "already tracked"))
+        elif firsts[job_url(url)] != url:
+            settle(IngestResult(url, SKIPPED, None, f"same posting as {firsts[job_url(url)]}"))
+        else:
+            pending_urls.append(url)
+
+    batch = []
+    with ThreadPoolExecutor(max_workers=fetch_workers, thread_name_prefix="fetch") as fetch_pool, ThreadPoolExecutor(max_workers=llm_workers, thread_name_prefix="llm") as llm_pool:
+        started = time.perf_counter()
+        fetches = {fetch_pool.submit(_scrape, url, refresh): url for url in pending_urls}
+        enrichments = {}
+        pending = set(fetches)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in fetches:
+                    url = fetches.pop(future)
+                    try:
+                        html_data, page = future.result()
+                    except Exception as e:
+                        settle(IngestResult(url, FAILED, None, f"fetch: {e}", total_seconds=time.perf_counter() - started))
+                        continue
+                    enrichment = llm_pool.submit(_enrich, html_data, user_profile)
+                    enrichments[enrichment] = (url, html_data, page)
+                    pending.add(enrichment)
+                    continue
+
+                url, html_data, page = enrichments.pop(future)
+                try:
+                    llm_data, enrich_seconds, page_usage = future.result()
+                except Exception as e:
+                    settle(IngestResult(url, FAILED, None, f"enrich: {e}", total_seconds=time.perf_counter() - started, **_page_stats(page)))
+                    continue
+                # Merged like `add`: LLM values override the page's
+                job = default_job(url, {**html_data, **llm_data})
+                batch.append((url, job, (page, enrich_seconds, page_usage, started)))
+                if len(batch) >= commit_every:
+                    # Reported only once committed
+                    for result in _commit(batch):
+                        settle(result)
+                    batch = []
+
+    for result in _commit(batch) if batch else []:
+        settle(result)
+    return [results[url] for url in urls if url in results]
@@ -1,6 +1,7 @@
 import os
 import json
 import datetime
+import threading
 from openai import OpenAI
 from dotenv import load_dotenv
 
@@ -9,22 +10,128 @@ load_dotenv()
 client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
 
-def enrich_job_data(html_data: dict, user_profile_text: str) -> dict:
+# Response schema of each field the LLM can fill. The judgement fields always need it; the others are asked
+# for only when the page didn't already provide a valid value (see missing_fields()).
+FIELD_SCHEMAS = {
+    "arrangement": {
+        "type": ["string", "null"],
+        "enum": ["remote", "hybrid", "onsite", None],
+        "description": "Work arrangement. Null if inconclusive.",
+    },
+    "expected_salary": {
+        "type": ["string", "null"],
+        "description": "Expected salary range or amount. This does not need to be a value, it can be anything, like '[amount] to [amount] (salary base) + [allowance] + [benefits]'. Null if inconclusive.",
+    },
+    "date_posted": {
+        "type": "string",
+        "description": "Calculated exact date (YYYY-MM-DD) based on 'date_posted_raw' and 'current_date'.",
+    },
+    "notes": {
+        "type": "string",
+        "description": "A hyper concise summary of the job, highlighting key tech stack and responsibilities. What makes this job unique? What is super important about this post that isn't already in the title or in the other fields? Maximum of 10 words.",
+    },
+    "rating": {
+        "type": "integer",
+        "minimum": 1,
+        "maximum": 5,
+        "description": "General opportunity rating, based on how good the job seems and how good the company is to work at. How much do I want to work here compared to other opportunities? Note that how I fit the job description has nothing to do with this rating. Imagine that I am already hired for this position, how would i rate my day to day life doing this job in this company? 5 is best, 1 is worst.",
+    },
+    "fit": {
+        "type": "integer",
+        "minimum": 1,
+        "maximum": 5,
+        "description": "Fit with user profile. How well does the job match the user's skills, experience, and preferences? Consider skills required, amount of experience, and other relevant factors. Put yourself in the shoes of the recruiter analysing my application for this job post. How well does this candidate fit? 5 is good match, 1 is poor match.",
+    },
+    "type": {
+        "type": ["string", "null"],
+        "enum": ["fulltime", "contract", "part-time", "freelance", None],
+        "description": "Employment type. Null if inconclusive.",
+    },
+    "level": {
+        "type": ["string", "null"],
+        "enum": ["internship", "junior", "mid level", "senior", "lead", "manager", None],
+        "description": "Seniority level. Null if inconclusive.",
+    },
+    "recruiter_name": {"type": ["string", "null"]},
+    "recruiter_email": {"type": ["string", "null"]},
+    "recruiter_linkedin": {"type": ["string", "null"]},
+    "recruiter_phone_number": {"type": ["string", "null"]},
+}
+JUDGEMENT_FIELDS = ("notes", "rating", "fit")
+MODEL = "gpt-5-nano"
+
+# Calls, tokens and fields asked for vs already known, over every enrich_job_data() call in this process
+_usage = {"calls": 0, "input_tokens": 0, "output_tokens": 0, "fields_requested": 0, "fields_skipped": 0, "schema_chars_saved": 0}
+_usage_lock = threading.Lock()
+
+
+def _known(field: str, value) -> bool:
+    """Whether the page's value for `field` is usable as is: present, one of the enum values, a YYYY-MM-DD date."""
+    if value in (None, ""):
+        return False
+    allowed = FIELD_SCHEMAS[field].get("enum")
+    if allowed is not None:
+        return value in allowed
+    if field == "date_posted":
+        try:
+            datetime.date.fromisoformat(value)
+        except (TypeError, ValueError):
+            return False
+    return True
+
+
+def missing_fields(html_data: dict) -> list:
+    """The fields to ask the LLM for: the judgement fields, plus every other field without a usable value."""
+    return [field for field in FIELD_SCHEMAS if field in JUDGEMENT_FIELDS or not _known(field, html_data.get(field))]
+
+
+def usage() -> dict:
+    """Totals of LLM calls, tokens and skipped fields so far in this process."""
+    with _usage_lock:
+        return dict(_usage)
+
+
+def _record(fields: int, skipped: int, saved_chars: int, response=None) -> dict:
+    tokens = getattr(response, "usage", None)
+    page = {
+        "calls": 1 if response is not None else 0,
+        "input_tokens": getattr(tokens, "input_tokens", 0) or 0,
+        "output_tokens": getattr(tokens, "output_tokens", 0) or 0,
+        "fields_requested": fields,
+        "fields_skipped": skipped,
+        "schema_chars_saved": saved_chars,
+    }
+    with _usage_lock:
+        for key, value in page.items():
+            _usage[key] += value
+    return page
+
+
+def enrich_job_data(html_data: dict, user_profile_text: str, page_usage: dict = None) -> dict:
     """
     Uses an LLM to extract missing fields, infer data, and generate insights.
+    Fields the page already states validly (e.g. from its JSON-LD) are left out of the request.
+    If `page_usage` is given, it is filled with this call's tokens and requested/skipped field counts.
     """
     current_date = datetime.date.today().isoformat()
+    fields = missing_fields(html_data)
+    skipped = [field for field in FIELD_SCHEMAS if field not in fields]
+    # Roughly what the skipped fields would have added to the request's schema
+    saved_chars = sum(len(json.dumps({field: FIELD_SCHEMAS[field]})) for field in skipped)
 
     # Prepare context
-    context = {"current_date": current_date, "date_posted_raw": html_data.get("date_posted_raw"), "job_description": html_data.get("job_description"), "user_profile": user_profile_text, "extracted_data": {k: v for k, v in html_data.items() if k != "job_description"}}  # Exclude large text from this summary
+    context = {"current_date": current_date, "job_description": html_data.get("job_description"), "user_profile": user_profile_text, "extracted_data": {k: v for k, v in html_data.items() if k != "job_description"}}  # Exclude large text from this summary
+    if "date_posted" in fields:
+        context["date_posted_raw"] = html_data.get("date_posted_raw")
 
     instructions = "You are a career assistant. Your goal is to extract structured job details from a job description " "and analyze the fit based on the user's profile.\n" "You will be provided with the job description, some already extracted data, and the user's profile.\n" "Respond in strict JSON only, matching the provided schema."
 
     user_prompt = f"Here is the job and user context:\n{json.dumps(context, default=str)}"
 
+    response = None
     try:
         response = client.responses.create(
-            model="gpt-5-nano",
+            model=MODEL,
             input=[
                 {"role": "system", "content": instructions},
                 {"role": "user", "content": user_prompt},
@@ -35,52 +142,8 @@ def enrich_job_data(html_data: dict, user_profile_text: str) -> dict:
                     "type": "json_schema",
                     "schema": {
                         "type": "object",
-                        "properties": {
-                            "arrangement": {
-                                "type": ["string", "null"],
-                                "enum": ["remote", "hybrid", "onsite", None],
-                                "description": "Work arrangement. Null if inconclusive.",
-                            },
-                            "expected_salary": {
-                                "type": ["string", "null"],
-                                "description": "Expected salary range or amount. This does not need to be a value, it can be anything, like '[amount] to [amount] (salary base) + [allowance] + [benefits]'. Null if inconclusive.",
-                            },
-                            "date_posted": {
-                                "type": "string",
-                                "description": "Calculated exact date (YYYY-MM-DD) based on 'date_posted_raw' and 'current_date'.",
-                            },
-                            "notes": {
-                                "type": "string",
-                                "description": "A hyper concise summary of the job, highlighting key tech stack and responsibilities. What makes this job unique? What is super important about this post that isn't already in the title or in the other fields? Maximum of 10 words.",
-                            },
-                            "rating": {
-                                "type": "integer",
-                                "minimum": 1,
-                                "maximum": 5,
-                                "description": "General opportunity rating, based on how good the job seems and how good the company is to work at. How much do I want to work here compared to other opportunities? Note that how I fit the job description has nothing to do with this rating. Imagine that I am already hired for this position, how would i rate my day to day life doing this job in this company? 5 is best, 1 is worst.",
-                            },
-                            "fit": {
-                                "type": "integer",
-                                "minimum": 1,
-                                "maximum": 5,
-                                "description": "Fit with user profile. How well does the job match the user's skills, experience, and preferences? Consider skills required, amount of experience, and other relevant factors. Put yourself in the shoes of the recruiter analysing my application for this job post. How well does this candidate fit? 5 is good match, 1 is poor match.",
-                            },
-                            "type": {
-                                "type": ["string", "null"],
-                                "enum": ["fulltime", "contract", "part-time", "freelance", None],
-                                "description": "Employment type. Null if inconclusive.",
-                            },
-                            "level": {
-                                "type": ["string", "null"],
-                                "enum": ["internship", "junior", "mid level", "senior", "lead", "manager", None],
-                                "description": "Seniority level. Null if inconclusive.",
-                            },
-                            "recruiter_name": {"type": ["string", "null"]},
-                            "recruiter_email": {"type": ["string", "null"]},
-                            "recruiter_linkedin": {"type": ["string", "null"]},
-                            "recruiter_phone_number": {"type": ["string", "null"]},
-                        },
-                        "required": ["arrangement", "recruiter_email", "expected_salary", "date_posted", "notes", "rating", "fit", "type", "level", "recruiter_name", "recruiter_linkedin", "recruiter_phone_number"],
+                        "properties": {field: FIELD_SCHEMAS[field] for field in fields},
+                        "required": fields,
                         "additionalProperties": False,
                     },
                     "strict": True,
@@ -96,3 +159,7 @@ def enrich_job_data(html_data: dict, user_profile_text: str) -> dict:
     except Exception as e:
         print(f"Error calling LLM: {e}")
         return {}
+    finally:
+        recorded = _record(len(fields), len(skipped), saved_chars, response)
+        if page_usage is not None:
+            page_usage.update(recorded)
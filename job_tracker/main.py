@@ -1,6 +1,6 @@
 import typer
 from job_tracker.database import initialize_db, update_ghosted_jobs
-from job_tracker.commands import add, edit, view, delete, stats, config, transcript
+from job_tracker.commands import add, edit, view, delete, stats, config, transcript, import_jobs
 
 app = typer.Typer(
     help="Job Search Tracker CLI Application",
@@ -14,18 +14,23 @@ app.command(name="view")(view.view)
 app.command(name="delete")(delete.delete)
 app.command(name="stats")(stats.stats)
 app.command(name="transcript")(transcript.transcript)
+app.command(name="import")(import_jobs.import_jobs)
 
 # Add command groups
 app.add_typer(config.app, name="config")
 
+# Commands that only read from the database and must never take a write lock
+READ_ONLY_COMMANDS = {"view", "stats"}
+
 
 @app.callback()
-def main():
+def main(ctx: typer.Context):
     """
     Initialize the application.
     """
     initialize_db()
-    update_ghosted_jobs()
+    if ctx.invoked_subcommand not in READ_ONLY_COMMANDS:
+        update_ghosted_jobs()
 
 
 if __name__ == "__main__":
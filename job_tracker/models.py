@@ -1,4 +1,7 @@
+import keyword
 from enum import Enum
+from functools import lru_cache
+from typing import Optional, Tuple
 
 
 class Arrangement(str, Enum):
@@ -41,3 +44,92 @@ class Status(str, Enum):
     INTERVIEWING = "interviewing"
     OFFERED = "offered"
     GHOSTED = "ghosted"
+
+
+# Typed columns of the jobs table. SQLite keeps dates as YYYY-MM-DD text and enums as their values;
+# editing, importing and typed exports use these to validate and convert.
+ENUM_COLUMNS = {"arrangement": Arrangement, "type": JobType, "level": ExperienceLevel, "source": Source, "status": Status}
+DATE_COLUMNS = ("date_posted", "date_applied", "application_response_date", "interview_response_date", "followup_date")
+DATETIME_COLUMNS = ("interview_time",)
+INTEGER_COLUMNS = ("id", "rating", "fit", "interview_round")
+
+
+class JobRecord:
+    """
+    Compact job row. Concrete subclasses with one slot per selected column are generated by record_type(),
+    so a row costs a fixed-size object instead of a hash table, while keeping dict-style access
+    (job["status"], job.get("notes"), job.keys()) for existing callers.
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+    _field_set: frozenset = frozenset()
+
+    def __getitem__(self, key):
+        if key not in self._field_set:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self._field_set:
+            raise KeyError(f"{key} is not a column of this record")
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self._field_set
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __eq__(self, other):
+        if isinstance(other, (JobRecord, dict)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self):
+        return f"JobRecord({', '.join(f'{k}={v!r}' for k, v in self.items())})"
+
+    def __reduce__(self):
+        return (_rebuild_record, (self._fields, self.values()))
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self._field_set else default
+
+    def keys(self):
+        return list(self._fields)
+
+    def values(self):
+        return [getattr(self, f) for f in self._fields]
+
+    def items(self):
+        return [(f, getattr(self, f)) for f in self._fields]
+
+
+# Names that would shadow JobRecord's mapping methods if used as slots
+_RESERVED_FIELDS = {name for name in dir(JobRecord) if not name.startswith("__")}
+
+
+@lru_cache(maxsize=None)
+def record_type(fields: Tuple[str, ...]) -> Optional[type]:
+    """Returns the slotted JobRecord subclass for a column tuple, or None if the columns can't be slots."""
+    if len(set(fields)) != len(fields):
+        return None
+    for name in fields:
+        if not name.isidentifier() or keyword.iskeyword(name) or name.startswith("_") or name in _RESERVED_FIELDS:
+            return None
+
+    # Generated __init__ assigns slots positionally, like collections.namedtuple
+    args = ", ".join(f"_{i}" for i in range(len(fields)))
+    body = "\n".join(f"    self.{name} = _{i}" for i, name in enumerate(fields)) or "    pass"
+    namespace = {}
+    exec(f"def __init__(self, {args}):\n{body}", namespace)
+
+    return type("JobRecord", (JobRecord,), {"__slots__": fields, "__init__": namespace["__init__"], "_fields": fields, "_field_set": frozenset(fields)})
+
+
+def _rebuild_record(fields, values):
+    cls = record_type(tuple(fields))
+    return cls(*values) if cls else dict(zip(fields, values))
@@ -0,0 +1,210 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from job_tracker.database import DB_PATH
+from job_tracker.fetcher import response_bytes
+
+# On-disk cache of fetched job pages, next to the database (like the result cache in cache.py).
+# Each entry is one gzip file named by the hash of the normalized job URL, holding the HTML with its ETag and
+# Last-Modified. Entries younger than PAGE_TTL are used without touching the network; older ones are revalidated
+# with a conditional GET, and a 304 keeps the stored page. Reads refresh an entry's mtime, and the least recently
+# used entries are evicted once the directory grows past MAX_BYTES.
+PAGES_DIR = DB_PATH.parent / ".cache" / "pages"
+COUNTERS_FILE = "counters.json"
+MAX_BYTES = 64 * 1024 * 1024
+PAGE_TTL = float(os.getenv("JOB_TRACKER_PAGE_TTL", 24 * 60 * 60))
+
+# Set JOB_TRACKER_PAGE_CACHE=0 to always fetch
+ENABLED = os.getenv("JOB_TRACKER_PAGE_CACHE", "1") != "0"
+
+# LinkedIn job pages are addressed by the numeric id at the end of /jobs/view/<slug-or-id>, or by currentJobId
+LINKEDIN_JOB_PATH = re.compile(r"/jobs/view/(?:[^/]*?-)?(\d+)/?$")
+LINKEDIN_JOB_URL = "https://www.linkedin.com/jobs/view/{}/"
+# Prefixes (lowercase) of query parameters that only track where a link was clicked
+TRACKING_PARAMS = ("utm_", "trk", "refid", "trackingid")
+
+_counters_lock = threading.Lock()
+
+
+def linkedin_job_id(url: str) -> Optional[str]:
+    """The numeric id of a LinkedIn job link (/jobs/view/<slug-or-id> or ?currentJobId=<id>), or None for other URLs."""
+    parts = urlsplit(url.strip())
+    if not parts.netloc.lower().endswith("linkedin.com"):
+        return None
+    match = LINKEDIN_JOB_PATH.search(parts.path)
+    if match:
+        return match.group(1)
+    for name, value in parse_qsl(parts.query):
+        if name == "currentJobId" and value.isdigit():
+            return value
+    return None
+
+
+def normalize_job_url(url: str) -> str:
+    """
+    The canonical form of a job URL, so links to the same posting share an entry: LinkedIn links become
+    https://www.linkedin.com/jobs/view/<id>/; others lose tracking parameters, the fragment and a trailing slash.
+    """
+    job_id = linkedin_job_id(url)
+    if job_id:
+        return LINKEDIN_JOB_URL.format(job_id)
+
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    kept = sorted((name, value) for name, value in query if not name.lower().startswith(TRACKING_PARAMS))
+    return urlunsplit((parts.scheme.lower() or "https", host, parts.path.rstrip("/") or "/", urlencode(kept), ""))
+
+
+def _entry_path(url: str) -> Path:
+    return PAGES_DIR / f"{hashlib.sha256(normalize_job_url(url).encode()).hexdigest()[:32]}.json.gz"
+
+
+def _count(event: str):
+    with _counters_lock:
+        counters = read_counters()
+        counters[event] = counters.get(event, 0) + 1
+        try:
+            (PAGES_DIR / COUNTERS_FILE).write_text(json.dumps(counters))
+        except OSError:
+            pass
+
+
+def _read(path: Path):
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, EOFError):
+        # Truncated or corrupt, fetch again and overwrite it
+        path.unlink(missing_ok=True)
+        return None
+
+
+def _write(path: Path, entry: dict):
+    try:
+        PAGES_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8", compresslevel=6) as f:
+            json.dump(entry, f)
+        os.replace(tmp, path)
+        _prune()
+    except OSError:
+        # The cache is best effort, a read-only or full disk must not break the command
+        pass
+
+
+def _prune():
+    """Drops the least recently used entries until the cache fits in MAX_BYTES."""
+    entries = []
+    for path in PAGES_DIR.glob("*.json.gz"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= MAX_BYTES:
+            return
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def _record(stats: Optional[dict], cache: str, response=None):
+    if stats is not None:
+        stats["cache"] = cache
+        stats["bytes"] = stats.get("bytes", 0) + (response_bytes(response) if response is not None else 0)
+
+
+def get_page(url: str, fetcher, refresh: bool = False, stats: dict = None) -> str:
+    """
+    The HTML of `url`: from the cache while fresh, else fetched with `fetcher` (a fetcher.Fetcher) and stored.
+    A stale entry is revalidated with If-None-Match/If-Modified-Since. refresh=True skips the cache for the read.
+    If given, `stats` gets how the page was served ("cache": hit, revalidated, miss or off) and adds the body
+    bytes transferred to "bytes".
+    """
+    if not ENABLED:
+        response = fetcher.get(url)
+        _record(stats, "off", response)
+        return response.text
+
+    path = _entry_path(url)
+    entry = None if refresh else _read(path)
+    now = time.time()
+    if entry and now - entry["fetched_at"] < PAGE_TTL:
+        try:
+            # Marks the entry as recently used
+            os.utime(path)
+        except OSError:
+            pass
+        _count("hits")
+        _record(stats, "hit")
+        return entry["html"]
+
+    headers = {}
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry and entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    response = fetcher.get(url, headers=headers or None)
+
+    if response.status_code == 304 and entry:
+        entry["fetched_at"] = now
+        _write(path, entry)
+        _count("revalidated")
+        _record(stats, "revalidated", response)
+        return entry["html"]
+
+    html = response.text
+    _write(
+        path,
+        {
+            "url": normalize_job_url(url),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": now,
+            "html": html,
+        },
+    )
+    _count("misses")
+    _record(stats, "miss", response)
+    return html
+
+
+def read_counters() -> dict:
+    """Hit/revalidation/miss counters since the page cache was last cleared."""
+    try:
+        return json.loads((PAGES_DIR / COUNTERS_FILE).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def cache_info() -> dict:
+    """Entry count, total size in bytes and hit/revalidated/miss counters."""
+    entries = list(PAGES_DIR.glob("*.json.gz")) if PAGES_DIR.exists() else []
+    counters = read_counters()
+    return {
+        "entries": len(entries),
+        "bytes": sum(p.stat().st_size for p in entries),
+        "hits": counters.get("hits", 0),
+        "revalidated": counters.get("revalidated", 0),
+        "misses": counters.get("misses", 0),
+    }
+
+
+def clear_cache():
+    """Deletes every cached page and resets the counters."""
+    if not PAGES_DIR.exists():
+        return
+    for path in PAGES_DIR.iterdir():
+        if path.name.endswith((".json.gz", ".tmp")) or path.name == COUNTERS_FILE:
+            path.unlink(missing_ok=True)
@@ -0,0 +1,168 @@
+import math
+from job_tracker.database import get_jobs
+
+# Keyset ("seek") pagination behind the interactive `view` pager.
+# A page is fetched by resuming strictly after the sort key of the row before it, never with OFFSET, so the
+# database does not produce and discard every earlier row. `id` is always the last key, which makes the order total.
+# Keys are (column, descending) pairs as returned by utils.parse_sort_keys().
+
+DEFAULT_KEYS = [("date_applied", True)]
+
+
+def keyset_segments(keys: list, values: tuple) -> list:
+    """
+    The rows that sort strictly after `values` under `keys`, as (WHERE clause, params) segments in sort order:
+    ties on every earlier key and past the last one first, then ties on one key fewer, and so on.
+    Each segment is a plain index range, where a single OR of them would make SQLite scan from the top.
+    NULL-aware: SQLite orders NULL before any value, so NULLs come first ascending and last descending.
+    """
+    segments = []
+    for i in reversed(range(len(keys))):
+        column, desc = keys[i]
+        value = values[i]
+        if value is None:
+            # Nothing sorts after NULL in descending order
+            afters = [] if desc else [(f"{column} IS NOT NULL", [])]
+        elif desc:
+            afters = [(f"{column} < ?", [value]), (f"{column} IS NULL", [])]
+        else:
+            afters = [(f"{column} > ?", [value])]
+        ties = [f"{c} IS ?" for c, _ in keys[:i]]
+        for after, after_params in afters:
+            segments.append((" AND ".join(ties + [after]), list(values[:i]) + after_params))
+    return segments
+
+
+def _reversed(keys: list) -> list:
+    return [(column, not desc) for column, desc in keys]
+
+
+def _order_by(keys: list) -> str:
+    return ", ".join(f"{column} {'DESC' if desc else 'ASC'}" for column, desc in keys)
+
+
+class KeysetPager:
+    """
+    Pages through the jobs matching a filter, `page_size` rows at a time.
+    Remembers where each visited page starts, so going back or jumping to a visited page is one query.
+    """
+
+    def __init__(self, where_clause: str, params: list, keys: list, columns: list, page_size: int, search: str = None):
+        self.where_clause = where_clause
+        self.params = list(params or [])
+        self.keys = list(keys or DEFAULT_KEYS)
+        if self.keys[-1][0] != "id":
+            self.keys.append(("id", True))
+        # search_rank is computed by the search query and always selected with it
+        self.key_columns = [c for c, _ in self.keys if c != "search_rank"]
+        self.columns = list(dict.fromkeys(list(columns) + self.key_columns)) if columns else None
+        self.page_size = page_size
+        self.search = search
+
+        self.page = 0
+        self.rows = []
+        # Page number -> sort key of the last row before it (None for the first page)
+        self.boundaries = {1: None}
+        self._total = None
+
+    def _key(self, row) -> tuple:
+        return tuple(row[column] for column, _ in self.keys)
+
+    def _query(self, keys: list, predicate: str, predicate_params: list, limit: int, columns: list) -> list:
+        where_parts = [f"({self.where_clause})"] if self.where_clause else []
+        if predicate:
+            where_parts.append(predicate)
+        return get_jobs(
+            where_clause=" AND ".join(where_parts) or None,
+            params=self.params + predicate_params,
+            sort_clause=_order_by(keys),
+            limit=limit,
+            columns=columns or self.columns,
+            search=self.search,
+        )
+
+    def _fetch(self, keys: list, after: tuple = None, limit: int = None, columns: list = None) -> list:
+        """Up to `limit` rows (default a page) in `keys` order, strictly after the `after` sort key if given."""
+        limit = limit or self.page_size
+        if after is None:
+            return self._query(keys, None, [], limit, columns)
+        rows = []
+        for predicate, predicate_params in keyset_segments(keys, after):
+            rows += self._query(keys, predicate, predicate_params, limit - len(rows), columns)
+            if len(rows) >= limit:
+                break
+        return rows
+
+    def _show(self, page: int, rows: list) -> list:
+        if rows:
+            self.page, self.rows = page, rows
+            self.boundaries[page + 1] = self._key(rows[-1])
+        return rows
+
+    def total(self) -> int:
+        """Number of matching rows, counted on first use since only jumping to the end needs it."""
+        if self._total is None:
+            if self.search:
+                # bm25() can't run inside an aggregate, count the hits instead
+                self._total = len(get_jobs(where_clause=self.where_clause, params=self.params, columns=["id"], search=self.search))
+            else:
+                self._total = get_jobs(where_clause=self.where_clause, params=self.params, columns=["COUNT(*) AS total"])[0]["total"]
+        return self._total
+
+    def pages(self) -> int:
+        return max(1, math.ceil(self.total() / self.page_size))
+
+    def _boundary_before(self, page: int, first_row):
+        """Records where `page` starts, given its first row: the key of the row just before it."""
+        if page > 1:
+            before = self._fetch(_reversed(self.keys), after=self._key(first_row), limit=1, columns=self.key_columns)
+            if before:
+                self.boundaries[page] = self._key(before[0])
+
+    def first(self) -> list:
+        return self._show(1, self._fetch(self.keys))
+
+    def next(self) -> list:
+        """The page after the current one, or [] (staying put) at the end."""
+        if not self.rows:
+            return self.first()
+        return self._show(self.page + 1, self._fetch(self.keys, after=self._key(self.rows[-1])))
+
+    def previous(self) -> list:
+        """The page before the current one, or [] (staying put) on the first page."""
+        page = self.page - 1
+        if page < 1:
+            return []
+        if page in self.boundaries:
+            return self._show(page, self._fetch(self.keys, after=self.boundaries[page]))
+        # Not visited yet (we jumped to the end): read backwards from the current first row
+        rows = self._fetch(_reversed(self.keys), after=self._key(self.rows[0]))[::-1]
+        self._boundary_before(page, rows[0])
+        return self._show(page, rows)
+
+    def last(self) -> list:
+        """The last page, read backwards. It holds the same rows as when paging forward to it."""
+        pages = self.pages()
+        size = self.total() - (pages - 1) * self.page_size
+        rows = self._fetch(_reversed(self.keys), limit=size)[::-1]
+        if rows:
+            self._boundary_before(pages, rows[0])
+        return self._show(pages, rows)
+
+    def jump(self, page: int) -> list:
+        """
+        Page `page` (1-based). Starts from the closest visited page before it and skips ahead by
+        fetching only the sort keys of the pages in between.
+        """
+        page = max(1, page)
+        known = max(p for p in self.boundaries if p <= page)
+        after = self.boundaries[known]
+        for skipped in range(known, page):
+            keys_only = self._fetch(self.keys, after=after, columns=self.key_columns)
+            if len(keys_only) < self.page_size:
+                # Past the end: show the last page that exists
+                return self.last()
+            after = self._key(keys_only[-1])
+            self.boundaries[skipped + 1] = after
+        rows = self._fetch(self.keys, after=after)
+        return self._show(page, rows) if rows or page == 1 else self.last()
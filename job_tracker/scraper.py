@@ -1,126 +1,343 @@
-import requests
-from bs4 import BeautifulSoup
+import json
+import math
+import os
+import re
+from datetime import date
+from html import unescape
+from importlib.util import find_spec
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from job_tracker.fetcher import get_fetcher
 
 
-def fetch_job_page(url: str) -> str:
+# LinkedIn serves each posting's details on their own at the guest endpoint below: an HTML fragment with the top card,
+# description, criteria and recruiter card, a fraction of the size of the public page (no head, scripts, navigation
+# or "similar jobs"). LinkedIn links are fetched from it, and from the full page if it fails (any request error) or lacks the top card.
+# The fragment has no JSON-LD though, so the LLM is asked for the type, date and salary that the full page's JobPosting
+# would have stated (see extract_job_posting()). Set JOB_TRACKER_LINKEDIN_GUEST=0 to read the full page instead.
+LINKEDIN_GUEST = os.getenv("JOB_TRACKER_LINKEDIN_GUEST", "1") != "0"
+LINKEDIN_GUEST_URL = "https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{}"
+GUEST_MARKER = "top-card-layout__title"
+GUEST = "guest"
+FULL_PAGE = "page"
+
+
+def fetch_job_page(url: str, refresh: bool = False, stats: dict = None) -> str:
     """
-    Fetches the LinkedIn job page content.
+    Fetches the LinkedIn job page content, through the shared pooled fetcher (timeouts, retries, rate limiting).
+    LinkedIn job links are read from the guest job-posting fragment (unless LINKEDIN_GUEST is off), falling back to the full page.
+    Pages come from the on-disk page cache while fresh; refresh=True fetches again regardless.
+    If given, `stats` gets "source" (GUEST or FULL_PAGE), "cache" and the "bytes" transferred, both attempts included.
     """
-    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"}
-    response = requests.get(url, headers=headers)
-    response.raise_for_status()
-    return response.text
+    import requests
+    from job_tracker import page_cache
+
+    stats = {} if stats is None else stats
+    fetcher = get_fetcher()
+    job_id = page_cache.linkedin_job_id(url)
+    if job_id and LINKEDIN_GUEST:
+        try:
+            html = page_cache.get_page(LINKEDIN_GUEST_URL.format(job_id), fetcher, refresh=refresh, stats=stats)
+        except requests.RequestException:
+            # Closed or removed postings 404 here, while the public page may still say something; and the guest
+            # endpoint timing out or refusing connections (after the fetcher's retries) says nothing about the page
+            html = ""
+        if GUEST_MARKER in html:
+            stats["source"] = GUEST
+            return html
+
+    stats["source"] = FULL_PAGE
+    return page_cache.get_page(url, fetcher, refresh=refresh, stats=stats)
+
+
+# Parsing: lxml is several times faster than the pure-Python html.parser, and used whenever it is installed.
+# A job page is mostly navigation, scripts and "similar jobs" cards, so only the elements carrying the classes
+# below (and everything inside them) are built into the tree. Selectors are compiled once, at import, and match
+# both the full page and the guest fragment (whose title is an <h2>, and which has no sub-nav or <title>).
+PARSER = "lxml" if find_spec("lxml") else "html.parser"
+PARSED_CLASSES = frozenset(
+    {
+        "topcard__org-name-link",
+        "top-card-layout__title",
+        "topcard__flavor--bullet",
+        "sub-nav-cta__header",
+        "sub-nav-cta__meta-text",
+        "description__job-criteria-list",
+        "description__job-criteria-item",
+        "message-the-recruiter",
+        "posted-time-ago__text",
+        "description__text",
+        "show-more-less-html__markup",
+    }
+)
+TITLE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+JSON_LD = re.compile(r"<script[^>]*type\s*=\s*[\"']application/ld\+json[\"'][^>]*>(.*?)</script>", re.IGNORECASE | re.DOTALL)
+
+# schema.org employmentType values and LinkedIn's "Employment type" criteria, as models.JobType values
+EMPLOYMENT_TYPES = {
+    "full_time": "fulltime",
+    "full-time": "fulltime",
+    "part_time": "part-time",
+    "part-time": "part-time",
+    "contractor": "contract",
+    "contract": "contract",
+    "temporary": "contract",
+    "freelance": "freelance",
+}
+# The only employmentType that says something about the level instead
+INTERN_TYPES = ("intern", "internship")
+# Fields taken from JSON-LD even when the markup has them
+STRUCTURED_FIELDS = ("type", "date_posted", "expected_salary", "arrangement", "level")
+SALARY_UNITS = {"HOUR": "per hour", "DAY": "per day", "WEEK": "per week", "MONTH": "per month", "YEAR": "per year"}
+
+SELECT = {
+    "company_link": soupsieve.compile("a.topcard__org-name-link"),
+    "role_title": soupsieve.compile("h1.top-card-layout__title, h2.top-card-layout__title"),
+    "role_title_alt": soupsieve.compile("h3.sub-nav-cta__header"),
+    "location": soupsieve.compile("span.sub-nav-cta__meta-text"),
+    # The applicant count is a bullet too, in the guest fragment
+    "bullets": soupsieve.compile("span.topcard__flavor--bullet:not(.num-applicants__caption)"),
+    "criteria_header": soupsieve.compile("h3"),
+    "criteria_value": soupsieve.compile("span.description__job-criteria-text"),
+    "recruiter_name": soupsieve.compile("div.message-the-recruiter a.base-card__full-link span.sr-only"),
+    "recruiter_link": soupsieve.compile("div.message-the-recruiter a.base-card__full-link"),
+    "posted_time": soupsieve.compile("span.posted-time-ago__text"),
+    "description": soupsieve.compile("div.description__text"),
+    "description_alt": soupsieve.compile("div.show-more-less-html__markup"),
+}
+
+
+def _parsed_class(value) -> bool:
+    return value is not None and not PARSED_CLASSES.isdisjoint(value.split())
+
+
+def parse_job_page(html: str, targeted: bool = True) -> BeautifulSoup:
+    """The page's soup: only the job's regions by default, or the whole document with targeted=False."""
+    if targeted:
+        return BeautifulSoup(html, PARSER, parse_only=SoupStrainer(class_=_parsed_class))
+    return BeautifulSoup(html, PARSER)
+
+
+def _page_title(html: str) -> str:
+    # Read straight from the markup: <title> is outside the parsed regions
+    match = TITLE.search(html)
+    return unescape(match.group(1)).strip() if match else ""
+
+
+def _json_ld_objects(html: str):
+    """Every object in the page's application/ld+json blocks, including @graph members. Malformed blocks are skipped."""
+    for match in JSON_LD.finditer(html):
+        try:
+            parsed = json.loads(match.group(1))
+        except ValueError:
+            continue
+        stack = parsed if isinstance(parsed, list) else [parsed]
+        for item in stack:
+            if isinstance(item, dict):
+                yield item
+                graph = item.get("@graph") or []
+                if isinstance(graph, list):
+                    yield from (g for g in graph if isinstance(g, dict))
+
+
+def _is_job_posting(item: dict) -> bool:
+    types = item.get("@type")
+    return "JobPosting" in (types if isinstance(types, list) else [types])
+
+
+def _first(value):
+    return value[0] if isinstance(value, list) and value else value
+
+
+def _text(value) -> str:
+    return " ".join(str(value).split()) if value not in (None, "") and not isinstance(value, (dict, list)) else ""
+
 
+def _number(value) -> str:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return _text(value)
+    if not math.isfinite(number):
+        # NaN/Infinity (json.loads accepts them, and 1e400 overflows to inf) are no amount at all
+        return ""
+    return f"{number:,.0f}" if number == int(number) else f"{number:,.2f}"
 
-def extract_html_data(html: str) -> dict:
+
+def _salary(base_salary) -> str:
+    """A baseSalary MonetaryAmount as text, e.g. "EUR 50,000-70,000 per year"."""
+    base_salary = _first(base_salary)
+    if not isinstance(base_salary, dict):
+        return _text(base_salary)
+    value = base_salary.get("value")
+    unit = ""
+    if isinstance(value, dict):
+        unit = SALARY_UNITS.get(_text(value.get("unitText")).upper(), _text(value.get("unitText")).lower())
+        low, high = value.get("minValue"), value.get("maxValue")
+        if low is not None and high is not None and low != high:
+            amount = "-".join(part for part in (_number(low), _number(high)) if part)
+        else:
+            amount = _number(next((v for v in (value.get("value"), low, high) if v is not None), ""))
+    else:
+        amount = _number(value) if value is not None else ""
+    if not amount:
+        return ""
+    return " ".join(part for part in (_text(base_salary.get("currency")), amount, unit) if part)
+
+
+def _location(job_location) -> str:
+    """"City, Region, Country" from the first jobLocation's PostalAddress."""
+    place = _first(job_location)
+    address = place.get("address") if isinstance(place, dict) else None
+    if isinstance(address, str):
+        return _text(address)
+    if not isinstance(address, dict):
+        return ""
+    country = address.get("addressCountry")
+    country = country.get("name") if isinstance(country, dict) else country
+    parts = [_text(address.get("addressLocality")), _text(address.get("addressRegion")), _text(country)]
+    return ", ".join(dict.fromkeys(part for part in parts if part))
+
+
+def extract_job_posting(html: str) -> dict:
+    """
+    Job fields read from a schema.org JobPosting in the page's JSON-LD, already in the jobs table's formats.
+    Only fields the posting states are returned: {} when there is no JobPosting.
+    """
+    posting = next((item for item in _json_ld_objects(html) if _is_job_posting(item)), None)
+    if posting is None:
+        return {}
+    data = {}
+
+    title = _text(posting.get("title"))
+    if title:
+        data["role_name"] = title
+    organization = _first(posting.get("hiringOrganization"))
+    if isinstance(organization, dict):
+        if _text(organization.get("name")):
+            data["company_name"] = _text(organization["name"])
+        for link in (organization.get("sameAs"), organization.get("url")):
+            link = _text(_first(link))
+            if not link:
+                continue
+            field = "company_linkedin" if "linkedin.com" in link else "company_url"
+            data.setdefault(field, link.split("?")[0])
+
+    location = _location(posting.get("jobLocation"))
+    if location:
+        data["location"] = location
+    if _text(_first(posting.get("jobLocationType"))).upper() == "TELECOMMUTE":
+        data["arrangement"] = "remote"
+
+    types = posting.get("employmentType")
+    for employment_type in types if isinstance(types, list) else [types]:
+        key = _text(employment_type).lower().replace(" ", "_")
+        if key in EMPLOYMENT_TYPES:
+            data.setdefault("type", EMPLOYMENT_TYPES[key])
+        elif key in INTERN_TYPES:
+            data["level"] = "internship"
+
+    date_posted = _text(posting.get("datePosted"))[:10]
+    try:
+        data["date_posted"] = date.fromisoformat(date_posted).isoformat()
+    except ValueError:
+        pass
+
+    salary = _salary(posting.get("baseSalary") or posting.get("estimatedSalary"))
+    if salary:
+        data["expected_salary"] = salary
+
+    description = posting.get("description")
+    if isinstance(description, str) and description.strip():
+        data["job_description"] = BeautifulSoup(unescape(description), PARSER).get_text(separator="\n", strip=True)
+    return data
+
+
+def extract_html_data(html: str, targeted: bool = True) -> dict:
     """
-    Extracts structured data from the LinkedIn job page HTML.
+    Extracts structured data from the LinkedIn job page HTML, or from the guest job-posting fragment.
+    targeted=False parses the whole page, which finds the same fields more slowly (kept for comparison).
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_job_page(html, targeted)
     data = {}
 
     # company_name
-    company_link = soup.select_one("a.topcard__org-name-link")
+    company_link = SELECT["company_link"].select_one(soup)
     if company_link:
         data["company_name"] = company_link.get_text(strip=True)
     else:
-        # Fallback: Parse <title> tag
-        title_tag = soup.title.string if soup.title else ""
-        # Expected format: "Role Name at Company Name in Location | LinkedIn"
-        # Or "Hiring Role Name in Location: Company Name..."
-        # Let's try a simple regex or just leave it for LLM if really needed,
-        # but the plan suggests parsing title or URL.
-        # Let's try to extract from title if " at " exists.
-        if " at " in title_tag:
-            parts = title_tag.split(" at ")
-            if len(parts) > 1:
-                # Take the part after " at " and before " |" or " in "
-                rest = parts[1]
-                if " in " in rest:
-                    data["company_name"] = rest.split(" in ")[0]
-                elif " |" in rest:
-                    data["company_name"] = rest.split(" |")[0]
-                else:
-                    data["company_name"] = rest
-
-        if not data.get("company_name"):
-            # Fallback: URL path? Not available here as we only have HTML.
-            # We could pass URL to this function if needed, but let's stick to HTML for now.
-            pass
+        # Fallback: parse the <title>, usually "Role Name at Company Name in Location | LinkedIn" (full page only)
+        title = _page_title(html)
+        if " at " in title:
+            # Take the part after " at " and before " in " or " |"
+            rest = title.split(" at ")[1]
+            if " in " in rest:
+                data["company_name"] = rest.split(" in ")[0]
+            elif " |" in rest:
+                data["company_name"] = rest.split(" |")[0]
+            else:
+                data["company_name"] = rest
 
     # company_linkedin
     if company_link and company_link.has_attr("href"):
         data["company_linkedin"] = company_link["href"].split("?")[0]  # Clean query params
 
     # role_name
-    role_title = soup.select_one("h1.top-card-layout__title")
+    role_title = SELECT["role_title"].select_one(soup) or SELECT["role_title_alt"].select_one(soup)
     if role_title:
         data["role_name"] = role_title.get_text(strip=True)
-    else:
-        role_title_alt = soup.select_one("h3.sub-nav-cta__header")
-        if role_title_alt:
-            data["role_name"] = role_title_alt.get_text(strip=True)
 
     # location
-    location_span = soup.select_one("span.sub-nav-cta__meta-text")
+    location_span = SELECT["location"].select_one(soup)
     if location_span:
         data["location"] = location_span.get_text(strip=True)
     else:
-        # 2nd span.topcard__flavor--bullet
-        bullets = soup.select("span.topcard__flavor--bullet")
-        if len(bullets) >= 1:
-            # Usually the first one is company (if not a link), second is location.
-            # But if company is a link, it might be different.
-            # Let's look for the one that is NOT the company name if we have it.
-            # Actually, the plan says "2nd span.topcard__flavor--bullet".
-            # Let's try to find the one that looks like a location.
-            # Often structure is: Company (bullet) Location (bullet) Time
-            if len(bullets) >= 2:
-                data["location"] = bullets[1].get_text(strip=True)
-            elif len(bullets) == 1:
-                data["location"] = bullets[0].get_text(strip=True)
-
-    # Helper to find criteria text based on header
+        # Top card bullets are usually Company, Location, Time: take the 2nd, or the only one
+        bullets = SELECT["bullets"].select(soup, limit=2)
+        if len(bullets) >= 2:
+            data["location"] = bullets[1].get_text(strip=True)
+        elif len(bullets) == 1:
+            data["location"] = bullets[0].get_text(strip=True)
+
+    # Job criteria, read in one pass: <li> <h3>Header</h3> <span class="description__job-criteria-text">Value</span> </li>
+    criteria = [(header.get_text(strip=True).lower(), header.find_parent("li")) for header in SELECT["criteria_header"].select(soup)]
+
     def get_criteria(header_text):
-        header = soup.find("h3", string=lambda t: t and header_text.lower() in t.lower())
-        if header:
-            # The value is usually in a following span or div
-            # Structure: <li> <h3>Header</h3> <span>Value</span> </li>
-            # Or similar.
-            # Plan says: span.description__job-criteria-text
-            # Let's look for the next sibling or parent's find.
-            parent = header.find_parent("li")
-            if parent:
-                span = parent.select_one("span.description__job-criteria-text")
-                if span:
-                    return span.get_text(strip=True)
+        for header, item in criteria:
+            if header_text.lower() in header:
+                value = SELECT["criteria_value"].select_one(item) if item else None
+                return value.get_text(strip=True) if value else None
         return None
 
-    # type
-    data["type"] = get_criteria("Employment type")
+    # type, as a JobType value when the criteria text is a known one
+    employment_type = get_criteria("Employment type")
+    data["type"] = EMPLOYMENT_TYPES.get(employment_type.lower(), employment_type) if employment_type else None
 
     # recruiter_name
-    recruiter_name_elem = soup.select_one("div.message-the-recruiter a.base-card__full-link span.sr-only")
+    recruiter_name_elem = SELECT["recruiter_name"].select_one(soup)
     if recruiter_name_elem:
         data["recruiter_name"] = recruiter_name_elem.get_text(strip=True).replace("View ", "").replace("’s profile", "")
 
     # recruiter_linkedin
-    recruiter_link_elem = soup.select_one("div.message-the-recruiter a.base-card__full-link")
+    recruiter_link_elem = SELECT["recruiter_link"].select_one(soup)
     if recruiter_link_elem and recruiter_link_elem.has_attr("href"):
         data["recruiter_linkedin"] = recruiter_link_elem["href"].split("?")[0]
 
     # date_posted_raw
-    posted_time = soup.select_one("span.posted-time-ago__text")
+    posted_time = SELECT["posted_time"].select_one(soup)
     if posted_time:
         data["date_posted_raw"] = posted_time.get_text(strip=True)
 
     # job_description
-    description_div = soup.select_one("div.description__text")
-    if not description_div:
-        description_div = soup.select_one("div.show-more-less-html__markup")
-
+    description_div = SELECT["description"].select_one(soup) or SELECT["description_alt"].select_one(soup)
     if description_div:
         # Get text with some structure (newlines)
         data["job_description"] = description_div.get_text(separator="\n", strip=True)
 
+    # A JobPosting in the page's JSON-LD states type, date and salary exactly: it wins for those,
+    # and fills whatever the markup above didn't have
+    posting = extract_job_posting(html)
+    for field, value in posting.items():
+        if field in STRUCTURED_FIELDS or not data.get(field):
+            data[field] = value
     return data
@@ -1,4 +1,3 @@
-import re
 import click
 from typing import List, Tuple, Any
 
@@ -252,97 +251,26 @@ EDIT_COLUMN_ORDER = [
 def parse_filter_string(filter_str: str) -> Tuple[str, List[Any]]:
     """
     Parses a filter string into a SQL WHERE clause and parameters.
-    Supports: ==, !=, >=, <=, >, <, ~, : (substring), AND, OR, and [min-max] ranges.
-    Example: "rating>=4 AND company~google OR status==offered"
+    Supports: ==, !=, >=, <=, >, <, ~, : (substring), [min-max] ranges, IN (...), IS [NOT] NULL,
+    AND, OR, NOT and parentheses. Raises FilterError (a ValueError) on invalid input.
+    Example: "rating>=4 AND (company~google OR status IN (offered, accepted))"
     """
-    if not filter_str:
-        return "", []
-
-    # Split by AND/OR but keep them to maintain logic
-    # Using regex to split while preserving the delimiters
-    parts = re.split(r"(\s+AND\s+|\s+OR\s+)", filter_str, flags=re.IGNORECASE)
-
-    sql_parts = []
-    params = []
-
-    for part in parts:
-        clean_part = part.strip()
-        if not clean_part:
-            continue
-
-        upper_part = clean_part.upper()
-        if upper_part in ("AND", "OR"):
-            sql_parts.append(upper_part)
-            continue
-
-        # Try to match range first: col:[min-max]
-        range_match = re.match(r"(\w+):\[(.*)-(.*)\]", clean_part)
-        if range_match:
-            col_short, min_val, max_val = range_match.groups()
-            col = COLUMN_MAPPING.get(col_short.lower(), col_short)
-            min_val = min_val.strip()
-            max_val = max_val.strip()
-
-            # Resolve 'today' and 'yesterday' for date/datetime columns
-            date_cols = ["date_posted", "date_applied", "application_response_date", "interview_response_date", "followup_date"]
-            datetime_cols = ["interview_time"]
-
-            if col in datetime_cols:
-                min_val = resolve_datetime(min_val)
-                max_val = resolve_datetime(max_val)
-            elif col in date_cols:
-                min_val = resolve_date(min_val)
-                max_val = resolve_date(max_val)
-
-            sql_parts.append(f"({col} >= ? AND {col} <= ?)")
-            params.extend([min_val, max_val])
-            continue
-
-        # Match other operators: ==, !=, >=, <=, >, <, ~, :
-        # We use a regex that captures the column, operator, and value
-        match = re.match(r"(\w+)\s*(==|!=|>=|<=|>|<|~|:)\s*(.*)", clean_part)
-        if not match:
-            # If it doesn't match any operator, maybe it's just a keyword search on company/role?
-            # But the requirement says "filter data for more than one thing... using OR/AND"
-            # So we expect col op val format.
-            continue
-
-        col_short, op, val = match.groups()
+    from job_tracker.filters import compile_filter
+
+    return compile_filter(filter_str)
+
+
+def parse_sort_keys(sort_list: List[str]) -> List[Tuple[str, bool]]:
+    """
+    Converts a list of sort strings into (column, descending) pairs.
+    Example: ['date:desc', 'rating'] -> [("date_applied", True), ("rating", False)]
+    """
+    keys = []
+    for s in sort_list or []:
+        col_short, _, direction = s.partition(":")
         col = COLUMN_MAPPING.get(col_short.lower(), col_short)
-        val = val.strip().strip("'\"")
-
-        # Resolve relative dates (today, yesterday, weekdays) for date/datetime columns
-        date_cols = ["date_posted", "date_applied", "application_response_date", "interview_response_date", "followup_date"]
-        datetime_cols = ["interview_time"]
-
-        if col in datetime_cols:
-            val = resolve_datetime(val)
-        elif col in date_cols:
-            val = resolve_date(val)
-
-        if op == "==":
-            sql_parts.append(f"{col} = ?")
-            params.append(val)
-        elif op == "!=":
-            sql_parts.append(f"{col} != ?")
-            params.append(val)
-        elif op == ">=":
-            sql_parts.append(f"{col} >= ?")
-            params.append(val)
-        elif op == "<=":
-            sql_parts.append(f"{col} <= ?")
-            params.append(val)
-        elif op == ">":
-            sql_parts.append(f"{col} > ?")
-            params.append(val)
-        elif op == "<":
-            sql_parts.append(f"{col} < ?")
-            params.append(val)
-        elif op in ("~", ":"):
-            sql_parts.append(f"{col} LIKE ?")
-            params.append(f"%{val}%")
-
-    return " ".join(sql_parts), params
+        keys.append((col, direction.lower() == "desc"))
+    return keys
 
 
 def parse_sort_string(sort_list: List[str]) -> str:
@@ -350,21 +278,7 @@ def parse_sort_string(sort_list: List[str]) -> str:
     Converts a list of sort strings into a SQL ORDER BY clause.
     Example: ['date:desc', 'rating:asc'] -> "date_applied DESC, rating ASC"
     """
-    if not sort_list:
-        return ""
-
-    sort_parts = []
-    for s in sort_list:
-        if ":" in s:
-            col_short, direction = s.split(":", 1)
-            col = COLUMN_MAPPING.get(col_short.lower(), col_short)
-            dir_sql = "DESC" if direction.lower() == "desc" else "ASC"
-            sort_parts.append(f"{col} {dir_sql}")
-        else:
-            col = COLUMN_MAPPING.get(s.lower(), s)
-            sort_parts.append(f"{col} ASC")
-
-    return ", ".join(sort_parts)
+    return ", ".join(f"{col} {'DESC' if desc else 'ASC'}" for col, desc in parse_sort_keys(sort_list))
 
 
 def get_visible_columns(show: str = None, hide: str = None, all_cols: bool = False) -> List[str]:
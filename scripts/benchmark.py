@@ -0,0 +1,543 @@
+import argparse
+import html
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+COMPANIES = ["Google", "Microsoft", "Amazon", "Spotify", "Stripe", "Revolut", "Farfetch", "Talkdesk", "OutSystems", "Sword Health", "Feedzai", "Unbabel"]
+ROLES = ["Software Engineer", "Backend Engineer", "Data Engineer", "Frontend Developer", "ML Engineer", "DevOps Engineer", "Full Stack Developer"]
+LOCATIONS = ["Porto, Portugal", "Lisbon, Portugal", "Madrid, Spain", "Berlin, Germany", "London, United Kingdom", "Remote"]
+STATUSES = ["applied", "applied", "applied", "rejected", "rejected", "ghosted", "interviewing", "offered", "accepted", "refused"]
+SOURCES = ["linkedin", "company website", "indeed", "glassdoor", "referral", "recruiter outreach", "other"]
+LEVELS = ["internship", "junior", "mid level", "senior", "lead", "manager"]
+ARRANGEMENTS = ["onsite", "hybrid", "remote"]
+
+
+def make_job(i: int, rng: random.Random, transcript_size: int = 0) -> dict:
+    """Builds a realistic-looking job row. Unique role_url per index."""
+    applied = date(2024, 1, 1) + timedelta(days=rng.randrange(900))
+    status = rng.choice(STATUSES)
+    job = {
+        "company_name": f"{rng.choice(COMPANIES)} {i % 997}",
+        "role_name": rng.choice(ROLES),
+        "role_url": f"https://www.linkedin.com/jobs/view/{1000000000 + i}/",
+        "location": rng.choice(LOCATIONS),
+        "arrangement": rng.choice(ARRANGEMENTS),
+        "type": "fulltime",
+        "level": rng.choice(LEVELS),
+        "source": rng.choice(SOURCES),
+        "status": status,
+        "date_applied": applied.isoformat(),
+        "rating": rng.randint(1, 5),
+        "fit": rng.randint(1, 5),
+        "notes": "Python, SQL, distributed systems, on-call rotation",
+    }
+    if status != "applied" and status != "ghosted":
+        job["application_response_date"] = (applied + timedelta(days=rng.randrange(1, 30))).isoformat()
+    if status in ("interviewing", "offered", "accepted", "refused"):
+        job["interview_time"] = f"{(applied + timedelta(days=rng.randrange(5, 40))).isoformat()} 10:00"
+    if transcript_size:
+        job["interview_transcript"] = "Interviewer: Tell me about yourself. " * (transcript_size // 37 + 1)
+        job["feedback"] = "Strong on system design, needs more depth on databases. " * 20
+    return job
+
+
+def seed(count: int, start: int = 0, transcript_size: int = 0, batch_size: int = 10000):
+    """Inserts `count` synthetic jobs with ids starting after `start`."""
+    from job_tracker.database import transaction
+
+    rng = random.Random(start)
+    columns = list(make_job(0, rng, transcript_size).keys()) + ["application_response_date", "interview_time"]
+    columns = list(dict.fromkeys(columns))
+    query = f"INSERT INTO jobs ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})"
+
+    for offset in range(start, start + count, batch_size):
+        rows = []
+        for i in range(offset, min(offset + batch_size, start + count)):
+            job = make_job(i, rng, transcript_size)
+            rows.append([job.get(c) for c in columns])
+        with transaction() as conn:
+            conn.executemany(query, rows)
+
+
+def timed(fn, repeat: int = 5) -> float:
+    """Best-of-`repeat` wall time of fn() in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def default_view_columns() -> list:
+    """Columns a default `view` fetches."""
+    from job_tracker.commands.view import LINK_COLUMNS
+    from job_tracker.utils import COLUMN_MAPPING, get_visible_columns
+
+    return list(dict.fromkeys([COLUMN_MAPPING[k] for k in get_visible_columns()] + LINK_COLUMNS))
+
+
+def bench_indexes(sizes):
+    """`view` first page and duplicate URL detection latency as the table grows."""
+    from job_tracker.database import get_jobs, get_job_by_url
+
+    print(f"{'rows':>10} {'view (50 rows)':>16} {'url lookup':>12} {'status filter':>14}")
+    seeded = 0
+    for size in sizes:
+        seed(size - seeded, start=seeded)
+        seeded = size
+        url = f"https://www.linkedin.com/jobs/view/{1000000000 + size // 2}/"
+        view_ms = timed(lambda: get_jobs(limit=50))
+        url_ms = timed(lambda: get_job_by_url(url))
+        status_ms = timed(lambda: get_jobs(where_clause="status = ? AND date_applied >= ?", params=["interviewing", "2026-05-01"], limit=50))
+        print(f"{size:>10} {view_ms:>13.2f} ms {url_ms:>9.3f} ms {status_ms:>11.2f} ms")
+
+
+def peak_memory(fn) -> float:
+    """Peak Python heap allocated while running fn(), in MiB."""
+    import tracemalloc
+
+    tracemalloc.start()
+    result = fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return peak / (1024 * 1024)
+
+
+def bench_projection(sizes):
+    """Memory and time of `view` fetches on a transcript-heavy table, SELECT * vs projected."""
+    from job_tracker.database import get_jobs
+
+    print(f"{'rows':>10} {'fetch':>10} {'peak MiB':>10} {'time':>10}")
+    seeded = 0
+    for size in sizes:
+        seed(size - seeded, start=seeded, transcript_size=8000)
+        seeded = size
+        for label, columns in (("SELECT *", None), ("view", default_view_columns())):
+            mib = peak_memory(lambda: get_jobs(columns=columns))
+            ms = timed(lambda: get_jobs(columns=columns), repeat=1)
+            print(f"{size:>10} {label:>10} {mib:>10.1f} {ms:>7.0f} ms")
+
+
+def bench_streaming(sizes):
+    """Peak memory of consuming the view projection as a materialized list vs the iter_jobs() stream."""
+    from collections import deque
+    from job_tracker.database import get_jobs, iter_jobs
+
+    print(f"{'rows':>10} {'get_jobs MiB':>14} {'iter_jobs MiB':>14}")
+    seeded = 0
+    for size in sizes:
+        seed(size - seeded, start=seeded)
+        seeded = size
+        listed = peak_memory(lambda: get_jobs(columns=default_view_columns()))
+        streamed = peak_memory(lambda: deque(iter_jobs(columns=default_view_columns()), maxlen=0))
+        print(f"{size:>10} {listed:>14.1f} {streamed:>14.1f}")
+
+
+def bench_records(sizes):
+    """Peak memory and build time of all 36-column rows as JobRecord objects vs the previous per-row dicts."""
+    import sqlite3
+    from job_tracker.database import get_db, get_jobs
+
+    def as_dicts():
+        with get_db() as conn:
+            cursor = conn.execute("SELECT * FROM jobs ORDER BY date_applied DESC, id DESC")
+            cursor.row_factory = sqlite3.Row
+            return [dict(row) for row in cursor.fetchall()]
+
+    print(f"{'rows':>10} {'dict MiB':>10} {'record MiB':>11} {'dict time':>10} {'record time':>12}")
+    seeded = 0
+    for size in sizes:
+        seed(size - seeded, start=seeded)
+        seeded = size
+        dict_mib = peak_memory(as_dicts)
+        record_mib = peak_memory(get_jobs)
+        dict_ms = timed(as_dicts, repeat=3)
+        record_ms = timed(get_jobs, repeat=3)
+        print(f"{size:>10} {dict_mib:>10.1f} {record_mib:>11.1f} {dict_ms:>7.0f} ms {record_ms:>9.0f} ms")
+
+
+def bench_stats(sizes):
+    """Time to compute the full `stats` dashboard numbers, unfiltered and filtered."""
+    from job_tracker.analytics import compute_stats
+
+    print(f"{'rows':>10} {'unfiltered':>12} {'status filter':>14}")
+    seeded = 0
+    for size in sizes:
+        seed(size - seeded, start=seeded)
+        seeded = size
+        all_ms = timed(compute_stats, repeat=3)
+        filtered_ms = timed(lambda: compute_stats("status = ?", ["rejected"]), repeat=3)
+        print(f"{size:>10} {all_ms:>9.0f} ms {filtered_ms:>11.0f} ms")
+
+
+def make_filter(terms: int, rng: random.Random) -> str:
+    """A long filter expression mixing every construct of the filter language."""
+    conditions = [
+        lambda: f"company~{rng.choice(COMPANIES).lower()}",
+        lambda: f"status IN ({', '.join(rng.sample(STATUSES[2:], 3))})",
+        lambda: f"rating>={rng.randint(1, 5)}",
+        lambda: f"date:[2024-{rng.randint(1, 6):02d}-01-2025-{rng.randint(1, 12):02d}-28]",
+        lambda: "followup IS NULL",
+        lambda: f"NOT level=={rng.choice(LEVELS)}",
+    ]
+    groups = []
+    for start in range(0, terms, 3):
+        group = [rng.choice(conditions)() for _ in range(min(3, terms - start))]
+        groups.append("(" + " OR ".join(group) + ")")
+    return " AND ".join(groups)
+
+
+def bench_filters(sizes):
+    """Parse/compile time of generated filter expressions with `sizes` terms, cold vs memoized, and SQL vs in-memory evaluation."""
+    from filter_eval import _resolved, matches
+    from job_tracker.database import get_jobs, job_columns
+    from job_tracker.filters import _compiled, compile_filter, parse_filter
+
+    seed(10000)
+    rows = get_jobs()
+    columns = frozenset(job_columns())
+    rng = random.Random(0)
+
+    print(f"{'terms':>8} {'cold compile':>13} {'memoized':>10} {'SQL (10k rows)':>15} {'in-memory':>10}")
+    for terms in sizes:
+        expression = make_filter(terms, rng)
+
+        def cold():
+            for cache in (parse_filter, _compiled, _resolved):
+                cache.cache_clear()
+            compile_filter(expression)
+
+        cold_ms = timed(cold, repeat=3)
+        cached_ms = timed(lambda: compile_filter(expression), repeat=100)
+        where_clause, params = compile_filter(expression)
+        sql_ms = timed(lambda: get_jobs(where_clause=where_clause, params=params, columns=["id"]), repeat=3)
+        memory_ms = timed(lambda: [row for row in rows if matches(expression, row, columns)], repeat=3)
+        print(f"{terms:>8} {cold_ms:>10.2f} ms {cached_ms * 1000:>7.1f} us {sql_ms:>12.1f} ms {memory_ms:>7.0f} ms")
+
+
+def bench_search(sizes):
+    """Substring filters on a transcript-heavy table, plain LIKE scan vs the trigram full-text index."""
+    from job_tracker.database import get_jobs, job_columns
+    from job_tracker.filters import _compiled
+
+    print(f"{'rows':>10} {'filter':>22} {'LIKE scan':>10} {'FTS5':>10} {'rows':>8}")
+    seeded = 0
+    for size in sizes:
+        seed(size - seeded, start=seeded, transcript_size=2000)
+        seeded = size
+        columns = frozenset(job_columns())
+        for expression in ("company~spotify 4", "notes~distributed", "role~ml engineer", "transcript~yourself"):
+            timings = []
+            for full_text in (False, True):
+                where_clause, params = _compiled(expression, date.today(), full_text, columns)
+                timings.append(timed(lambda: get_jobs(where_clause=where_clause, params=params, columns=["id"]), repeat=3))
+            count = len(get_jobs(where_clause=where_clause, params=params, columns=["id"]))
+            print(f"{size:>10} {expression:>22} {timings[0]:>7.1f} ms {timings[1]:>7.1f} ms {count:>8}")
+
+
+def bench_fuzzy(sizes):
+    """`view --fuzzy` latency for misspelled company and role names: the name lookup, then the first page of jobs."""
+    from job_tracker.database import get_jobs
+    from job_tracker.fuzzy import fuzzy_clauses, near_names
+
+    print(f"{'rows':>10} {'query':>12} {'name lookup':>12} {'first page':>11} {'top match':>18}")
+    seeded = 0
+    for size in sizes:
+        start = time.perf_counter()
+        seed(size - seeded, start=seeded)
+        seed_s = time.perf_counter() - start
+        seeded = size
+        print(f"{size:>10} (seeded in {seed_s:.1f} s)")
+        for text in ("Gogle", "Microsft", "Sowrd Helth", "Enginer Bakend"):
+            lookup_ms = timed(lambda: near_names(text), repeat=5)
+            matches = near_names(text)
+            where_clause, where_params, sort_clause, sort_params = fuzzy_clauses(matches)
+            page_ms = timed(lambda: get_jobs(where_clause=where_clause, params=where_params + sort_params, sort_clause=sort_clause, limit=50, columns=default_view_columns()), repeat=3)
+            print(f"{size:>10} {text:>12} {lookup_ms:>9.2f} ms {page_ms:>8.1f} ms {matches[0][1]:>18}")
+
+
+def bench_pager(sizes):
+    """`view` time to first rows: rendering every match vs the keyset pager's first page, and deep pages vs OFFSET."""
+    import io
+    from rich.console import Console
+    from job_tracker.commands.view import _render_table
+    from job_tracker.database import get_jobs
+    from job_tracker.pager import KeysetPager
+    from job_tracker.utils import get_visible_columns
+
+    keys = get_visible_columns()
+    columns = default_view_columns()
+
+    def render(rows):
+        Console(file=io.StringIO(), width=160).print(_render_table(rows, keys, None))
+
+    print(f"{'rows':>10} {'full render':>12} {'first page':>11} {'keyset deep':>12} {'OFFSET deep':>12}")
+    seeded = 0
+    for size in sizes:
+        seed(size - seeded, start=seeded)
+        seeded = size
+        full_ms = timed(lambda: render(get_jobs(columns=columns)), repeat=1)
+        first_ms = timed(lambda: render(KeysetPager(None, [], None, columns, 20).first()), repeat=3)
+
+        # A page 90% of the way down, reached by seeking vs by OFFSET
+        pager = KeysetPager(None, [], None, columns, 20)
+        depth = int(size * 0.9)
+        boundary = pager._key(get_jobs(columns=["date_applied", "id"], limit=1, where_clause=f"id IN (SELECT id FROM jobs ORDER BY date_applied DESC, id DESC LIMIT 1 OFFSET {depth})")[0])
+        keyset_ms = timed(lambda: pager._fetch(pager.keys, after=boundary), repeat=3)
+        offset_ms = timed(lambda: get_jobs(columns=columns, limit=f"20 OFFSET {depth}"), repeat=3)
+        print(f"{size:>10} {full_ms:>9.0f} ms {first_ms:>8.1f} ms {keyset_ms:>9.1f} ms {offset_ms:>9.1f} ms")
+
+
+def serve_pages(page_bytes: int = 200000, fail_every: int = 0):
+    """
+    Local stand-in for LinkedIn on a free port, serving a page of `page_bytes` at any path.
+    With fail_every=N, every Nth request gets a 503 with Retry-After: 0. Returns (server, base URL, stats dict).
+    """
+    import http.server
+    import threading
+
+    body = b"<html><body>" + b"<p>job description</p>" * (page_bytes // 22) + b"</body></html>"
+    stats = {"connections": 0, "requests": 0}
+    lock = threading.Lock()
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            with lock:
+                stats["connections"] += 1
+            super().setup()
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            with lock:
+                stats["requests"] += 1
+                failing = fail_every and stats["requests"] % fail_every == 0
+            if failing:
+                self.send_response(503)
+                self.send_header("Retry-After", "0")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}", stats
+
+
+def bench_fetch(sizes):
+    """Fetching `size` pages from a local stand-in server: a bare requests.get per URL vs the pooled Fetcher."""
+    from concurrent.futures import ThreadPoolExecutor
+    import requests
+    from job_tracker.fetcher import Fetcher
+
+    print(f"{'pages':>8} {'bare get':>10} {'conns':>6} {'pooled':>10} {'conns':>6} {'pooled x8':>10} {'conns':>6} {'retried':>8} {'p50':>8} {'p95':>8}")
+    for size in sizes:
+        server, base, stats = serve_pages()
+        urls = [f"{base}/jobs/view/{i}" for i in range(size)]
+
+        started = time.perf_counter()
+        for url in urls:
+            requests.get(url).raise_for_status()
+        bare_ms = (time.perf_counter() - started) * 1000
+        bare_conns, stats["connections"] = stats["connections"], 0
+
+        fetcher = Fetcher(host_interval=0)
+        started = time.perf_counter()
+        for url in urls:
+            fetcher.get(url)
+        pooled_ms = (time.perf_counter() - started) * 1000
+        pooled_conns, stats["connections"] = stats["connections"], 0
+        server.shutdown()
+
+        # Concurrent, as in add --batch, with every 10th response a retried 503
+        server, base, stats = serve_pages(fail_every=10)
+        fetcher = Fetcher(host_interval=0)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(fetcher.get, (f"{base}/jobs/view/{i}" for i in range(size))))
+        threaded_ms = (time.perf_counter() - started) * 1000
+        latency = fetcher.latency_summary()[base.split("//")[1]]
+        print(
+            f"{size:>8} {bare_ms:>7.0f} ms {bare_conns:>6} {pooled_ms:>7.0f} ms {pooled_conns:>6} {threaded_ms:>7.0f} ms {stats['connections']:>6}"
+            f" {fetcher.retries:>8} {latency['p50'] * 1000:>5.0f} ms {latency['p95'] * 1000:>5.0f} ms"
+        )
+        server.shutdown()
+
+
+def make_job_page(i: int, rng: random.Random, guest: bool = False, json_ld: bool = True) -> str:
+    """
+    A synthetic public LinkedIn job page (~250 KB): head scripts and styles with a schema.org JobPosting (JSON-LD,
+    with a salary on most pages), navigation, the top card, job criteria, description and recruiter card, then
+    "similar jobs" cards and a footer. Some pages lack the company link or the sub-nav location, to exercise the fallbacks.
+    guest=True gives the same job as the guest job-posting fragment instead: the top card (always with the company
+    link, and an <h2> title), description, criteria and recruiter card only, and no JSON-LD.
+    json_ld=False leaves the JobPosting out of the full page too.
+    """
+    company, role, location = rng.choice(COMPANIES), rng.choice(ROLES), rng.choice(LOCATIONS)
+    script = "<script>window.__data = {" + ", ".join(f'"k{k}": "{"x" * 40}"' for k in range(60)) + "};</script>"
+    nav = "".join(f'<li class="nav__item"><a class="nav__link" href="/n/{k}"><span class="nav__text">Link {k}</span></a></li>' for k in range(150))
+    company_html = f'<a class="topcard__org-name-link topcard__flavor--black-link" href="https://www.linkedin.com/company/c{i}?trk=public">{company}</a>' if i % 5 or guest else f'<span class="topcard__flavor">{company}</span>'
+    sub_nav = f'<span class="sub-nav-cta__meta-text">{location}</span>' if i % 3 else ""
+    criteria = "".join(
+        f'<li class="description__job-criteria-item"><h3 class="description__job-criteria-subheader">{header}</h3>'
+        f'<span class="description__job-criteria-text description__job-criteria-text--criteria">{value}</span></li>'
+        for header, value in [("Seniority level", "Mid-Senior level"), ("Employment type", "Full-time"), ("Job function", "Engineering"), ("Industries", "Software")]
+    )
+    description = "".join(f"<p>Responsibility {k}: build and run <strong>distributed systems</strong> in Python &amp; SQL.</p><ul><li>Point {k}.1</li><li>Point {k}.2</li></ul>" for k in range(40))
+    recruiter = (
+        '<div class="message-the-recruiter"><a class="base-card__full-link" href="https://www.linkedin.com/in/recruiter?trk=x">'
+        f'<span class="sr-only">View Jane Doe {i}’s profile</span></a></div>'
+        if i % 2
+        else ""
+    )
+    weeks = rng.randint(1, 4)
+    posted = f'<span class="posted-time-ago__text">{weeks} weeks ago</span>'
+    body = (
+        f'<section class="description"><div class="description__text description__text--rich"><div class="show-more-less-html__markup">{description}</div></div>'
+        f'<ul class="description__job-criteria-list">{criteria}</ul></section>{recruiter}'
+    )
+    if guest:
+        return (
+            f'<section class="top-card-layout"><a href="/jobs/view/{i}"><h2 class="top-card-layout__title">{role}</h2></a><h4>{company_html}'
+            f'<span class="topcard__flavor topcard__flavor--bullet">{location}</span>'
+            f'<span class="num-applicants__caption topcard__flavor--bullet">Over 200 applicants</span></h4>{posted}</section>{body}'
+        )
+    similar = "".join(
+        f'<li><div class="base-card job-search-card"><a class="base-card__full-link" href="/jobs/view/{k}"><span class="sr-only">Job {k}</span></a>'
+        f'<div class="base-search-card__info"><h3 class="base-search-card__title">{rng.choice(ROLES)}</h3><h4>{rng.choice(COMPANIES)}</h4>'
+        f'<span class="job-search-card__location">{rng.choice(LOCATIONS)}</span><time>1 week ago</time></div></div></li>'
+        for k in range(80)
+    )
+    footer = "".join(f'<li><a class="footer__link" href="/f/{k}">Footer {k}</a></li>' for k in range(120))
+    posting = {
+        "@context": "https://schema.org",
+        "@type": "JobPosting",
+        "title": role,
+        "hiringOrganization": {"@type": "Organization", "name": company, "sameAs": f"https://www.linkedin.com/company/c{i}"},
+        "jobLocation": {"@type": "Place", "address": {"@type": "PostalAddress", "addressLocality": location}},
+        "employmentType": "FULL_TIME",
+        "datePosted": (date(2024, 6, 1) - timedelta(weeks=weeks)).isoformat(),
+        "description": html.escape(description),
+    }
+    if i % 4:
+        low = 40000 + 5000 * rng.randint(0, 10)
+        posting["baseSalary"] = {"@type": "MonetaryAmount", "currency": "EUR", "value": {"@type": "QuantitativeValue", "minValue": low, "maxValue": low + 20000, "unitText": "YEAR"}}
+    ld_json = f'<script type="application/ld+json">{json.dumps(posting)}</script>' if json_ld else ""
+    return (
+        f"<!DOCTYPE html><html><head><title>{role} at {company} in {location} | LinkedIn</title>"
+        f"<style>{'.c{color:red;margin:0} ' * 400}</style>{script * 12}{ld_json}</head><body>"
+        f'<header><nav><ul class="nav__menu">{nav}</ul></nav></header>'
+        f'<section class="sub-nav-cta"><h3 class="sub-nav-cta__header">{role}</h3>{sub_nav}</section>'
+        f'<section class="top-card-layout"><h1 class="top-card-layout__title">{role}</h1><h4>{company_html}'
+        f'<span class="topcard__flavor topcard__flavor--bullet">{location}</span></h4>{posted}</section>{body}'
+        f'<section class="similar-jobs"><ul>{similar}</ul></section><footer><ul>{footer}</ul></footer>{script * 8}</body></html>'
+    )
+
+
+def bench_extract(sizes, fixtures: Path = None):
+    """
+    scraper.extract_html_data() time per page: a full html.parser soup (the previous approach) vs the targeted
+    parse, on `fixtures` (saved *.html pages) or `size` synthetic pages. Also checks that both extract the same fields.
+    Synthetic pages are then compared with their guest job-posting fragments (scraper.LINKEDIN_GUEST_URL), including
+    the fields the LLM would still be asked for from each: the fragment has no JSON-LD.
+    """
+    os.environ.setdefault("OPENAI_API_KEY", "benchmark")  # llm builds its client at import; nothing is sent here
+    from job_tracker import llm, scraper
+
+    corpora = [("fixtures", [p.read_text(encoding="utf-8") for p in sorted(fixtures.glob("*.html"))])] if fixtures else []
+    corpora += [(size, [make_job_page(i, random.Random(i)) for i in range(size)]) for size in ([] if fixtures else sizes)]
+    parser = scraper.PARSER
+
+    def per_page(pages, targeted, parser_name) -> float:
+        scraper.PARSER = parser_name
+        started = time.perf_counter()
+        results = [scraper.extract_html_data(html, targeted=targeted) for html in pages]
+        scraper.PARSER = parser
+        return (time.perf_counter() - started) * 1000 / len(pages), results
+
+    print(f"targeted parser: {parser}")
+    print(f"{'pages':>8} {'avg KB':>7} {'full html.parser':>17} {'full ' + parser:>17} {'targeted':>10} {'speedup':>8} {'same fields':>12}")
+    for label, pages in corpora:
+        if not pages:
+            continue
+        full_ms, full = per_page(pages, False, "html.parser")
+        full_parser_ms, _ = per_page(pages, False, parser)
+        targeted_ms, targeted = per_page(pages, True, parser)
+        kb = sum(len(p) for p in pages) / len(pages) / 1024
+        print(f"{label:>8} {kb:>7.0f} {full_ms:>14.1f} ms {full_parser_ms:>14.1f} ms {targeted_ms:>7.1f} ms {full_ms / targeted_ms:>7.1f}x {str(full == targeted):>12}")
+
+    if fixtures:
+        return
+    def tokens_saved(results) -> float:
+        # What llm.enrich_job_data() leaves out of the request schema (the fields the page already stated), at ~4 chars a token
+        return sum(len(json.dumps({f: llm.FIELD_SCHEMAS[f]})) for data in results for f in llm.FIELD_SCHEMAS if f not in llm.missing_fields(data)) / len(results) / 4
+
+    # The guest job-posting fragment of the same jobs: bytes to transfer and parse time, whether it has every field the
+    # page's markup gave, and the LLM fields asked for per job (of len(llm.FIELD_SCHEMAS)) and schema tokens saved with
+    # each, the full page's JSON-LD included
+    print(f"\n{'pages':>8} {'page KB':>8} {'guest KB':>9} {'page':>9} {'guest':>9} {'complete':>9} {'LLM fields page/guest':>22} {'tokens saved page/guest':>25}")
+    for size in sizes:
+        pages = [make_job_page(i, random.Random(i)) for i in range(size)]
+        markup = [make_job_page(i, random.Random(i), json_ld=False) for i in range(size)]
+        guests = [make_job_page(i, random.Random(i), guest=True) for i in range(size)]
+        page_ms, from_pages = per_page(pages, True, parser)
+        guest_ms, from_guests = per_page(guests, True, parser)
+        _, from_markup = per_page(markup, True, parser)
+        complete = sum(all(g.get(k) == v for k, v in p.items()) for p, g in zip(from_markup, from_guests))
+        page_kb, guest_kb = (sum(len(h.encode()) for h in corpus) / size / 1024 for corpus in (pages, guests))
+        page_fields, guest_fields = (sum(len(llm.missing_fields(data)) for data in results) / size for results in (from_pages, from_guests))
+        fields = f"{page_fields:.1f} / {guest_fields:.1f}"
+        saved = f"{tokens_saved(from_pages):.0f} / {tokens_saved(from_guests):.0f}"
+        print(f"{size:>8} {page_kb:>8.0f} {guest_kb:>9.1f} {page_ms:>6.1f} ms {guest_ms:>6.1f} ms {complete:>5}/{size} {fields:>22} {saved:>25}")
+
+
+BENCHMARKS = {
+    "extract": bench_extract,
+    "fetch": bench_fetch,
+    "filters": bench_filters,
+    "fuzzy": bench_fuzzy,
+    "indexes": bench_indexes,
+    "pager": bench_pager,
+    "projection": bench_projection,
+    "records": bench_records,
+    "search": bench_search,
+    "stats": bench_stats,
+    "streaming": bench_streaming,
+}
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+    parser = argparse.ArgumentParser(description="Benchmarks for job-tracker against a scratch database.")
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS))
+    parser.add_argument("--sizes", type=lambda s: [int(x) for x in s.split(",")], default=[10000, 100000, 1000000], help="Comma-separated table sizes")
+    parser.add_argument("--db", type=Path, default=None, help="Database file (defaults to a temporary file)")
+    parser.add_argument("--fixtures", type=Path, default=None, help="Directory of saved job pages (*.html) for the extract benchmark")
+    cli_args = parser.parse_args()
+
+    os.environ["JOB_TRACKER_DB"] = str(cli_args.db or Path(tempfile.mkdtemp()) / "benchmark.db")
+    from job_tracker.database import initialize_db
+
+    initialize_db()
+    if cli_args.benchmark == "extract":
+        bench_extract(cli_args.sizes, cli_args.fixtures)
+    else:
+        BENCHMARKS[cli_args.benchmark](cli_args.sizes)
@@ -0,0 +1,108 @@
+import re
+import string
+from datetime import date
+from functools import lru_cache
+from typing import Optional
+from job_tracker.filters import LIKE_OPS, And, Comparison, InList, IsNull, Not, Range, parse_filter, resolve
+
+# In-memory evaluation of the filter language, the baseline `benchmark.py filters` compares the SQL against.
+# It follows SQLite semantics: comparisons with NULL are unknown (None), and unknown propagates through
+# NOT/AND/OR the way SQL three-valued logic does.
+
+
+def _sqlite_order(value):
+    # SQLite orders numbers before text
+    return (0, value) if isinstance(value, (int, float)) else (1, str(value))
+
+
+def _coerce(row_value, filter_value):
+    """Applies the column's numeric affinity to the filter value, like SQLite does for INTEGER columns."""
+    if isinstance(row_value, (int, float)) and isinstance(filter_value, str):
+        try:
+            number = float(filter_value)
+            return int(number) if number.is_integer() else number
+        except ValueError:
+            return filter_value
+    return filter_value
+
+
+# LIKE only folds ASCII letters
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+@lru_cache(maxsize=256)
+def _like_regex(pattern: str) -> re.Pattern:
+    translated = "".join(".*" if c == "%" else "." if c == "_" else re.escape(c) for c in pattern.translate(_ASCII_LOWER))
+    return re.compile(translated, re.DOTALL)
+
+
+def _compare(op: str, left, right) -> bool:
+    left, right = _sqlite_order(left), _sqlite_order(right)
+    if op == "==":
+        return left == right
+    if op == "!=":
+        return left != right
+    if op == ">=":
+        return left >= right
+    if op == "<=":
+        return left <= right
+    if op == ">":
+        return left > right
+    return left < right
+
+
+def evaluate(node, row) -> Optional[bool]:
+    """Evaluates a resolved AST against a row (JobRecord or dict). Returns True, False or None (unknown)."""
+    if isinstance(node, Comparison):
+        value = row.get(node.column)
+        if node.op in LIKE_OPS:
+            if value is None:
+                return None
+            return bool(_like_regex(f"%{node.value}%").fullmatch(str(value).translate(_ASCII_LOWER)))
+        if node.value is None and node.op in ("==", "!="):
+            return (value is None) != (node.op == "!=")
+        if value is None or node.value is None:
+            return None
+        return _compare(node.op, value, _coerce(value, node.value))
+    if isinstance(node, Range):
+        return evaluate(And((Comparison(node.column, ">=", node.low), Comparison(node.column, "<=", node.high))), row)
+    if isinstance(node, InList):
+        value = row.get(node.column)
+        if value is None:
+            return None
+        found = any(_compare("==", value, _coerce(value, v)) for v in node.values if v is not None)
+        return (not found) if node.negated else found
+    if isinstance(node, IsNull):
+        return (row.get(node.column) is None) != node.negated
+    if isinstance(node, Not):
+        result = evaluate(node.operand, row)
+        return None if result is None else not result
+    if isinstance(node, And):
+        result = True
+        for operand in node.operands:
+            value = evaluate(operand, row)
+            if value is False:
+                return False
+            if value is None:
+                result = None
+        return result
+    result = False
+    for operand in node.operands:
+        value = evaluate(operand, row)
+        if value is True:
+            return True
+        if value is None:
+            result = None
+    return result
+
+
+@lru_cache(maxsize=256)
+def _resolved(filter_str: str, today: date, columns: frozenset):
+    return resolve(parse_filter(filter_str, columns))
+
+
+def matches(filter_str: str, row, columns: frozenset) -> bool:
+    """True if the row satisfies the filter over the jobs `columns`, exactly as the compiled WHERE clause would select it."""
+    if not filter_str or not filter_str.strip():
+        return True
+    return evaluate(_resolved(filter_str, date.today(), columns), row) is True
@@ -0,0 +1,65 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+from multiprocessing import Pool
+from pathlib import Path
+
+
+def writer(args):
+    """Runs a mix of add/update/delete calls against the database, returns (ok, failed) counts."""
+    worker_id, iterations = args
+    from job_tracker.database import add_job, update_job, delete_job_by_id, get_job_by_id
+
+    ok = failed = 0
+    for i in range(iterations):
+        try:
+            job_id = add_job({"company_name": f"Stress {worker_id}", "role_name": f"Role {i}", "status": "applied"})
+            update_job(job_id, {"notes": f"updated by worker {worker_id}"})
+            if i % 3 == 0:
+                delete_job_by_id(job_id)
+            elif not get_job_by_id(job_id):
+                raise RuntimeError(f"Job {job_id} vanished")
+            ok += 1
+        except Exception as e:
+            print(f"[worker {worker_id}] {e}")
+            failed += 1
+    return ok, failed
+
+
+def stress(processes: int, iterations: int, db_path: Path):
+    os.environ["JOB_TRACKER_DB"] = str(db_path)
+    from job_tracker.database import initialize_db, get_jobs, close_db
+
+    initialize_db()
+    # Forked workers must open their own connections
+    close_db()
+
+    print(f"Spawning {processes} writer processes x {iterations} iterations against {db_path}...")
+    start = time.perf_counter()
+    with Pool(processes) as pool:
+        results = pool.map(writer, [(w, iterations) for w in range(processes)])
+    elapsed = time.perf_counter() - start
+
+    ok = sum(r[0] for r in results)
+    failed = sum(r[1] for r in results)
+    expected_rows = sum(1 for w in range(processes) for i in range(iterations) if i % 3 != 0)
+    rows = len(get_jobs(where_clause="company_name LIKE 'Stress %'"))
+
+    print(f"Completed {ok} iterations, {failed} failed in {elapsed:.2f}s ({ok / elapsed:.0f} iterations/s)")
+    print(f"Rows left: {rows} (expected {expected_rows})")
+    return failed == 0 and rows == expected_rows
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+    parser = argparse.ArgumentParser(description="Hammer one jobs.db with concurrent writer processes.")
+    parser.add_argument("--processes", "-p", type=int, default=16)
+    parser.add_argument("--iterations", "-n", type=int, default=50)
+    parser.add_argument("--db", type=Path, default=None, help="Database file (defaults to a temporary file)")
+    cli_args = parser.parse_args()
+
+    db_path = cli_args.db or Path(tempfile.mkdtemp()) / "stress.db"
+    sys.exit(0 if stress(cli_args.processes, cli_args.iterations, db_path) else 1)
@@ -0,0 +1,77 @@
+import http.server
+import os
+import tempfile
+import threading
+
+# Point the package at a scratch location before anything imports it: DB_PATH and the cache directories are
+# resolved at import time, and the tests must never touch a real jobs.db
+os.environ["JOB_TRACKER_DB"] = os.path.join(tempfile.mkdtemp(prefix="job-tracker-tests-"), "jobs.db")
+os.environ["JOB_TRACKER_RESULT_CACHE"] = "0"
+os.environ["JOB_TRACKER_PAGE_CACHE"] = "0"
+
+import pytest
+from job_tracker import database
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """A fresh, fully migrated database for one test."""
+    database.close_db()
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "jobs.db")
+    database.initialize_db()
+    yield
+    database.close_db()
+
+
+class FakeTime:
+    """Stands in for time.sleep/time.monotonic: sleeping advances the clock instantly and is recorded."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_time():
+    return FakeTime()
+
+
+@pytest.fixture
+def server():
+    """
+    A local stand-in server. Queue (status, headers) or (status, headers, body) responses per path in server.script;
+    then it answers 200 with a page naming the path. server.requests records each request's path and headers.
+    """
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            httpd.requests.append((self.path, dict(self.headers)))
+            status, headers, *body = httpd.script[self.path].pop(0) if httpd.script.get(self.path) else (200, {})
+            body = (body[0] if body else f"<html>{self.path}</html>").encode() if status == 200 else b""
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.daemon_threads = True
+    httpd.script, httpd.requests = {}, []
+    httpd.base = f"http://127.0.0.1:{httpd.server_address[1]}"
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
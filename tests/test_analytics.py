@@ -0,0 +1,283 @@
+import random
+import sqlite3
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from typing import Optional
+
+import pytest
+from job_tracker import analytics, database
+from job_tracker.database import add_job, delete_job_by_id, get_db, insert_jobs, transaction, update_job
+from job_tracker.filters import compile_filter
+
+# compute_stats() against the row-by-row computation `stats` used before the SQL aggregation, on the same rows.
+
+STATUSES = ["applied", "interviewing", "offered", "accepted", "refused", "rejected", "ghosted", "withdrawn", "", None]
+LEVELS = ["junior", "mid-level", "senior", "principal", "", None]
+SOURCES = ["linkedin", "referral", "company website", "", None]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "", None]
+# Valid, missing, empty and malformed values, as found in hand-edited databases
+DATES = ["2024-01-05", "2024-01-08", "2024-02-29", "2024-03-31", "2024-04-01", None, "", "not a date", "2024-02-30", "2024-13-01"]
+DATETIMES = ["2024-01-10 09:30", "2024-02-01 14:00", "2024-03-05 23:59", "2024-04-02 08:00", None, "", "tomorrow", "2024-02-30 10:00"]
+
+
+def _parse_dt(dt_str: Optional[str]) -> Optional[datetime]:
+    if not dt_str:
+        return None
+    try:
+        return datetime.fromisoformat(dt_str.replace(" ", "T") if " " in dt_str and "T" not in dt_str else dt_str)
+    except ValueError:
+        try:
+            return datetime.strptime(dt_str, "%Y-%m-%d %H:%M")
+        except ValueError:
+            return None
+
+
+def legacy_stats(jobs: list) -> dict:
+    """The numbers the previous `stats` command derived in Python, in analytics.summarize()'s shape."""
+    total_count = len(jobs)
+    if not total_count:
+        return {"total_count": 0}
+
+    # The SQL aggregation groups a NULL status under ''
+    status_counts = Counter(j["status"] or "" for j in jobs)
+    interviewed_jobs = [j for j in jobs if j["status"] in ("interviewing", "offered", "accepted", "refused") or j["interview_time"] or j["interview_response_date"]]
+    interviewed_ids = {j["id"] for j in interviewed_jobs}
+    interviews = len(interviewed_jobs)
+    offers = sum(1 for j in jobs if j["status"] in ("offered", "accepted", "refused"))
+    rejections = status_counts.get("rejected", 0)
+    rejections_post_interview = sum(1 for j in interviewed_jobs if j["status"] == "rejected")
+    accepted = status_counts.get("accepted", 0)
+    ghosted = status_counts.get("ghosted", 0)
+    awaiting = sum(1 for j in jobs if j["status"] == "applied" and not j["application_response_date"] and not j["interview_response_date"])
+    currently_interviewing = sum(1 for j in interviewed_jobs if j["status"] in ("applied", "interviewing"))
+    pending_offers = sum(1 for j in jobs if j["status"] == "offered")
+    terminal_settled_count = sum(1 for j in jobs if j["status"] in ("ghosted", "rejected", "offered", "accepted", "refused"))
+
+    def rate(part, whole):
+        return (part / whole * 100) if whole > 0 else 0
+
+    times = defaultdict(list)
+    for j in jobs:
+        d_applied = _parse_dt(j["date_applied"])
+        d_resp = _parse_dt(j["application_response_date"])
+        d_int = _parse_dt(j["interview_time"])
+        d_int_resp = _parse_dt(j["interview_response_date"])
+        is_interview = j["id"] in interviewed_ids
+        if d_applied and d_resp and not is_interview and j["status"] == "rejected" and (d_resp - d_applied).days >= 0:
+            times["app_rej"].append((d_resp - d_applied).days)
+        if d_applied and d_resp and is_interview and (d_resp - d_applied).days >= 0:
+            times["app_int"].append((d_resp - d_applied).days)
+        if d_int and d_int_resp and j["status"] == "rejected" and (d_int_resp - d_int).days >= 0:
+            times["int_rej"].append((d_int_resp - d_int).days)
+        if d_int and d_int_resp and j["status"] in ("offered", "accepted", "refused") and (d_int_resp - d_int).days >= 0:
+            times["int_offer"].append((d_int_resp - d_int).days)
+
+    weekly_apps, monthly_apps = defaultdict(int), defaultdict(int)
+    for j in jobs:
+        dt = _parse_dt(j["date_applied"])
+        if dt:
+            weekly_apps[(dt - timedelta(days=dt.weekday())).strftime("%Y-%W")] += 1
+            monthly_apps[dt.strftime("%Y-%m")] += 1
+
+    def quality(job_list):
+        if not job_list:
+            return {"count": 0, "avg_fit": 0, "avg_rating": 0, "top_fit": 0, "top_rating": 0}
+        fits = [j["fit"] for j in job_list if j["fit"] is not None]
+        ratings = [j["rating"] for j in job_list if j["rating"] is not None]
+        return {
+            "count": len(job_list),
+            "avg_fit": sum(fits) / len(fits) if fits else 0,
+            "avg_rating": sum(ratings) / len(ratings) if ratings else 0,
+            "top_fit": (sum(1 for f in fits if f >= 4) / len(fits) * 100) if fits else 0,
+            "top_rating": (sum(1 for r in ratings if r >= 4) / len(ratings) * 100) if ratings else 0,
+        }
+
+    def counts(field):
+        return dict(Counter(j[field] for j in jobs if j[field]))
+
+    fit_groups = []
+    for fit, label in analytics.FIT_LABELS.items():
+        group = [j for j in jobs if j["fit"] == fit]
+        if group:
+            fit_groups.append((label, len(group), sum(1 for j in group if j["id"] in interviewed_ids)))
+
+    return {
+        "total_count": total_count,
+        "awaiting": awaiting,
+        "ghosted": ghosted,
+        "rejections": rejections,
+        "rejections_pre_interview": rejections - rejections_post_interview,
+        "rejections_post_interview": rejections_post_interview,
+        "interviews": interviews,
+        "offers": offers,
+        "accepted": accepted,
+        "refused": status_counts.get("refused", 0),
+        "awaiting_rate": rate(awaiting, total_count),
+        "ghosted_rate": rate(ghosted, total_count),
+        "rejection_rate": rate(rejections, total_count),
+        "total_interview_rate": rate(interviews, total_count),
+        "total_offer_rate": rate(offers, total_count),
+        "app_to_interview_rate": rate(interviews, total_count - awaiting),
+        "interview_to_offer_rate": rate(offers, interviews - currently_interviewing),
+        "offer_to_acceptance_rate": rate(accepted, offers - pending_offers),
+        "overall_success_rate": rate(accepted, terminal_settled_count),
+        **{f"avg_{name}": (sum(times[name]) / len(times[name]) if times[name] else None) for name in ("app_rej", "app_int", "int_rej", "int_offer")},
+        "status_counts": dict(status_counts),
+        "company_counts": counts("company_name"),
+        "source_counts": counts("source"),
+        "level_counts": counts("level"),
+        "arrangement_counts": counts("arrangement"),
+        "type_counts": counts("type"),
+        "location_counts": counts("location"),
+        "monthly_apps": dict(monthly_apps),
+        "weekly_apps": dict(weekly_apps),
+        "quality": {
+            "all": quality(jobs),
+            "interviewed": quality(interviewed_jobs),
+            "others": quality([j for j in jobs if j["id"] not in interviewed_ids]),
+        },
+        "fit_groups": fit_groups,
+    }
+
+
+def comparable(summary: dict) -> dict:
+    """Ranked (key, count) lists as dicts: ties are ordered by name now, by first appearance before."""
+    return {key: dict(value) if key.endswith(("_counts", "_apps")) else value for key, value in summary.items()}
+
+
+def make_job(rng: random.Random) -> dict:
+    return {
+        "company_name": rng.choice(COMPANIES),
+        "role_name": rng.choice(["Engineer", "Analyst", None]),
+        "status": rng.choice(STATUSES),
+        "level": rng.choice(LEVELS),
+        "source": rng.choice(SOURCES),
+        "arrangement": rng.choice(["remote", "hybrid", "onsite", "floating", None]),
+        "type": rng.choice(["fulltime", "contract", "", None]),
+        "location": rng.choice(["Berlin", "Lisbon", "", None]),
+        "date_applied": rng.choice(DATES),
+        "application_response_date": rng.choice(DATES),
+        "interview_time": rng.choice(DATETIMES),
+        "interview_response_date": rng.choice(DATES),
+        "fit": rng.choice([None, 1, 2, 3, 4, 5, 0, 7]),
+        "rating": rng.choice([None, 1, 2, 3, 4, 5]),
+    }
+
+
+@pytest.fixture
+def jobs(db):
+    rng = random.Random(7)
+    for _ in range(400):
+        add_job(make_job(rng))
+
+
+def legacy(where_clause: str = None, params: list = None) -> dict:
+    with get_db() as conn:
+        rows = conn.execute(f"SELECT * FROM jobs WHERE {where_clause or 'true'}", params or []).fetchall()
+    return legacy_stats([dict(row) for row in rows])
+
+
+def test_unfiltered_matches_legacy(jobs):
+    assert comparable(analytics.compute_stats()) == comparable(legacy())
+
+
+def test_aggregation_matches_legacy(jobs):
+    # The unfiltered dashboard reads the rollup; the aggregation itself must agree too
+    assert comparable(analytics.summarize(analytics.aggregate())) == comparable(legacy())
+
+
+@pytest.mark.parametrize(
+    "filter_str",
+    [
+        "status==rejected",
+        "status IN (applied, interviewing, withdrawn)",
+        "company~acme OR level==principal",
+        "date_applied>=2024-02-01",
+        "fit>=4 AND NOT source==linkedin",
+        "interview_time IS NULL",
+    ],
+)
+def test_filtered_matches_legacy(jobs, filter_str):
+    where_clause, params = compile_filter(filter_str)
+    assert comparable(analytics.compute_stats(where_clause, params)) == comparable(legacy(where_clause, params))
+
+
+def test_filter_without_matches(jobs):
+    where_clause, params = compile_filter("company==Nobody")
+    assert analytics.compute_stats(where_clause, params) == {"total_count": 0}
+
+
+def test_empty_database(db):
+    assert analytics.compute_stats() == {"total_count": 0}
+
+
+# The trigger-maintained rollup behind the unfiltered dashboard, against a full aggregation after every kind of write.
+
+
+def test_rollup_follows_inserts_updates_and_deletes(jobs):
+    rng = random.Random(11)
+    with get_db() as conn:
+        ids = [row[0] for row in conn.execute("SELECT id FROM jobs")]
+    for job_id in rng.sample(ids, 150):
+        changes = {k: v for k, v in make_job(rng).items() if rng.random() < 0.4}
+        update_job(job_id, changes)
+    # An update touching none of the rollup's source columns
+    update_job(ids[0], {"notes": "followed up"})
+    for job_id in rng.sample(ids, 60):
+        delete_job_by_id(job_id)
+    for _ in range(40):
+        add_job(make_job(rng))
+
+    assert analytics.check_rollup() == []
+    assert analytics.read_rollup() == analytics.aggregate()
+    assert comparable(analytics.compute_stats()) == comparable(legacy())
+
+
+def test_rollup_after_bulk_insert(jobs):
+    rng = random.Random(13)
+    rows = [dict(make_job(rng), role_url=f"https://example.com/jobs/{i}") for i in range(300)]
+    assert insert_jobs(rows, list(rows[0])) == 300
+    assert analytics.check_rollup() == []
+    assert comparable(analytics.compute_stats()) == comparable(legacy())
+
+
+def test_emptied_groups_are_pruned(db):
+    job_id = add_job({"company_name": "Acme", "status": "applied", "date_applied": "2024-01-05"})
+    update_job(job_id, {"company_name": "Globex"})
+    assert "Acme" not in analytics.read_rollup()["company"]
+    delete_job_by_id(job_id)
+    with get_db() as conn:
+        assert conn.execute(f"SELECT COUNT(*) FROM {analytics.ROLLUP_TABLE}").fetchone()[0] == 0
+
+
+def test_check_rollup_reports_drift(jobs):
+    with transaction() as conn:
+        conn.execute(f"UPDATE {analytics.ROLLUP_TABLE} SET n = n + 1 WHERE dim = 'status' AND key = 'rejected'")
+    mismatches = analytics.check_rollup()
+    assert [m[:3] for m in mismatches] == [("status", "rejected", "n")]
+    assert mismatches[0][3] == mismatches[0][4] + 1
+
+    analytics.rebuild_rollup()
+    assert analytics.check_rollup() == []
+
+
+def test_check_rollup_does_not_wait_for_writers(jobs):
+    # Another process holding the write lock must not block (or fail) the read-only check
+    writer = sqlite3.connect(database.DB_PATH, isolation_level=None, timeout=0)
+    writer.execute("BEGIN IMMEDIATE")
+    try:
+        started = time.perf_counter()
+        assert analytics.check_rollup() == []
+        assert time.perf_counter() - started < 1
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+
+
+def test_aggregation_without_materialized_cte(jobs, monkeypatch):
+    # SQLite before 3.35 has no AS MATERIALIZED
+    expected = analytics.aggregate()
+    monkeypatch.setattr(analytics, "MATERIALIZED_CTE", False)
+    assert "MATERIALIZED" not in analytics.aggregate_query()
+    assert analytics.aggregate() == expected
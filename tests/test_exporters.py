@@ -0,0 +1,138 @@
+import csv
+import gzip
+import io
+import json
+import re
+from datetime import date
+
+import pytest
+from job_tracker.exporters import PLAIN_MAX_WIDTH, open_output, read_parquet, write_csv, write_jsonl, write_parquet, write_plain, write_tsv
+from job_tracker.importers import read_csv, read_jsonl
+
+COLUMNS = [("ID", "id"), ("Company", "company_name"), ("Notes", "notes")]
+# Values every text format has to carry: separators, line breaks, quotes, backslashes, NULLs and non-ASCII text
+NOTES = [
+    "plain",
+    "tab\there",
+    "two\nlines\r\nand a CR\r",
+    'quoted "word", comma',
+    "C:\\temp\\new \\t literal backslashes",
+    None,
+    "Zürich · São Paulo · 東京 · 😀",
+    "",
+]
+ROWS = [{"id": i, "company_name": f"Company {i}" if i % 3 else None, "notes": note} for i, note in enumerate(NOTES, start=1)]
+
+
+def unescape_tsv(field: str):
+    return re.sub(r"\\(.)", lambda m: {"t": "\t", "n": "\n", "r": "\r"}.get(m.group(1), m.group(1)), field)
+
+
+def test_tsv_roundtrip():
+    out = io.StringIO()
+    assert write_tsv(iter(ROWS), COLUMNS, out) == len(ROWS)
+    lines = out.getvalue().split("\n")
+    # One line per row (and the header), whatever the values hold
+    assert lines[-1] == "" and len(lines) == len(ROWS) + 2
+    assert lines[0] == "id\tcompany_name\tnotes"
+    read = [[unescape_tsv(field) for field in line.split("\t")] for line in lines[1:-1]]
+    # NULL is an empty field
+    assert read == [[str(row["id"]), row["company_name"] or "", row["notes"] or ""] for row in ROWS]
+
+
+def test_jsonl_roundtrip():
+    out = io.StringIO()
+    rows = ROWS + [{"id": 99, "company_name": date(2024, 1, 5), "notes": None}]
+    assert write_jsonl(iter(rows), COLUMNS, out) == len(rows)
+    lines = out.getvalue().splitlines()
+    assert [json.loads(line) for line in lines[:-1]] == ROWS
+    # Non-ASCII is written as is, other types as their str()
+    assert "東京" in out.getvalue()
+    assert json.loads(lines[-1]) == {"id": 99, "company_name": "2024-01-05", "notes": None}
+
+
+def test_jsonl_import_roundtrip(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    with open_output(str(path)) as out:
+        write_jsonl(iter(ROWS), COLUMNS, out)
+    _names, rows = read_jsonl(str(path))
+    assert [row for _line, row in rows] == ROWS
+
+
+def test_plain_output():
+    out = io.StringIO()
+    rows = ROWS + [{"id": 100, "company_name": "x" * 300, "notes": None}]
+    assert write_plain(iter(rows), COLUMNS, out) == len(rows)
+    lines = out.getvalue().splitlines()
+    assert len(lines) == len(rows) + 1
+    # Whitespace runs collapse to one space, so every row is one line, and columns line up
+    assert lines[2].split()[:4] == ["2", "Company", "2", "tab"]
+    notes_at = lines[0].index("Notes")
+    assert all(line[notes_at - 2 : notes_at] == "  " and line[notes_at] != " " for line in lines[1:-1] if len(line) > notes_at)
+    assert "Zürich · São Paulo · 東京 · 😀" in lines[7]
+    assert "x" * (PLAIN_MAX_WIDTH - 3) + "..." in lines[-1]
+    assert lines[6].rstrip() == "6"
+
+
+@pytest.mark.parametrize("name", ["jobs.csv", "jobs.csv.gz"])
+def test_csv_roundtrip(tmp_path, name):
+    path = tmp_path / name
+    header = [column for _, column in COLUMNS]
+    with open_output(str(path)) as out:
+        assert write_csv((tuple(row.values()) for row in ROWS), header, out) == len(ROWS)
+    if name.endswith(".gz"):
+        with gzip.open(path, "rb") as f:
+            assert f.read(5) == b"id,co"
+
+    _names, rows = read_csv(str(path))
+    read = [row for _line, row in rows]
+    # CSV has no NULL: it reads back as an empty string
+    assert read == [{key: "" if value is None else str(value) for key, value in row.items()} for row in ROWS]
+
+
+def test_csv_reorders_columns_by_index(tmp_path):
+    out = io.StringIO()
+    write_csv([(1, "Acme", "note"), (2, None, "x")], ["notes", "id"], out, indexes=[2, 0])
+    assert list(csv.reader(io.StringIO(out.getvalue()))) == [["notes", "id"], ["note", "1"], ["x", "2"]]
+    out = io.StringIO()
+    write_csv([(1, "Acme")], ["company_name"], out, indexes=[1])
+    assert out.getvalue().splitlines() == ["company_name", "Acme"]
+
+
+def test_stdout_output(capsys):
+    with open_output("-") as out:
+        write_tsv(iter(ROWS[:1]), COLUMNS, out)
+    assert capsys.readouterr().out == "id\tcompany_name\tnotes\n1\tCompany 1\tplain\n"
+
+
+def test_parquet_typed_roundtrip(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet
+
+    columns = ["id", "company_name", "notes", "status", "rating", "date_applied", "interview_time"]
+    rows = [
+        (1, "Acme", "tab\there\nand a newline", "applied", 4, "2024-01-05", "2024-01-10 14:30"),
+        (2, None, 'quoted "word", 東京 😀', "interview", None, None, None),
+        (3, "Globex", "", "applied", "not a number", "2024-02-30", "soon"),
+    ]
+    path = str(tmp_path / "jobs.parquet")
+    count, invalid = write_parquet(iter(rows), columns, path, batch_rows=2)
+    assert count == 3
+    assert invalid == {"rating": 1, "date_applied": 1, "interview_time": 1}
+
+    schema = pyarrow.parquet.read_schema(path)
+    assert schema.field("date_applied").type == pa.date32()
+    # Parquet has no seconds unit: timestamp[s] is stored as milliseconds
+    assert pa.types.is_timestamp(schema.field("interview_time").type)
+    assert schema.field("rating").type == pa.int64()
+    assert schema.field("status").type == pa.dictionary(pa.int32(), pa.string())
+    assert pyarrow.parquet.ParquetFile(path).num_row_groups == 2
+
+    names, read = read_parquet(path)
+    assert names == columns
+    assert [tuple(row.values()) for row in read] == [
+        (1, "Acme", "tab\there\nand a newline", "applied", 4, "2024-01-05", "2024-01-10 14:30"),
+        (2, None, 'quoted "word", 東京 😀', "interview", None, None, None),
+        # Values that don't fit the column type are written as null; empty text as null too
+        (3, "Globex", None, "applied", None, None, None),
+    ]
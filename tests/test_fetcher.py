@@ -0,0 +1,108 @@
+import socket
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+from job_tracker.fetcher import RETRY_AFTER_MAX, Fetcher, retry_after_seconds
+
+
+def make_fetcher(fake, **kwargs) -> Fetcher:
+    return Fetcher(sleep=fake.sleep, clock=fake.clock, **{"host_interval": 0, **kwargs})
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_retries_throttled_and_unavailable_responses(server, status, fake_time):
+    server.script["/job"] = [(status, {}), (status, {})]
+    fetcher = make_fetcher(fake_time, backoff_base=0.5)
+
+    response = fetcher.get(f"{server.base}/job")
+    assert response.status_code == 200
+    assert [path for path, _ in server.requests] == ["/job"] * 3
+    assert fetcher.retries == 2
+    # Full jitter: attempt n waits up to backoff_base * 2**n
+    assert len(fake_time.sleeps) == 2 and fake_time.sleeps[0] <= 0.5 and fake_time.sleeps[1] <= 1.0
+
+
+def test_retry_after_seconds_holds_the_host(server, fake_time):
+    server.script["/job"] = [(429, {"Retry-After": "7"})]
+    fetcher = make_fetcher(fake_time)
+
+    assert fetcher.get(f"{server.base}/job").status_code == 200
+    assert fake_time.sleeps == [7.0]
+
+
+def test_retry_after_http_date(server, fake_time):
+    when = datetime.now(timezone.utc) + timedelta(seconds=30)
+    server.script["/job"] = [(503, {"Retry-After": format_datetime(when, usegmt=True)})]
+    fetcher = make_fetcher(fake_time)
+
+    assert fetcher.get(f"{server.base}/job").status_code == 200
+    assert len(fake_time.sleeps) == 1 and 27 <= fake_time.sleeps[0] <= 30
+
+
+def test_retry_after_is_capped(server, fake_time):
+    server.script["/job"] = [(429, {"Retry-After": "3600"})]
+    make_fetcher(fake_time).get(f"{server.base}/job")
+    assert fake_time.sleeps == [RETRY_AFTER_MAX]
+
+
+def test_gives_up_after_max_retries(server, fake_time):
+    server.script["/job"] = [(503, {})] * 10
+    fetcher = make_fetcher(fake_time, max_retries=3)
+
+    with pytest.raises(requests.HTTPError) as error:
+        fetcher.get(f"{server.base}/job")
+    assert error.value.response.status_code == 503
+    assert len(server.requests) == 4
+    assert fetcher.retries == 3
+
+
+def test_client_errors_are_not_retried(server, fake_time):
+    server.script["/gone"] = [(404, {})]
+    fetcher = make_fetcher(fake_time)
+
+    with pytest.raises(requests.HTTPError):
+        fetcher.get(f"{server.base}/gone")
+    assert [path for path, _ in server.requests] == ["/gone"]
+    assert fake_time.sleeps == []
+
+
+def test_connection_errors_are_retried_then_raised(fake_time):
+    with socket.socket() as sock:
+        # A port nothing listens on once the socket is closed
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    fetcher = make_fetcher(fake_time, max_retries=2)
+
+    with pytest.raises(requests.ConnectionError):
+        fetcher.get(f"http://127.0.0.1:{port}/job")
+    assert fetcher.retries == 2
+    assert fetcher.latency_summary()[f"127.0.0.1:{port}"]["count"] == 3
+
+
+def test_requests_to_one_host_are_spaced(server, fake_time):
+    fetcher = make_fetcher(fake_time, host_interval=0.5)
+
+    for i in range(4):
+        fetcher.get(f"{server.base}/job/{i}")
+    assert fake_time.sleeps == [0.5, 0.5, 0.5]
+    assert fetcher.latency_summary()[server.base.split("//")[1]]["count"] == 4
+
+
+def test_spacing_holds_across_threads(server, fake_time):
+    # Sleeping leaves the clock standing still, so each reservation has to queue behind the previous one
+    fetcher = Fetcher(sleep=fake_time.sleeps.append, clock=fake_time.clock, host_interval=0.5)
+
+    threads = [threading.Thread(target=fetcher.get, args=(f"{server.base}/job/{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(fake_time.sleeps) == [0.5, 1.0, 1.5]
+
+
+@pytest.mark.parametrize("value, expected", [(None, None), ("", None), ("12", 12.0), ("soon", None)])
+def test_retry_after_values(value, expected):
+    assert retry_after_seconds(value) == expected
@@ -0,0 +1,21 @@
+import pytest
+from job_tracker.database import add_job, add_new_column, get_jobs
+from job_tracker.filters import FilterError, compile_filter
+
+
+def test_unknown_column_is_rejected_when_parsing(db):
+    with pytest.raises(FilterError, match="Unknown column 'bogus' at position 21"):
+        compile_filter("status==applied AND bogus==1")
+
+
+def test_aliases_and_added_columns_are_accepted(db):
+    add_job({"company_name": "Acme", "status": "applied"})
+    add_new_column("referral_code", "TEXT")
+    where_clause, params = compile_filter("company~acme AND referral_code IS NULL")
+    assert [job["company_name"] for job in get_jobs(where_clause=where_clause, params=params)] == ["Acme"]
+
+
+def test_date_ranges_split_on_the_separating_dash(db):
+    where_clause, params = compile_filter("date:[2024-01-01-2024-02-01]")
+    assert where_clause == "(date_applied >= ? AND date_applied <= ?)"
+    assert params == ["2024-01-01", "2024-02-01"]
@@ -0,0 +1,20 @@
+from job_tracker import fuzzy
+from job_tracker.database import add_job, insert_jobs
+
+
+def test_field_restriction_applies_before_the_candidate_limit(db):
+    # More (and better ranked) role names sharing the query's trigrams than there are candidate slots
+    roles = [{"role_name": f"Globex Corp {i}", "role_url": f"https://example.com/{i}"} for i in range(fuzzy.MAX_CANDIDATES * 2)]
+    insert_jobs(roles, ["role_name", "role_url"])
+    add_job({"company_name": "Globex Corporation International Holdings", "role_name": "Analyst"})
+
+    matches = fuzzy.near_names("globex corp", ("company_name",))
+    assert [(column, name) for column, name, _score in matches] == [("company_name", "Globex Corporation International Holdings")]
+
+
+def test_near_names_ranks_closest_first(db):
+    for company in ("Google", "Goggle Labs", "Microsoft"):
+        add_job({"company_name": company})
+    names = [name for _column, name, _score in fuzzy.near_names("gogle")]
+    assert names[0] in ("Google", "Goggle Labs")
+    assert "Microsoft" not in names
@@ -0,0 +1,43 @@
+from datetime import date, timedelta
+
+import pytest
+from job_tracker.database import GHOSTING_LAST_RUN_KEY, add_job, get_db, get_job_by_id, get_meta, update_ghosted_jobs, update_job
+
+
+def days_ago(days: int) -> str:
+    return (date.today() - timedelta(days=days)).isoformat()
+
+
+def test_old_applications_without_responses_are_ghosted(db):
+    stale = add_job({"role_url": "a", "status": "applied", "date_applied": days_ago(60)})
+    answered = add_job({"role_url": "b", "status": "applied", "date_applied": days_ago(60), "application_response_date": days_ago(50)})
+    recent = add_job({"role_url": "c", "status": "applied", "date_applied": days_ago(5)})
+    update_ghosted_jobs()
+    assert [get_job_by_id(i)["status"] for i in (stale, answered, recent)] == ["ghosted", "applied", "applied"]
+    assert get_meta(GHOSTING_LAST_RUN_KEY) == date.today().isoformat()
+
+
+@pytest.mark.parametrize("column", ["application_response_date", "interview_response_date"])
+def test_clearing_a_response_date_brings_the_row_back(db, column):
+    job_id = add_job({"role_url": "a", "status": "applied", "date_applied": days_ago(60), column: days_ago(50)})
+    update_ghosted_jobs()
+    assert get_job_by_id(job_id)["status"] == "applied"
+
+    # The row is past the incremental window, so the next run must do a full pass
+    update_job(job_id, {column: None})
+    assert get_meta(GHOSTING_LAST_RUN_KEY) is None
+    update_ghosted_jobs()
+    assert get_job_by_id(job_id)["status"] == "ghosted"
+
+
+def test_unrelated_edits_keep_the_watermark(db):
+    job_id = add_job({"role_url": "a", "status": "applied", "date_applied": days_ago(60), "application_response_date": days_ago(50)})
+    update_ghosted_jobs()
+    update_job(job_id, {"notes": "called back"})
+    assert get_meta(GHOSTING_LAST_RUN_KEY) == date.today().isoformat()
+
+
+def test_reset_trigger_watches_the_response_dates(db):
+    with get_db() as conn:
+        sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'jobs_ghosting_reset_update'").fetchone()[0]
+    assert "application_response_date" in sql and "interview_response_date" in sql
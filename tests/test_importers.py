@@ -0,0 +1,84 @@
+import pytest
+from typer.testing import CliRunner
+from job_tracker.database import add_job, get_db, get_jobs, insert_jobs
+from job_tracker.main import app
+
+
+def test_csv_rows_with_extra_fields_are_reported_not_fatal(db, tmp_path):
+    path = tmp_path / "jobs.csv"
+    path.write_text(
+        "company,role,status,date\n"
+        "Acme,Engineer,applied,2024-01-05\n"
+        "Globex,Analyst,applied,2024-01-06,surplus,fields\n"
+        "Initech,Developer,rejected,2024-01-07\n",
+        encoding="utf-8",
+    )
+    result = CliRunner().invoke(app, ["import", str(path)])
+
+    assert result.exit_code == 0, result.output
+    assert "Line 3: 2 more fields than the header's 4" in result.output
+    assert sorted(job["company_name"] for job in get_jobs()) == ["Acme", "Initech"]
+
+
+def test_invalid_values_are_reported_per_row(db, tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    path.write_text(
+        '{"company": "Acme", "status": "applied", "fit": 4}\n'
+        '{"company": "Globex", "status": "hired"}\n'
+        '{"company": "Initech", "date": "2024-02-30"}\n'
+        "not json\n",
+        encoding="utf-8",
+    )
+    result = CliRunner().invoke(app, ["import", str(path)])
+
+    assert result.exit_code == 0, result.output
+    assert "Line 2: status must be one of" in result.output
+    assert "Line 3: date_applied must be a YYYY-MM-DD date" in result.output
+    assert "Line 4: invalid JSON" in result.output
+    assert [(job["company_name"], job["fit"]) for job in get_jobs()] == [("Acme", 4)]
+
+
+def test_columns_missing_from_the_file_get_their_defaults(db, tmp_path):
+    path = tmp_path / "jobs.csv"
+    path.write_text("company,url,fit\nAcme,https://example.com/1,4\n", encoding="utf-8")
+    result = CliRunner().invoke(app, ["import", str(path)])
+
+    assert result.exit_code == 0, result.output
+    assert [(job["company_name"], job["status"]) for job in get_jobs()] == [("Acme", "applied")]
+
+
+def test_insert_jobs_leaves_missing_keys_to_the_defaults(db):
+    with get_db() as conn:
+        conn.execute("ALTER TABLE jobs ADD COLUMN priority TEXT DEFAULT 'normal'")
+    jobs = [
+        {"company_name": "Acme", "role_url": "https://example.com/1"},
+        {"company_name": "Globex", "role_url": "https://example.com/2", "priority": "high"},
+        {"company_name": "Initech", "role_url": "https://example.com/3", "priority": None},
+        {"company_name": "Hooli", "role_url": "https://example.com/4"},
+    ]
+    assert insert_jobs(jobs) == 4
+    with get_db() as conn:
+        rows = conn.execute("SELECT company_name, priority, status FROM jobs ORDER BY id").fetchall()
+    assert [tuple(row) for row in rows] == [
+        ("Acme", "normal", "applied"),
+        ("Globex", "high", "applied"),
+        ("Initech", None, "applied"),
+        ("Hooli", "normal", "applied"),
+    ]
+
+
+@pytest.mark.parametrize("export_format", ["csv", "parquet"])
+def test_exports_import_back_without_warnings(db, tmp_path, export_format):
+    if export_format == "parquet":
+        pytest.importorskip("pyarrow")
+    add_job({"company_name": "Acme", "role_name": "Engineer", "role_url": "https://example.com/1", "status": "applied", "fit": 4})
+    path = tmp_path / f"jobs.{export_format}"
+    result = CliRunner().invoke(app, ["view", "--export", "--output", str(path), "--all"] + (["--format", "parquet"] if export_format == "parquet" else []))
+    assert result.exit_code == 0, result.output
+    with get_db() as conn:
+        conn.execute("DELETE FROM jobs")
+
+    result = CliRunner().invoke(app, ["import", str(path)])
+    assert result.exit_code == 0, result.output
+    assert "Ignored" not in result.output
+    assert [(job["company_name"], job["fit"]) for job in get_jobs()] == [("Acme", 4)]
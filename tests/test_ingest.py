@@ -0,0 +1,132 @@
+import sqlite3
+from contextlib import contextmanager
+
+import pytest
+from job_tracker import ingest
+from job_tracker.database import add_job, get_jobs
+
+
+def fake_scrape(fetched):
+    def scrape(url, refresh):
+        fetched.append(url)
+        page = {"fetch_seconds": 0.0, "parse_seconds": 0.0, "source": "page", "bytes": 0}
+        return {"company_name": "Acme", "role_name": "Engineer"}, page
+
+    return scrape
+
+
+def fake_enrich(html_data, user_profile):
+    return {"rating": 4, "fit": 3}, 0.0, {}
+
+
+def test_links_to_one_posting_are_fetched_and_saved_once(db, monkeypatch):
+    fetched = []
+    monkeypatch.setattr(ingest, "_scrape", fake_scrape(fetched))
+    monkeypatch.setattr(ingest, "_enrich", fake_enrich)
+    urls = [
+        "https://www.linkedin.com/jobs/view/data-engineer-at-acme-4012345678?trk=public_jobs",
+        "https://www.linkedin.com/jobs/view/4012345678/",
+        "https://www.linkedin.com/jobs/search/?currentJobId=4012345678",
+        "https://example.com/careers/42",
+    ]
+    results = ingest.ingest_urls(urls)
+
+    assert [r.outcome for r in results] == [ingest.ADDED, ingest.SKIPPED, ingest.SKIPPED, ingest.ADDED]
+    assert results[1].detail == f"same posting as {urls[0]}"
+    assert fetched == [urls[0], urls[3]]
+    assert sorted(job["role_url"] for job in get_jobs()) == ["https://example.com/careers/42", "https://www.linkedin.com/jobs/view/4012345678/"]
+
+
+def test_postings_tracked_under_another_link_are_skipped(db, monkeypatch):
+    fetched = []
+    monkeypatch.setattr(ingest, "_scrape", fake_scrape(fetched))
+    monkeypatch.setattr(ingest, "_enrich", fake_enrich)
+    add_job({"company_name": "Acme", "role_url": "https://www.linkedin.com/jobs/view/4012345678/"})
+
+    results = ingest.ingest_urls(["https://www.linkedin.com/jobs/view/data-engineer-at-acme-4012345678?trk=x"])
+    assert [(r.outcome, r.detail) for r in results] == [(ingest.SKIPPED, "already tracked")]
+    assert fetched == []
+
+
+def test_tracked_job_checks_the_canonical_form(db):
+    job_id = add_job({"role_url": "https://www.linkedin.com/jobs/view/4012345678/"})
+    with ingest.get_db() as conn:
+        assert ingest.tracked_job(conn, "https://www.linkedin.com/jobs/view/slug-4012345678?refId=1") == job_id
+        assert ingest.tracked_job(conn, "https://www.linkedin.com/jobs/view/4099999999/") is None
+
+
+def test_a_failing_insert_fails_only_its_job(db, monkeypatch):
+    monkeypatch.setattr(ingest, "_scrape", fake_scrape([]))
+    monkeypatch.setattr(ingest, "_enrich", fake_enrich)
+    urls = [f"https://example.com/careers/{i}" for i in range(5)]
+
+    def add_job_failing(job):
+        job_id = add_job(job)
+        if job["role_url"] == urls[2]:
+            # After its own write, which must be undone too
+            raise sqlite3.IntegrityError("CHECK constraint failed")
+        return job_id
+
+    monkeypatch.setattr(ingest, "add_job", add_job_failing)
+    results = ingest.ingest_urls(urls, commit_every=5)
+
+    assert [r.outcome for r in results] == [ingest.ADDED, ingest.ADDED, ingest.FAILED, ingest.ADDED, ingest.ADDED]
+    assert results[2].detail == "save: CHECK constraint failed"
+    assert sorted(job["role_url"] for job in get_jobs()) == [urls[0], urls[1], urls[3], urls[4]]
+
+
+def test_a_busy_database_fails_the_batch_without_raising(db, monkeypatch):
+    monkeypatch.setattr(ingest, "_scrape", fake_scrape([]))
+    monkeypatch.setattr(ingest, "_enrich", fake_enrich)
+
+    @contextmanager
+    def busy():
+        raise sqlite3.OperationalError("database is locked")
+        yield
+
+    monkeypatch.setattr(ingest, "transaction", busy)
+    results = ingest.ingest_urls(["https://example.com/careers/1", "https://example.com/careers/2"])
+    assert [(r.outcome, r.detail) for r in results] == [(ingest.FAILED, "save: database is locked")] * 2
+    assert get_jobs() == []
+
+
+def test_long_url_lists_are_looked_up_in_chunks(db, monkeypatch):
+    fetched = []
+    monkeypatch.setattr(ingest, "_scrape", fake_scrape(fetched))
+    monkeypatch.setattr(ingest, "_enrich", fake_enrich)
+    monkeypatch.setattr(ingest, "LOOKUP_CHUNK", 7)
+    urls = [f"https://example.com/careers/{i}" for i in range(40)]
+    for url in urls[::3]:
+        add_job({"role_url": url})
+
+    results = ingest.ingest_urls(urls)
+    assert [r.url for r in results if r.outcome == ingest.SKIPPED] == urls[::3]
+    assert sorted(fetched) == sorted(set(urls) - set(urls[::3]))
+
+
+@pytest.mark.skipif(not hasattr(sqlite3.Connection, "setlimit"), reason="Connection.setlimit() needs Python 3.11")
+def test_more_urls_than_sql_variables(db, monkeypatch):
+    fetched = []
+    monkeypatch.setattr(ingest, "_scrape", fake_scrape(fetched))
+    urls = [f"https://example.com/careers/{i}" for i in range(2000)]
+    with ingest.transaction() as conn:
+        conn.executemany("INSERT INTO jobs (role_url) VALUES (?)", [(url,) for url in urls])
+        # The limit of SQLite builds before 3.32
+        limit = conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+    try:
+        results = ingest.ingest_urls(urls)
+    finally:
+        with ingest.get_db() as conn:
+            conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, limit)
+    assert {r.outcome for r in results} == {ingest.SKIPPED}
+    assert fetched == []
+
+
+def test_add_options_default_to_the_ingest_pool_sizes():
+    import inspect
+
+    from job_tracker.commands.add import add
+
+    options = inspect.signature(add).parameters
+    assert options["workers"].default.default == ingest.FETCH_WORKERS
+    assert options["llm_workers"].default.default == ingest.LLM_WORKERS
@@ -0,0 +1,95 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+from job_tracker import page_cache
+from job_tracker.fetcher import Fetcher
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch, fake_time):
+    """The page cache, enabled, in a scratch directory, with its wall clock under the test's control."""
+    monkeypatch.setattr(page_cache, "ENABLED", True)
+    monkeypatch.setattr(page_cache, "PAGES_DIR", tmp_path / "pages")
+    monkeypatch.setattr(page_cache, "PAGE_TTL", 60.0)
+    monkeypatch.setattr(page_cache, "time", SimpleNamespace(time=fake_time.clock))
+    return page_cache
+
+
+@pytest.fixture
+def fetcher(fake_time):
+    return Fetcher(sleep=fake_time.sleep, clock=fake_time.clock, host_interval=0)
+
+
+def get(cache, fetcher, url):
+    stats = {}
+    return cache.get_page(url, fetcher, stats=stats), stats
+
+
+def test_fresh_entries_are_served_without_a_request(cache, fetcher, server, fake_time):
+    url = f"{server.base}/job"
+    assert get(cache, fetcher, url) == ("<html>/job</html>", {"cache": "miss", "bytes": 17})
+    fake_time.now += 59
+    assert get(cache, fetcher, url) == ("<html>/job</html>", {"cache": "hit", "bytes": 0})
+    assert len(server.requests) == 1
+
+
+@pytest.mark.parametrize(
+    "validator, conditional",
+    [({"ETag": '"v1"'}, ("If-None-Match", '"v1"')), ({"Last-Modified": "Wed, 01 May 2024 10:00:00 GMT"}, ("If-Modified-Since", "Wed, 01 May 2024 10:00:00 GMT"))],
+    ids=["etag", "last-modified"],
+)
+def test_expired_entries_are_revalidated(cache, fetcher, server, fake_time, validator, conditional):
+    url = f"{server.base}/job"
+    server.script["/job"] = [(200, validator, "<html>first</html>"), (304, {}), (200, {}, "<html>second</html>")]
+    get(cache, fetcher, url)
+
+    fake_time.now += 61
+    # A 304 keeps the stored body and restarts its TTL
+    assert get(cache, fetcher, url) == ("<html>first</html>", {"cache": "revalidated", "bytes": 0})
+    name, value = conditional
+    assert server.requests[1][1][name] == value
+    fake_time.now += 59
+    assert get(cache, fetcher, url)[1]["cache"] == "hit"
+
+    # A changed page replaces the entry
+    fake_time.now += 2
+    assert get(cache, fetcher, url) == ("<html>second</html>", {"cache": "miss", "bytes": 19})
+    assert len(server.requests) == 3
+
+
+def test_entries_without_validators_are_fetched_again(cache, fetcher, server, fake_time):
+    url = f"{server.base}/job"
+    get(cache, fetcher, url)
+    fake_time.now += 61
+    assert get(cache, fetcher, url)[1]["cache"] == "miss"
+    assert not {"If-None-Match", "If-Modified-Since"} & server.requests[1][1].keys()
+
+
+def test_refresh_skips_the_cache(cache, fetcher, server):
+    url = f"{server.base}/job"
+    server.script["/job"] = [(200, {"ETag": '"v1"'})]
+    get(cache, fetcher, url)
+    stats = {}
+    cache.get_page(url, fetcher, refresh=True, stats=stats)
+    assert stats["cache"] == "miss"
+    assert "If-None-Match" not in server.requests[1][1]
+
+
+def test_least_recently_used_entries_are_evicted_first(cache, fetcher, server, monkeypatch):
+    urls = {name: f"{server.base}/job/{name}" for name in "abcd"}
+    for name in "abc":
+        get(cache, fetcher, urls[name])
+    paths = {name: cache._entry_path(url) for name, url in urls.items()}
+    # Written in order a, b, c, then a is read again: b is the least recently used
+    for age, name in enumerate("abc"):
+        os.utime(paths[name], (1000 + age, 1000 + age))
+    assert get(cache, fetcher, urls["a"])[1]["cache"] == "hit"
+
+    size = paths["a"].stat().st_size
+    monkeypatch.setattr(page_cache, "MAX_BYTES", 3 * size + size // 2)
+    get(cache, fetcher, urls["d"])
+    assert {name for name, path in paths.items() if path.exists()} == {"a", "c", "d"}
+
+    get(cache, fetcher, urls["b"])
+    assert {name for name, path in paths.items() if path.exists()} == {"a", "d", "b"}
@@ -0,0 +1,114 @@
+import random
+
+import pytest
+from job_tracker.database import get_jobs, insert_jobs
+from job_tracker.pager import KeysetPager, _order_by
+
+PAGE_SIZE = 7
+KEY_SETS = [
+    [("date_applied", True)],
+    [("date_applied", False)],
+    [("rating", False), ("date_applied", True)],
+    [("rating", True), ("company_name", False)],
+    [("rating", True), ("id", False)],
+]
+
+
+@pytest.fixture
+def jobs(db):
+    # Few distinct values, a third of them NULL: lots of ties, and NULLs at both ends depending on direction
+    rng = random.Random(7)
+    rows = [
+        {
+            "company_name": rng.choice(["Acme", "Globex", "Initech", None]),
+            "role_url": f"https://example.com/{i}",
+            "status": "applied" if i % 4 else "rejected",
+            "date_applied": rng.choice(["2024-01-01", "2024-01-02", "2024-01-03", None, None]),
+            "rating": rng.choice([1, 3, 5, None]),
+        }
+        for i in range(47)
+    ]
+    insert_jobs(rows)
+
+
+def expected_pages(pager: KeysetPager) -> list:
+    """Every page's ids, from one OFFSET-free query over the same filter and order."""
+    ids = [row["id"] for row in get_jobs(where_clause=pager.where_clause or None, params=pager.params, sort_clause=_order_by(pager.keys), columns=["id"])]
+    return [ids[i : i + PAGE_SIZE] for i in range(0, len(ids), PAGE_SIZE)]
+
+
+def ids(rows) -> list:
+    return [row["id"] for row in rows]
+
+
+@pytest.fixture(params=[(None, []), ("status = ?", ["applied"])], ids=["all", "filtered"])
+def make_pager(jobs, request):
+    where_clause, params = request.param
+    return lambda keys: KeysetPager(where_clause, params, keys, ["company_name"], PAGE_SIZE)
+
+
+@pytest.mark.parametrize("keys", KEY_SETS)
+def test_paging_forward(make_pager, keys):
+    pager = make_pager(keys)
+    expected = expected_pages(pager)
+    pages = [ids(pager.first())]
+    while True:
+        rows = pager.next()
+        if not rows:
+            break
+        pages.append(ids(rows))
+    assert pages == expected
+    # At the end, next() stays on the last page
+    assert pager.page == len(expected) and ids(pager.rows) == expected[-1]
+
+
+@pytest.mark.parametrize("keys", KEY_SETS)
+def test_paging_back_from_the_last_page(make_pager, keys):
+    pager = make_pager(keys)
+    expected = expected_pages(pager)
+    pages = [ids(pager.last())]
+    while True:
+        rows = pager.previous()
+        if not rows:
+            break
+        pages.append(ids(rows))
+    assert pages[::-1] == expected
+    assert pager.page == 1
+
+
+@pytest.mark.parametrize("keys", KEY_SETS)
+def test_back_and_forth(make_pager, keys):
+    pager = make_pager(keys)
+    expected = expected_pages(pager)
+    pager.first()
+    pager.next()
+    pager.next()
+    assert ids(pager.previous()) == expected[1]
+    assert ids(pager.previous()) == expected[0]
+    assert pager.previous() == []
+    assert ids(pager.next()) == expected[1]
+
+
+@pytest.mark.parametrize("keys", KEY_SETS)
+def test_jumps(make_pager, keys):
+    expected = expected_pages(make_pager(keys))
+    for page in range(1, len(expected) + 3):
+        # Beyond the end shows the last page
+        assert ids(make_pager(keys).jump(page)) == expected[min(page, len(expected)) - 1], page
+
+    pager = make_pager(keys)
+    pager.jump(3)
+    assert ids(pager.jump(2)) == expected[1]
+    assert ids(pager.jump(5)) == expected[4]
+    assert ids(pager.previous()) == expected[3]
+
+
+@pytest.mark.parametrize("keys", KEY_SETS)
+def test_jump_after_the_last_page(make_pager, keys):
+    pager = make_pager(keys)
+    expected = expected_pages(pager)
+    pager.last()
+    pager.previous()
+    assert ids(pager.jump(len(expected) - 2)) == expected[-3]
+    assert ids(pager.next()) == expected[-2]
+    assert pager.total() == sum(len(page) for page in expected)
@@ -0,0 +1,111 @@
+import json
+
+import pytest
+import requests
+from job_tracker import scraper
+from job_tracker.scraper import extract_html_data, extract_job_posting
+
+
+def page(*blocks: str) -> str:
+    scripts = "".join(f'<script type="application/ld+json">{block}</script>' for block in blocks)
+    return f"<html><head><title>Engineer at Acme | LinkedIn</title>{scripts}</head><body></body></html>"
+
+
+def posting(**fields) -> str:
+    return json.dumps({"@context": "https://schema.org", "@type": "JobPosting", "title": "Engineer", **fields})
+
+
+def test_reads_a_job_posting():
+    html = page(posting(
+        hiringOrganization={"@type": "Organization", "name": "Acme", "sameAs": "https://www.linkedin.com/company/acme?trk=x"},
+        employmentType="FULL_TIME",
+        datePosted="2024-03-01T10:00:00Z",
+        baseSalary={"currency": "EUR", "value": {"minValue": 50000, "maxValue": 70000, "unitText": "YEAR"}},
+    ))
+    data = extract_job_posting(html)
+    assert data["role_name"] == "Engineer"
+    assert data["company_name"] == "Acme"
+    assert data["company_linkedin"] == "https://www.linkedin.com/company/acme"
+    assert data["date_posted"] == "2024-03-01"
+    assert data["expected_salary"].startswith("EUR 50,000-70,000")
+
+
+def test_reads_graph_members():
+    html = page(json.dumps({"@context": "https://schema.org", "@graph": [{"@type": "WebPage"}, json.loads(posting())]}))
+    assert extract_job_posting(html)["role_name"] == "Engineer"
+
+
+@pytest.mark.parametrize("block", [
+    '{"@graph": null}',
+    '{"@graph": "nope"}',
+    '{"@graph": {"@type": "JobPosting"}}',
+    "[null, 1, \"x\"]",
+    "{not json",
+    posting(baseSalary={"currency": "USD", "value": float("nan")}),
+    posting(baseSalary={"currency": "USD", "value": {"value": "NaN", "unitText": "YEAR"}}),
+    posting(baseSalary={"currency": "USD", "value": {"minValue": 1, "maxValue": float("inf")}}),
+    '{"@type": "JobPosting", "title": "Engineer", "baseSalary": {"value": 1e400}}',
+    posting(hiringOrganization=["x"], jobLocation={"address": 5}, employmentType={"a": 1}, datePosted=7),
+])
+def test_malformed_json_ld_does_not_crash(block):
+    html = page(block)
+    data = extract_job_posting(html)
+    assert "expected_salary" not in data or data["expected_salary"] == "USD 1"
+    extract_html_data(html)
+
+
+def test_non_finite_salary_is_left_out():
+    assert "expected_salary" not in extract_job_posting(page(posting(baseSalary={"currency": "USD", "value": float("nan")})))
+    assert "expected_salary" not in extract_job_posting(page('{"@type": "JobPosting", "baseSalary": {"value": 1e400}}'))
+
+
+@pytest.fixture
+def pages(monkeypatch):
+    """Stands in for the page cache: maps URL to HTML (or an exception to raise), and records the URLs requested."""
+    from job_tracker import page_cache
+
+    served, requested = {}, []
+
+    def get_page(url, fetcher, refresh=False, stats=None):
+        requested.append(url)
+        if isinstance(served[url], Exception):
+            raise served[url]
+        return served[url]
+
+    monkeypatch.setattr(page_cache, "get_page", get_page)
+    return served, requested
+
+
+JOB_URL = "https://www.linkedin.com/jobs/view/engineer-at-acme-123"
+
+
+def test_linkedin_links_read_the_guest_fragment(pages):
+    served, requested = pages
+    served[scraper.LINKEDIN_GUEST_URL.format("123")] = '<h2 class="top-card-layout__title">Engineer</h2>'
+    stats = {}
+    scraper.fetch_job_page(JOB_URL, stats=stats)
+    assert requested == [scraper.LINKEDIN_GUEST_URL.format("123")]
+    assert stats["source"] == scraper.GUEST
+
+
+def test_guest_fragment_can_be_turned_off(pages, monkeypatch):
+    served, requested = pages
+    served[JOB_URL] = page(posting(employmentType="FULL_TIME"))
+    monkeypatch.setattr(scraper, "LINKEDIN_GUEST", False)
+    stats = {}
+    html = scraper.fetch_job_page(JOB_URL, stats=stats)
+    assert requested == [JOB_URL]
+    assert stats["source"] == scraper.FULL_PAGE
+    assert extract_html_data(html)["type"] == "fulltime"
+
+
+@pytest.mark.parametrize("error", [requests.Timeout("read timed out"), requests.ConnectionError("refused"), requests.HTTPError("404")])
+def test_guest_errors_fall_back_to_the_full_page(pages, error):
+    served, requested = pages
+    served[scraper.LINKEDIN_GUEST_URL.format("123")] = error
+    served[JOB_URL] = page(posting(employmentType="FULL_TIME"))
+    stats = {}
+    html = scraper.fetch_job_page(JOB_URL, stats=stats)
+    assert requested == [scraper.LINKEDIN_GUEST_URL.format("123"), JOB_URL]
+    assert stats["source"] == scraper.FULL_PAGE
+    assert extract_html_data(html)["role_name"] == "Engineer"